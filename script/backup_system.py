@@ -11,7 +11,7 @@ import zipfile
 import hashlib
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Set
+from typing import Dict, List, Any, Optional, Set, Iterator
 import logging
 import threading
 from concurrent.futures import ThreadPoolExecutor
@@ -19,6 +19,34 @@ from concurrent.futures import ThreadPoolExecutor
 logger = logging.getLogger(__name__)
 
 
+def _iter_files(root: str) -> Iterator[str]:
+    """Yield the paths of all files below root using os.scandir.
+    
+    Files are yielded in the same order as Path.rglob('*') (each directory's
+    entries, then its subdirectories depth-first); symlinked directories are
+    not followed.
+    """
+    try:
+        with os.scandir(root) as scandir_it:
+            entries = list(scandir_it)
+    except OSError as e:
+        logger.warning(f"Could not read directory {root}: {e}")
+        return
+    
+    subdirs = []
+    for entry in entries:
+        try:
+            if entry.is_file():
+                yield entry.path
+            elif entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+        except OSError:
+            continue
+    
+    for subdir in subdirs:
+        yield from _iter_files(subdir)
+
+
 class BackupSystem:
     """Manages automatic backup of project data and configurations."""
     
@@ -163,10 +191,9 @@ class BackupSystem:
                 with zipfile.ZipFile(backup_file, 'w', zipfile.ZIP_DEFLATED) as zipf:
                     # Add data files
                     if self.config['include_project_data'] and self.data_dir.exists():
-                        for file_path in self.data_dir.rglob('*'):
-                            if file_path.is_file():
-                                arcname = f"data/{file_path.relative_to(self.data_dir)}"
-                                zipf.write(file_path, arcname)
+                        for file_path in _iter_files(str(self.data_dir)):
+                            arcname = f"data/{os.path.relpath(file_path, self.data_dir)}"
+                            zipf.write(file_path, arcname)
                     
                     # Add config files
                     if self.config['include_config_files']:
@@ -183,10 +210,9 @@ class BackupSystem:
                     if self.config['include_logs']:
                         logs_dir = Path("logs")
                         if logs_dir.exists():
-                            for file_path in logs_dir.rglob('*'):
-                                if file_path.is_file():
-                                    arcname = f"logs/{file_path.relative_to(logs_dir)}"
-                                    zipf.write(file_path, arcname)
+                            for file_path in _iter_files(str(logs_dir)):
+                                arcname = f"logs/{os.path.relpath(file_path, logs_dir)}"
+                                zipf.write(file_path, arcname)
             else:
                 # Create uncompressed backup (directory structure)
                 if self.config['include_project_data'] and self.data_dir.exists():
@@ -251,11 +277,10 @@ class BackupSystem:
         elif file_path.is_dir():
             # For directories, calculate hash of all files
             sha256_hash = hashlib.sha256()
-            for file_path in file_path.rglob('*'):
-                if file_path.is_file():
-                    with open(file_path, "rb") as f:
-                        for chunk in iter(lambda: f.read(4096), b""):
-                            sha256_hash.update(chunk)
+            for file_path in _iter_files(str(file_path)):
+                with open(file_path, "rb") as f:
+                    for chunk in iter(lambda: f.read(4096), b""):
+                        sha256_hash.update(chunk)
             return sha256_hash.hexdigest()
         return ""
     
@@ -330,6 +355,10 @@ class BackupSystem:
             logger.error(f"Error restoring backup: {e}")
             return False
     
+    def reload_metadata(self) -> None:
+        """Reload backup metadata from disk (e.g. after the backup directory changed)."""
+        self.metadata = self._load_metadata()
+    
     def list_backups(self) -> List[Dict[str, Any]]:
         """List all available backups."""
         return self.metadata.get('backups', []).copy()
@@ -9,7 +9,8 @@ import json
 import re
 import hashlib
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Set, Tuple
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Set, Tuple, Callable
 from datetime import datetime, timedelta
 import logging
 import subprocess
@@ -22,6 +23,11 @@ logger = logging.getLogger(__name__)
 class DependencyManager:
     """Manages project dependencies with tracking, analysis, and update capabilities."""
     
+    # In-memory analysis results shared by all instances, keyed by
+    # (project_path, manifest fingerprint)
+    _analysis_cache: Dict[Tuple[str, Tuple], Dict[str, Any]] = {}
+    _analysis_cache_lock = threading.Lock()
+    
     def __init__(self, data_dir: str = "data"):
         self.data_dir = Path(data_dir)
         self.dependency_cache_file = self.data_dir / "dependency_cache.json"
@@ -84,6 +90,9 @@ class DependencyManager:
             }
         }
         
+        # Built on first use; the package manager table is static per session
+        self._supported_package_managers: Optional[Mapping[str, str]] = None
+        
         # Ensure data directory exists
         self.data_dir.mkdir(exist_ok=True)
         
@@ -128,11 +137,14 @@ class DependencyManager:
         except Exception as e:
             logger.error(f"Error saving dependency stats: {e}")
     
-    def analyze_project_dependencies(self, project_path: str) -> Dict[str, Any]:
+    def analyze_project_dependencies(self, project_path: str, fingerprint: Optional[Tuple] = None,
+                                     on_package_manager: Optional[Callable[[str, List[Dict[str, Any]]], None]] = None) -> Dict[str, Any]:
         """Analyze dependencies for a project.
         
         Args:
             project_path: Path to the project directory
+            fingerprint: Manifest fingerprint from get_manifest_fingerprint (computed if None)
+            on_package_manager: Called with (pm_name, dependencies) as each package manager is analyzed
             
         Returns:
             Dictionary containing dependency analysis results
@@ -142,14 +154,19 @@ class DependencyManager:
             return {'error': 'Invalid project path'}
         
         cache_key = self._get_cache_key(project_path)
+        if fingerprint is None:
+            fingerprint = self.get_manifest_fingerprint(project_path)
+        # JSON stores the fingerprint tuples as lists
+        manifest_fingerprint = [list(entry) for entry in fingerprint]
         
         # Check cache first
         with self._cache_lock:
             if cache_key in self.dependency_cache:
                 cached_data = self.dependency_cache[cache_key]
-                # Check if cache is still valid (less than 24 hours old)
+                # Check if cache is still valid (same manifests and less than 24 hours old)
                 cache_time = datetime.fromisoformat(cached_data.get('cached_at', '2000-01-01'))
-                if datetime.now() - cache_time < timedelta(hours=24):
+                if (cached_data.get('manifest_fingerprint') == manifest_fingerprint
+                        and datetime.now() - cache_time < timedelta(hours=24)):
                     return cached_data
         
         # Analyze dependencies
@@ -162,14 +179,37 @@ class DependencyManager:
             'vulnerabilities': [],
             'dependency_tree': {},
             'analysis_time': datetime.now().isoformat(),
-            'cached_at': datetime.now().isoformat()
+            'cached_at': datetime.now().isoformat(),
+            'manifest_fingerprint': manifest_fingerprint
         }
         
-        # Detect package managers and analyze dependencies
+        # Detect package managers
         for pm_name, pm_info in self.package_managers.items():
             if self._has_package_manager_files(path, pm_info['files']):
                 analysis['package_managers'].append(pm_name)
-                deps = self._analyze_package_manager_dependencies(path, pm_name)
+        
+        # Analyze each package manager's dependencies in parallel
+        detected = analysis['package_managers']
+        if detected:
+            results: Dict[str, List[Dict[str, Any]]] = {}
+            with ThreadPoolExecutor(max_workers=len(detected)) as executor:
+                futures = {executor.submit(self._analyze_package_manager_dependencies, path, pm_name): pm_name
+                           for pm_name in detected}
+                # Report each package manager as soon as it is analyzed
+                for future in as_completed(futures):
+                    pm_name = futures[future]
+                    try:
+                        deps = future.result()
+                    except Exception as e:
+                        logger.error(f"Error analyzing {pm_name} dependencies: {e}")
+                        continue
+                    results[pm_name] = deps
+                    if deps and on_package_manager:
+                        on_package_manager(pm_name, deps)
+            
+            # Merge in detection order so results are deterministic
+            for pm_name in detected:
+                deps = results.get(pm_name)
                 if deps:
                     analysis['dependencies'][pm_name] = deps
                     analysis['total_dependencies'] += len(deps)
@@ -614,14 +654,10 @@ class DependencyManager:
             return False
         
         try:
-            # Change to project directory
-            original_cwd = os.getcwd()
-            os.chdir(project_path)
-            
             # Update dependencies
             for dep in dependencies:
                 cmd = f"{self.package_managers[package_manager]['update']} {dep}"
-                result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+                result = subprocess.run(cmd, shell=True, capture_output=True, text=True, cwd=project_path)
                 if result.returncode != 0:
                     logger.error(f"Failed to update {dep}: {result.stderr}")
                     return False
@@ -639,8 +675,6 @@ class DependencyManager:
         except Exception as e:
             logger.error(f"Error updating dependencies: {e}")
             return False
-        finally:
-            os.chdir(original_cwd)
     
     def install_dependencies(self, project_path: str, package_manager: str, dependencies: List[str]) -> bool:
         """Install dependencies for a project.
@@ -658,14 +692,10 @@ class DependencyManager:
             return False
         
         try:
-            # Change to project directory
-            original_cwd = os.getcwd()
-            os.chdir(project_path)
-            
             # Install dependencies
             for dep in dependencies:
                 cmd = f"{self.package_managers[package_manager]['install']} {dep}"
-                result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+                result = subprocess.run(cmd, shell=True, capture_output=True, text=True, cwd=project_path)
                 if result.returncode != 0:
                     logger.error(f"Failed to install {dep}: {result.stderr}")
                     return False
@@ -683,8 +713,6 @@ class DependencyManager:
         except Exception as e:
             logger.error(f"Error installing dependencies: {e}")
             return False
-        finally:
-            os.chdir(original_cwd)
     
     def remove_dependencies(self, project_path: str, package_manager: str, dependencies: List[str]) -> bool:
         """Remove dependencies from a project.
@@ -702,14 +730,10 @@ class DependencyManager:
             return False
         
         try:
-            # Change to project directory
-            original_cwd = os.getcwd()
-            os.chdir(project_path)
-            
             # Remove dependencies
             for dep in dependencies:
                 cmd = f"{self.package_managers[package_manager]['remove']} {dep}"
-                result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+                result = subprocess.run(cmd, shell=True, capture_output=True, text=True, cwd=project_path)
                 if result.returncode != 0:
                     logger.error(f"Failed to remove {dep}: {result.stderr}")
                     return False
@@ -727,12 +751,57 @@ class DependencyManager:
         except Exception as e:
             logger.error(f"Error removing dependencies: {e}")
             return False
-        finally:
-            os.chdir(original_cwd)
     
-    def get_supported_package_managers(self) -> Dict[str, str]:
+    def get_manifest_fingerprint(self, project_path: str) -> Tuple:
+        """Get a cheap fingerprint of the project's dependency manifests and lockfiles.
+        
+        Args:
+            project_path: Path to the project directory
+            
+        Returns:
+            Sorted tuple of (file name, mtime_ns, size) for every manifest file
+            in the project root
+        """
+        manifest_files = {name for info in self.package_managers.values() for name in info['files']}
+        fingerprint = []
+        try:
+            with os.scandir(project_path) as entries:
+                for entry in entries:
+                    if entry.name in manifest_files or entry.name.startswith('build.gradle'):
+                        try:
+                            stat = entry.stat()
+                        except OSError:
+                            continue
+                        fingerprint.append((entry.name, stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            pass
+        return tuple(sorted(fingerprint))
+    
+    def get_cached_analysis(self, project_path: str, fingerprint: Tuple) -> Optional[Dict[str, Any]]:
+        """Get an in-memory analysis result for an unchanged set of manifests."""
+        with self._analysis_cache_lock:
+            return self._analysis_cache.get((project_path, fingerprint))
+    
+    def cache_analysis(self, project_path: str, fingerprint: Tuple, analysis: Dict[str, Any]) -> None:
+        """Store an analysis result, replacing any older entry for the project."""
+        with self._analysis_cache_lock:
+            for key in [key for key in self._analysis_cache if key[0] == project_path]:
+                del self._analysis_cache[key]
+            self._analysis_cache[(project_path, fingerprint)] = analysis
+    
+    def invalidate_analysis(self, project_path: str) -> None:
+        """Drop in-memory analysis results for a project."""
+        with self._analysis_cache_lock:
+            for key in [key for key in self._analysis_cache if key[0] == project_path]:
+                del self._analysis_cache[key]
+    
+    def get_supported_package_managers(self) -> Mapping[str, str]:
         """Get list of supported package managers."""
-        return {pm: info.get('description', pm) for pm, info in self.package_managers.items()}
+        if self._supported_package_managers is None:
+            # Read-only view, so callers cannot change the cached mapping
+            self._supported_package_managers = MappingProxyType(
+                {pm: info.get('description', pm) for pm, info in self.package_managers.items()})
+        return self._supported_package_managers
     
     def is_package_manager_supported(self, package_manager: str) -> bool:
         """Check if a package manager is supported."""
@@ -156,12 +156,14 @@ class FileSystemWatcher:
         self._debounce_timers[project_path] = timer
         timer.start()
     
-    def watch_project(self, project_path: str, project_info: Optional[Dict[str, Any]] = None) -> bool:
+    def watch_project(self, project_path: str, project_info: Optional[Dict[str, Any]] = None,
+                      recursive: bool = True) -> bool:
         """Start watching a project directory for changes.
         
         Args:
             project_path: Path to the project directory
             project_info: Optional project information dictionary
+            recursive: Whether to watch subdirectories too, or only the directory itself
             
         Returns:
             True if watching started successfully, False otherwise
@@ -182,7 +184,7 @@ class FileSystemWatcher:
                 event_handler = ProjectEventHandler(self._handle_file_change)
                 
                 # Add watch
-                watch = self.observer.schedule(event_handler, project_path, recursive=True)
+                watch = self.observer.schedule(event_handler, project_path, recursive=recursive)
                 
                 # Store watch information
                 self.watched_projects[project_path] = {
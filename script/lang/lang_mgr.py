@@ -3,12 +3,30 @@ Language Manager for Benchmark
 Handles loading and managing translations from the translations module.
 """
 import logging
+from functools import lru_cache
 from typing import Dict, Optional, Any
 from . import translations
 
 # Set up logging
 log = logging.getLogger(__name__)
 
+
+def _format_text(lang_code: str, key: str, default: Optional[str], kwargs: Dict[str, Any]) -> str:
+    """Look up a translation and apply formatting parameters."""
+    text = translations.get_translation(lang_code, key, default or key)
+    try:
+        return text.format(**kwargs)
+    except (KeyError, ValueError) as e:
+        # If formatting fails, return the unformatted text
+        print(f"Warning: Translation formatting failed for key '{key}': {e}")
+        return text
+
+
+@lru_cache(maxsize=4096)
+def _get_text_cached(lang_code: str, key: str, default: Optional[str], kwargs_items: tuple) -> str:
+    """Memoized _format_text; kwargs_items is the sorted tuple of formatting parameters."""
+    return _format_text(lang_code, key, default, dict(kwargs_items))
+
 class LanguageManager:
     """Manages application translations."""
     
@@ -50,6 +68,7 @@ class LanguageManager:
             return False
             
         self.current_lang = lang_code
+        _get_text_cached.cache_clear()
         log.info(f"Successfully loaded language: {lang_code}")
         return True
     
@@ -64,13 +83,11 @@ class LanguageManager:
         Returns:
             Formatted translated text
         """
-        text = translations.get_translation(self.current_lang, key, default or key)
         try:
-            return text.format(**kwargs)
-        except (KeyError, ValueError) as e:
-            # If formatting fails, return the unformatted text
-            print(f"Warning: Translation formatting failed for key '{key}': {e}")
-            return text
+            return _get_text_cached(self.current_lang, key, default, tuple(sorted(kwargs.items())))
+        except TypeError:
+            # Unhashable formatting parameters, skip the cache
+            return _format_text(self.current_lang, key, default, kwargs)
     
     def get_language_name(self, lang_code: str) -> str:
         """Get the display name of a language.
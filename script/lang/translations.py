@@ -28,6 +28,10 @@ TRANSLATIONS = {
         "dependencies": {
             "stats": "Total: {total} | Outdated: {outdated} | Vulnerabilities: {vuln}"
         },
+        "build_system_dialog": {
+            "project_info": "Project: {name}",
+            "project_path": "Path: {path}"
+        },
         "menu": {
             "file": "File",
             "new": "New",
@@ -114,6 +118,7 @@ TRANSLATIONS = {
                 "project_size": "Project Size",
                 "min_size": "Min size (KB):",
                 "max_size": "Max size (KB):",
+                "include_unknown_size": "Include projects of unknown size",
                 "project_properties": "Project Properties",
                 "has_git_repo": "Has Git repository",
                 "is_favorite": "Is favorite",
@@ -149,7 +154,8 @@ TRANSLATIONS = {
                 "github_wiki": "GitHub Wiki",
                 "report_issue": "Report Issue",
                 "discussions": "Discussions",
-                "release_notes": "Release Notes"
+                "release_notes": "Release Notes",
+                "loading": "Loading…"
             },
             "tabs": {
                 "help": "Help",
@@ -300,6 +306,10 @@ TRANSLATIONS = {
         "dependencies": {
             "stats": "Totale: {total} | Obsoleti: {outdated} | Vulnerabilità: {vuln}"
         },
+        "build_system_dialog": {
+            "project_info": "Progetto: {name}",
+            "project_path": "Percorso: {path}"
+        },
         "menu": {
             "file": "File",
             "new": "Nuovo",
@@ -386,6 +396,7 @@ TRANSLATIONS = {
                 "project_size": "Dimensione Progetto",
                 "min_size": "Dimensione min (KB):",
                 "max_size": "Dimensione max (KB):",
+                "include_unknown_size": "Includi progetti di dimensione sconosciuta",
                 "project_properties": "Proprietà Progetto",
                 "has_git_repo": "Ha repository Git",
                 "is_favorite": "È preferito",
@@ -421,7 +432,8 @@ TRANSLATIONS = {
                 "github_wiki": "Wiki GitHub",
                 "report_issue": "Segnala Problema",
                 "discussions": "Discussioni",
-                "release_notes": "Note di Rilascio"
+                "release_notes": "Note di Rilascio",
+                "loading": "Caricamento…"
             },
             "tabs": {
                 "help": "Aiuto",
@@ -5,12 +5,14 @@ Scans the X:\\GitHub folder for projects and provides browsing functionality.
 """
 
 import os
+import re
 import json
+import mmap
 import threading
 import time
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any, Optional, Set
+from typing import List, Dict, Any, Optional, Set, Tuple
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from functools import lru_cache
 
@@ -18,6 +20,17 @@ from .tag_manager import TagManager
 from .build_system import BuildSystemDetector
 
 
+# Version patterns for _extract_version_generic, applied to memory-mapped bytes
+_GENERIC_VERSION_PATTERNS = (
+    re.compile(rb'version\s*[=:]\s*["\']([^"\']+)["\']', re.IGNORECASE),
+    re.compile(rb'VERSION\s*[=:]\s*["\']([^"\']+)["\']', re.IGNORECASE),
+    re.compile(rb'__version__\s*[=:]\s*["\']([^"\']+)["\']', re.IGNORECASE),
+    re.compile(rb'Application\.version\s*[=:]\s*["\']([^"\']+)["\']', re.IGNORECASE),
+    # Semantic version pattern
+    re.compile(rb'(\d+\.\d+\.\d+(?:-[\w.]+)?)'),
+)
+
+
 class ProjectScanner:
     """Scans and manages project information from GitHub folder."""
     
@@ -26,6 +39,11 @@ class ProjectScanner:
         self.data_path = Path(data_path)
         self.projects: List[Dict[str, Any]] = []
         self.last_scan: Optional[datetime] = None
+        # Bumped whenever the project list is replaced, rescanned or cleared
+        self.revision = 0
+        # Lowercased (name, description) per project path, rebuilt when the revision changes
+        self._search_keys: Dict[str, Tuple[str, str]] = {}
+        self._search_keys_revision = -1
         
         # Performance optimization: caching and threading
         self._project_cache: Dict[str, Dict[str, Any]] = {}
@@ -59,6 +77,7 @@ class ProjectScanner:
             # Clear existing projects when changing directory
             self.projects = []
             self.last_scan = None
+            self.revision += 1
             return True
         return False
     
@@ -81,6 +100,7 @@ class ProjectScanner:
                 return self.projects
             
             self.projects = []
+            self.revision += 1
             
             if not self.github_path.exists():
                 print(f"GitHub path not found: {self.github_path}")
@@ -114,6 +134,7 @@ class ProjectScanner:
                         continue
             
             self.last_scan = datetime.now()
+            self.revision += 1
             
             # Save the scanned data
             self.save_projects()
@@ -250,6 +271,8 @@ class ProjectScanner:
                         continue
         
         self.last_scan = datetime.now()
+        if deleted_paths or updated_projects:
+            self.revision += 1
         self.save_projects()
         
         elapsed_time = time.time() - start_time
@@ -302,6 +325,7 @@ class ProjectScanner:
             
             # Load projects
             self.projects = data.get('projects', [])
+            self.revision += 1
             
             # Convert string dates back to datetime objects
             for project in self.projects:
@@ -333,6 +357,7 @@ class ProjectScanner:
                 data_file.unlink()
             self.projects = []
             self.last_scan = None
+            self.revision += 1
             return True
         except Exception as e:
             print(f"Error clearing saved data: {e}")
@@ -940,29 +965,17 @@ class ProjectScanner:
         return 'Unknown'
     
     def _extract_version_generic(self, file_path: Path) -> str:
-        """Extract version using generic patterns from any file."""
+        """Extract version using generic patterns from any file.
+        
+        The file is memory-mapped and scanned with bytes patterns, so large
+        files are neither decoded nor copied into a Python string.
+        """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                import re
-                
-                # Common version patterns
-                patterns = [
-                    r'version\s*[=:]\s*["\']([^"\']+)["\']',
-                    r'VERSION\s*[=:]\s*["\']([^"\']+)["\']',
-                    r'__version__\s*[=:]\s*["\']([^"\']+)["\']',
-                    r'Application\.version\s*[=:]\s*["\']([^"\']+)["\']'
-                ]
-                
-                for pattern in patterns:
-                    match = re.search(pattern, content, re.IGNORECASE)
+            with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                for pattern in _GENERIC_VERSION_PATTERNS:
+                    match = pattern.search(content)
                     if match:
-                        return match.group(1)
-                
-                # Semantic version pattern
-                match = re.search(r'(\d+\.\d+\.\d+(?:-[\w.]+)?)', content)
-                if match:
-                    return match.group(1)
+                        return match.group(1).decode('utf-8', 'replace')
         except Exception:
             pass
         return 'Unknown'
@@ -993,21 +1006,34 @@ class ProjectScanner:
         return self.projects
     
     def filter_projects(self, filter_text: str = '', language: str = '') -> List[Dict[str, Any]]:
-        """Filter projects based on search text and language."""
-        filtered = self.projects
+        """Filter projects based on search text and language.
         
-        if filter_text:
-            filter_text = filter_text.lower()
-            filtered = [
-                p for p in filtered 
-                if filter_text in p['name'].lower() or 
-                   filter_text in p['description'].lower()
-            ]
+        When no filter is active the internal project list is returned as-is;
+        callers must not mutate the result.
+        """
+        text_filter = filter_text.lower() if filter_text else None
+        language_filter = language if language and language != 'All' else None
+        if text_filter is None and language_filter is None:
+            return self.projects
         
-        if language and language != 'All':
-            filtered = [p for p in filtered if p['language'] == language]
+        if text_filter is not None and self._search_keys_revision != self.revision:
+            self._search_keys = {}
+            self._search_keys_revision = self.revision
+        search_keys = self._search_keys
         
-        return filtered
+        def matches_text(p: Dict[str, Any]) -> bool:
+            keys = search_keys.get(p['path'])
+            if keys is None:
+                keys = search_keys[p['path']] = (p.get('name', '').lower(),
+                                                 (p.get('description') or '').lower())
+            return text_filter in keys[0] or text_filter in keys[1]
+        
+        # Single pass over the projects with both predicates fused
+        return [
+            p for p in self.projects
+            if (language_filter is None or p['language'] == language_filter)
+            and (text_filter is None or matches_text(p))
+        ]
     
     def get_languages(self) -> List[str]:
         """Get list of available languages."""
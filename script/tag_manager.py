@@ -4,11 +4,22 @@ Tag Manager Module
 Provides tagging and categorization functionality for projects.
 """
 
+import os
 import json
+import hashlib
+from collections import Counter, defaultdict, deque
+from itertools import chain, islice
 from pathlib import Path
-from typing import List, Dict, Any, Set, Optional
+from typing import List, Dict, Any, Set, FrozenSet, Iterable, Optional, Deque
 from datetime import datetime
 import re
+import weakref
+
+# Use orjson when available (much faster, serializes datetime natively)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 def json_serializer(obj):
@@ -18,6 +29,43 @@ def json_serializer(obj):
     raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
 
 
+def _json_dumps(data: Any) -> bytes:
+    """Serialize data to UTF-8 encoded, indented JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False, default=json_serializer).encode('utf-8')
+
+
+def _json_loads(data: bytes) -> Any:
+    """Deserialize JSON bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _read_json(path: Path) -> Any:
+    """Read and parse a JSON file."""
+    with open(path, 'rb') as f:
+        return _json_loads(f.read())
+
+
+def _atomic_write(path: Path, data_bytes: bytes) -> None:
+    """Write bytes to a temporary file next to path, then atomically replace path."""
+    tmp = path.with_suffix(path.suffix + '.tmp')
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(data_bytes)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except Exception:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        raise
+
+
 class TagManager:
     """Manages project tags, categories, notes, and favorites."""
     
@@ -75,6 +123,10 @@ class TagManager:
         }
     }
     
+    # Precompiled patterns used by _clean_tag
+    _CLEAN_TAG_STRIP = re.compile(r'[^\w\s-]')
+    _CLEAN_TAG_WS = re.compile(r'\s+')
+    
     def __init__(self, data_path: str = "data"):
         self.data_path = Path(data_path)
         self.tags_file = self.data_path / "tags.json"
@@ -87,14 +139,20 @@ class TagManager:
         self.data_path.mkdir(exist_ok=True)
         
         # Initialize data structures
-        self.project_tags: Dict[str, Set[str]] = {}  # project_path -> set of tags
+        self.project_tags: Dict[str, FrozenSet[str]] = {}  # project_path -> interned set of tags
+        self._tag_set_pool = weakref.WeakValueDictionary()  # shares identical tag sets between projects
         self.project_categories: Dict[str, str] = {}  # project_path -> category_key
         self.all_tags: Set[str] = set()
+        self._tag_to_paths: Dict[str, Set[str]] = {}  # tag -> set of project paths (reverse index)
         self.custom_categories: Dict[str, Dict[str, Any]] = {}
         self.project_notes: Dict[str, str] = {}  # project_path -> note content
+        self._project_notes_lower: Dict[str, str] = {}  # project_path -> lowercased note (search cache)
         self.favorite_projects: Set[str] = set()  # set of project paths
-        self.recent_projects: List[Dict[str, Any]] = []  # list of recent project access records
         self.max_recent_projects = 20  # maximum number of recent projects to track
+        self.recent_projects: Deque[Dict[str, Any]] = deque(maxlen=self.max_recent_projects)  # most recent first
+        self._recent_index: Dict[str, Dict[str, Any]] = {}  # project_path -> recent project record
+        self._saved_digests: Dict[Path, bytes] = {}  # file -> digest of last written content
+        self._category_scorer = None  # built by _build_category_scorer, reset when categories change
         
         # Load existing data
         self.load_data()
@@ -104,102 +162,112 @@ class TagManager:
         try:
             # Load tags
             if self.tags_file.exists():
-                with open(self.tags_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.project_tags = {k: set(v) for k, v in data.get('project_tags', {}).items()}
-                    self.all_tags = set(data.get('all_tags', []))
+                data = _read_json(self.tags_file)
+                self.project_tags = {k: self._intern_tags(v) for k, v in data.get('project_tags', {}).items()}
+                self.all_tags = set(data.get('all_tags', []))
             
             # Load categories
             if self.categories_file.exists():
-                with open(self.categories_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.project_categories = data.get('project_categories', {})
-                    self.custom_categories = data.get('custom_categories', {})
+                data = _read_json(self.categories_file)
+                self.project_categories = data.get('project_categories', {})
+                self.custom_categories = data.get('custom_categories', {})
+                self._category_scorer = None
             
             # Load notes
             if self.notes_file.exists():
-                with open(self.notes_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.project_notes = data.get('project_notes', {})
+                data = _read_json(self.notes_file)
+                self.project_notes = data.get('project_notes', {})
+                self._project_notes_lower = {k: v.lower() for k, v in self.project_notes.items()}
             
             # Load favorites
             if self.favorites_file.exists():
-                with open(self.favorites_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.favorite_projects = set(data.get('favorite_projects', []))
+                data = _read_json(self.favorites_file)
+                self.favorite_projects = set(data.get('favorite_projects', []))
             
             # Load recent projects
             if self.recent_projects_file.exists():
-                with open(self.recent_projects_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.recent_projects = data.get('recent_projects', [])
+                data = _read_json(self.recent_projects_file)
+                self._set_recent_projects(data.get('recent_projects', []))
+            
+            self._rebuild_tag_index()
         except Exception as e:
             print(f"Error loading tag data: {e}")
             # Initialize with empty data
             self.project_tags = {}
             self.project_categories = {}
             self.all_tags = set()
+            self._tag_to_paths = {}
             self.custom_categories = {}
             self.project_notes = {}
+            self._project_notes_lower = {}
             self.favorite_projects = set()
-            self.recent_projects = []
+            self._set_recent_projects([])
     
     def save_data(self) -> bool:
         """Save tags, categories, notes, favorites, and recent projects to files."""
         try:
+            now_iso = datetime.now().isoformat()
+            
             # Save tags
             tags_data = {
                 'project_tags': {k: list(v) for k, v in self.project_tags.items()},
                 'all_tags': list(self.all_tags),
-                'last_updated': datetime.now().isoformat()
+                'last_updated': now_iso
             }
             
-            with open(self.tags_file, 'w', encoding='utf-8') as f:
-                json.dump(tags_data, f, indent=2, ensure_ascii=False)
+            self._write_json_if_changed(self.tags_file, tags_data)
             
             # Save categories
             categories_data = {
                 'project_categories': self.project_categories,
                 'custom_categories': self.custom_categories,
                 'predefined_categories': self.PREDEFINED_CATEGORIES,
-                'last_updated': datetime.now().isoformat()
+                'last_updated': now_iso
             }
             
-            with open(self.categories_file, 'w', encoding='utf-8') as f:
-                json.dump(categories_data, f, indent=2, ensure_ascii=False)
+            self._write_json_if_changed(self.categories_file, categories_data)
             
             # Save notes
             notes_data = {
                 'project_notes': self.project_notes,
-                'last_updated': datetime.now().isoformat()
+                'last_updated': now_iso
             }
             
-            with open(self.notes_file, 'w', encoding='utf-8') as f:
-                json.dump(notes_data, f, indent=2, ensure_ascii=False)
+            self._write_json_if_changed(self.notes_file, notes_data)
             
             # Save favorites
             favorites_data = {
                 'favorite_projects': list(self.favorite_projects),
-                'last_updated': datetime.now().isoformat()
+                'last_updated': now_iso
             }
             
-            with open(self.favorites_file, 'w', encoding='utf-8') as f:
-                json.dump(favorites_data, f, indent=2, ensure_ascii=False)
+            self._write_json_if_changed(self.favorites_file, favorites_data)
             
             # Save recent projects
             recent_projects_data = {
-                'recent_projects': self.recent_projects,
-                'last_updated': datetime.now().isoformat()
+                'recent_projects': list(self.recent_projects),
+                'last_updated': now_iso
             }
             
-            with open(self.recent_projects_file, 'w', encoding='utf-8') as f:
-                json.dump(recent_projects_data, f, indent=2, ensure_ascii=False, default=json_serializer)
+            self._write_json_if_changed(self.recent_projects_file, recent_projects_data)
             
             return True
         except Exception as e:
             print(f"Error saving tag data: {e}")
             return False
     
+    def _write_json_if_changed(self, path: Path, data: Dict[str, Any]) -> None:
+        """Atomically write data to path, skipping the write if only 'last_updated' changed."""
+        data_bytes = _json_dumps(data)
+        # Hash the serialized bytes without this save's timestamp
+        stamp = f'"last_updated": {json.dumps(data.get("last_updated"))}'.encode('utf-8')
+        digest = hashlib.blake2b(data_bytes.replace(stamp, b''), digest_size=16).digest()
+        if self._saved_digests.get(path) == digest and path.exists():
+            return
+        
+        _atomic_write(path, data_bytes)
+        self._saved_digests[path] = digest
+    
     def add_tag_to_project(self, project_path: str, tag: str) -> bool:
         """Add a tag to a project."""
         if not project_path or not tag:
@@ -211,11 +279,9 @@ class TagManager:
             return False
         
         # Add tag to project
-        if project_path not in self.project_tags:
-            self.project_tags[project_path] = set()
-        
-        self.project_tags[project_path].add(tag)
-        self.all_tags.add(tag)
+        current_tags = self.project_tags.get(project_path, frozenset())
+        self.project_tags[project_path] = self._intern_tags(current_tags | {tag})
+        self._index_tag(project_path, tag)
         
         return self.save_data()
     
@@ -226,11 +292,8 @@ class TagManager:
         
         tag = self._clean_tag(tag)
         if tag in self.project_tags[project_path]:
-            self.project_tags[project_path].remove(tag)
-            
-            # Remove from all_tags if no longer used
-            if not any(tag in tags for tags in self.project_tags.values()):
-                self.all_tags.discard(tag)
+            self.project_tags[project_path] = self._intern_tags(self.project_tags[project_path] - {tag})
+            self._unindex_tag(project_path, tag)
             
             return self.save_data()
         
@@ -242,23 +305,25 @@ class TagManager:
             return False
         
         # Clean and validate tags
-        cleaned_tags = [self._clean_tag(tag) for tag in tags if self._clean_tag(tag)]
+        cleaned_tags = [tag for tag in map(self._clean_tag, tags) if tag]
         
-        # Remove old tags from global set
-        if project_path in self.project_tags:
-            for old_tag in self.project_tags[project_path]:
-                if not any(old_tag in tags for tags in self.project_tags.values() if tags != self.project_tags[project_path]):
-                    self.all_tags.discard(old_tag)
+        new_tags = self._intern_tags(cleaned_tags)
+        old_tags = self.project_tags.get(project_path, frozenset())
+        
+        # Update the reverse index only for the tags that changed
+        for old_tag in old_tags - new_tags:
+            self._unindex_tag(project_path, old_tag)
+        for new_tag in new_tags - old_tags:
+            self._index_tag(project_path, new_tag)
         
         # Set new tags
-        self.project_tags[project_path] = set(cleaned_tags)
-        self.all_tags.update(cleaned_tags)
+        self.project_tags[project_path] = new_tags
         
         return self.save_data()
     
     def get_project_tags(self, project_path: str) -> List[str]:
         """Get all tags for a project."""
-        return list(self.project_tags.get(project_path, set()))
+        return list(self.project_tags.get(project_path, ()))
     
     def get_all_tags(self) -> List[str]:
         """Get all unique tags."""
@@ -267,7 +332,34 @@ class TagManager:
     def get_projects_by_tag(self, tag: str) -> List[str]:
         """Get all projects that have a specific tag."""
         tag = self._clean_tag(tag)
-        return [path for path, tags in self.project_tags.items() if tag in tags]
+        return list(self._tag_to_paths.get(tag, ()))
+    
+    def _intern_tags(self, tags: Iterable[str]) -> FrozenSet[str]:
+        """Return a shared frozenset equal to tags, so identical tag sets are stored once."""
+        tag_set = frozenset(tags)
+        return self._tag_set_pool.setdefault(tag_set, tag_set)
+    
+    def _rebuild_tag_index(self) -> None:
+        """Rebuild the tag -> project paths reverse index from project_tags."""
+        self._tag_to_paths = {}
+        for project_path, tags in self.project_tags.items():
+            for tag in tags:
+                self._tag_to_paths.setdefault(tag, set()).add(project_path)
+    
+    def _index_tag(self, project_path: str, tag: str) -> None:
+        """Record that a project holds a tag."""
+        self._tag_to_paths.setdefault(tag, set()).add(project_path)
+        self.all_tags.add(tag)
+    
+    def _unindex_tag(self, project_path: str, tag: str) -> None:
+        """Forget that a project holds a tag, dropping the tag once unused."""
+        paths = self._tag_to_paths.get(tag)
+        if paths is not None:
+            paths.discard(project_path)
+            if paths:
+                return
+            del self._tag_to_paths[tag]
+        self.all_tags.discard(tag)
     
     def set_project_category(self, project_path: str, category_key: str) -> bool:
         """Set the category for a project."""
@@ -312,6 +404,7 @@ class TagManager:
             "description": description,
             "keywords": keywords
         }
+        self._category_scorer = None
         
         return self.save_data()
     
@@ -327,6 +420,7 @@ class TagManager:
         
         # Remove custom category
         del self.custom_categories[key]
+        self._category_scorer = None
         
         return self.save_data()
     
@@ -344,19 +438,9 @@ class TagManager:
         text = f"{name} {description} {language}"
         
         # Score each category based on keyword matches
-        category_scores = {}
-        for cat_key, cat_info in self.get_all_categories().items():
-            score = 0
-            for keyword in cat_info.get('keywords', []):
-                if keyword.lower() in text:
-                    score += 1
-            
-            # Bonus for language matches
-            if language and language in cat_info.get('keywords', []):
-                score += 2
-            
-            if score > 0:
-                category_scores[cat_key] = score
+        if self._category_scorer is None:
+            self._category_scorer = self._build_category_scorer()
+        category_scores = self._category_scorer(text, language)
         
         # Return category with highest score
         if category_scores:
@@ -364,6 +448,37 @@ class TagManager:
         
         return None
     
+    def _build_category_scorer(self):
+        """Build a scoring function over the current category keywords.
+        
+        The function takes (text, language) and returns a dict of
+        category_key -> score for every category with a positive score: one point
+        per keyword found in text, plus two if language is one of the keywords.
+        """
+        categories = [str(cat_key) for cat_key in self.get_all_categories()]
+        keyword_categories: Dict[str, List[str]] = defaultdict(list)  # lowercased keyword -> categories
+        language_categories: Dict[str, Set[str]] = defaultdict(set)  # keyword -> categories
+        for cat_key, cat_info in self.get_all_categories().items():
+            for keyword in map(str, cat_info.get('keywords', [])):
+                keyword_categories[keyword.lower()].append(str(cat_key))
+                language_categories[keyword].add(str(cat_key))
+        keyword_categories = dict(keyword_categories)
+        language_categories = dict(language_categories)
+        
+        def score(text: str, language: str) -> Dict[str, int]:
+            # Start from every category so ties keep the category order
+            scores = dict.fromkeys(categories, 0)
+            for keyword, cat_keys in keyword_categories.items():
+                if keyword in text:
+                    for cat_key in cat_keys:
+                        scores[cat_key] += 1
+            if language:
+                for cat_key in language_categories.get(language, ()):
+                    scores[cat_key] += 2
+            return {cat_key: n for cat_key, n in scores.items() if n > 0}
+        
+        return score
+    
     def _clean_tag(self, tag: str) -> Optional[str]:
         """Clean and validate a tag."""
         if not tag:
@@ -376,10 +491,10 @@ class TagManager:
         tag = tag.lower()
         
         # Remove special characters (keep alphanumeric, spaces, hyphens, underscores)
-        tag = re.sub(r'[^\w\s-]', '', tag)
+        tag = self._CLEAN_TAG_STRIP.sub('', tag)
         
         # Replace multiple spaces with single space
-        tag = re.sub(r'\s+', ' ', tag)
+        tag = self._CLEAN_TAG_WS.sub(' ', tag)
         
         # Limit length
         if len(tag) > 50:
@@ -398,19 +513,11 @@ class TagManager:
         }
         
         # Most used tags
-        tag_counts = {}
-        for tags in self.project_tags.values():
-            for tag in tags:
-                tag_counts[tag] = tag_counts.get(tag, 0) + 1
-        
-        stats['most_used_tags'] = sorted(tag_counts.items(), key=lambda x: x[1], reverse=True)[:10]
+        tag_counts = Counter(chain.from_iterable(self.project_tags.values()))
+        stats['most_used_tags'] = tag_counts.most_common(10)
         
         # Category distribution
-        cat_counts = {}
-        for category in self.project_categories.values():
-            cat_counts[category] = cat_counts.get(category, 0) + 1
-        
-        stats['category_distribution'] = cat_counts
+        stats['category_distribution'] = dict(Counter(self.project_categories.values()))
         
         return stats
     
@@ -419,7 +526,7 @@ class TagManager:
         if not tags:
             return []
         
-        cleaned_tags = [self._clean_tag(tag) for tag in tags if self._clean_tag(tag)]
+        cleaned_tags = [tag for tag in map(self._clean_tag, tags) if tag]
         if not cleaned_tags:
             return []
         
@@ -443,6 +550,7 @@ class TagManager:
             return False
         
         self.project_notes[project_path] = note
+        self._project_notes_lower[project_path] = note.lower()
         return self.save_data()
     
     def get_project_note(self, project_path: str) -> str:
@@ -453,6 +561,7 @@ class TagManager:
         """Delete the note for a project."""
         if project_path in self.project_notes:
             del self.project_notes[project_path]
+            self._project_notes_lower.pop(project_path, None)
             return self.save_data()
         return True
     
@@ -466,13 +575,7 @@ class TagManager:
             return []
         
         search_lower = search_text.lower()
-        matching_projects = []
-        
-        for project_path, note in self.project_notes.items():
-            if search_lower in note.lower():
-                matching_projects.append(project_path)
-        
-        return matching_projects
+        return [path for path, note_lower in self._project_notes_lower.items() if search_lower in note_lower]
     
     # Favorite Projects Methods
     def add_favorite_project(self, project_path: str) -> bool:
@@ -528,41 +631,54 @@ class TagManager:
         }
         
         # Remove existing entry for the same project (if any)
-        self.recent_projects = [r for r in self.recent_projects if r['path'] != project_path]
+        existing = self._recent_index.pop(project_path, None)
+        if existing is not None:
+            self.recent_projects.remove(existing)
+        elif len(self.recent_projects) == self.max_recent_projects:
+            # The deque drops the oldest record on appendleft; keep the index in sync
+            self._recent_index.pop(self.recent_projects[-1]['path'], None)
         
         # Add to the beginning of the list
-        self.recent_projects.insert(0, recent_record)
-        
-        # Limit to maximum number of recent projects
-        if len(self.recent_projects) > self.max_recent_projects:
-            self.recent_projects = self.recent_projects[:self.max_recent_projects]
+        self.recent_projects.appendleft(recent_record)
+        self._recent_index[project_path] = recent_record
         
         return self.save_data()
     
+    def _set_recent_projects(self, records: List[Dict[str, Any]]) -> None:
+        """Replace the recent projects list and rebuild its path index."""
+        self.recent_projects = deque(maxlen=self.max_recent_projects)
+        self._recent_index = {}
+        for record in records:
+            path = record.get('path')
+            if path in self._recent_index or len(self.recent_projects) == self.max_recent_projects:
+                continue
+            self.recent_projects.append(record)
+            self._recent_index[path] = record
+    
     def get_recent_projects(self, limit: int = None) -> List[Dict[str, Any]]:
         """Get the list of recent projects."""
         if limit is None:
-            return self.recent_projects.copy()
+            return list(self.recent_projects)
         else:
-            return self.recent_projects[:limit]
+            return list(islice(self.recent_projects, limit))
     
     def clear_recent_projects(self) -> bool:
         """Clear all recent projects."""
-        self.recent_projects = []
+        self.recent_projects.clear()
+        self._recent_index.clear()
         return self.save_data()
     
     def remove_recent_project(self, project_path: str) -> bool:
         """Remove a specific project from recent projects."""
-        original_length = len(self.recent_projects)
-        self.recent_projects = [r for r in self.recent_projects if r['path'] != project_path]
-        
-        if len(self.recent_projects) < original_length:
+        record = self._recent_index.pop(project_path, None)
+        if record is not None:
+            self.recent_projects.remove(record)
             return self.save_data()
         return True  # Project wasn't in the list, but that's not an error
     
     def is_recent_project(self, project_path: str) -> bool:
         """Check if a project is in the recent projects list."""
-        return any(r['path'] == project_path for r in self.recent_projects)
+        return project_path in self._recent_index
     
     def get_recent_project_count(self) -> int:
         """Get the number of recent projects."""
@@ -575,6 +691,6 @@ class TagManager:
         
         # If project name not provided, try to extract from path
         if project_name is None:
-            project_name = Path(project_path).name
+            project_name = os.path.basename(project_path.rstrip('/\\'))
         
         return self.add_recent_project(project_path, project_name, project_data)
@@ -1,13 +1,35 @@
 import os
+from functools import lru_cache
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QPixmap
-from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
+from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
                              QDialogButtonBox, QTextBrowser)
 
 # Local imports
 from script.utils.version import __version__
 from script.lang.lang_mgr import get_text
 
+# Dialog-level style sheet, applied once and matched by object name
+_ABOUT_DIALOG_QSS = """
+    QPushButton#closeButton {
+        background-color: red;
+        color: white;
+        padding: 5px 15px;
+        border: none;
+        border-radius: 3px;
+    }
+"""
+
+
+@lru_cache(maxsize=1)
+def _get_logo_pixmap():
+    """Load and scale the application logo once; returns None if the file is missing."""
+    logo_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'assets', 'logo.png')
+    if not os.path.exists(logo_path):
+        return None
+    return QPixmap(logo_path).scaled(96, 96, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+
+
 class AboutDialog(QDialog):
     """Custom about dialog with close button."""
     
@@ -26,10 +48,9 @@ class AboutDialog(QDialog):
         
         # Add logo to the left
         logo_label = QLabel()
-        logo_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'assets', 'logo.png')
-        if os.path.exists(logo_path):
-            pixmap = QPixmap(logo_path)
-            logo_label.setPixmap(pixmap.scaled(96, 96, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
+        pixmap = _get_logo_pixmap()
+        if pixmap is not None:
+            logo_label.setPixmap(pixmap)
         
         # Create text browser for the about content
         self.text_browser = QTextBrowser()
@@ -41,7 +62,7 @@ class AboutDialog(QDialog):
         button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Close)
         close_button = button_box.button(QDialogButtonBox.StandardButton.Close)
         if close_button:
-            close_button.setStyleSheet("background-color: red; color: white; padding: 5px 15px; border: none; border-radius: 3px;")
+            close_button.setObjectName("closeButton")
         button_box.rejected.connect(self.close)
         
         # Add widgets to header layout
@@ -54,6 +75,7 @@ class AboutDialog(QDialog):
         
         # Set layout
         self.setLayout(layout)
+        self.setStyleSheet(_ABOUT_DIALOG_QSS)
     
     def retranslate_ui(self):
         """Update the UI translations when language changes."""
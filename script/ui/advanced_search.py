@@ -6,21 +6,111 @@ criteria including tags, categories, file types, and other project attributes.
 
 import os
 import re
-from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Set
-from pathlib import Path
+import fnmatch
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Any, Optional
 
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel, 
     QLineEdit, QPushButton, QComboBox, QCheckBox, QGroupBox,
-    QFrame, QSpinBox, QDateEdit, QScrollArea, QMessageBox,
+    QSpinBox, QDateEdit, QMessageBox,
     QDialogButtonBox, QTabWidget, QWidget
 )
-from PySide6.QtCore import Qt, QDate
-from PySide6.QtGui import QFont
+from PySide6.QtCore import Qt, QDate, QThread, Signal
 
 from script.lang.lang_mgr import get_text
 
+# Dialog-level style sheet, applied once and matched by object name
+_SEARCH_DIALOG_QSS = """
+    QPushButton#searchButton {
+        background-color: #2196F3;
+        color: white;
+        font-weight: bold;
+        padding: 8px 16px;
+    }
+"""
+
+
+def _search_keys(project: Dict[str, Any]) -> Dict[str, Any]:
+    """Return lowercased copies of the fields compared by the search matchers.
+    
+    The keys are kept by the dialog, not in the project dict, which is shared
+    with the scanner and the tag manager and gets serialized by them.
+    """
+    return {
+        'name_lower': project.get('name', '').lower(),
+        'language_lower': (project.get('language') or 'Unknown').lower(),
+        'category_lower': (project.get('category') or 'Uncategorized').lower(),
+        'tags_lower': frozenset(tag.casefold() for tag in project.get('tags') or ()),
+        'modified_iso': _to_iso_date(project.get('modified')),
+        'has_git': None,  # Probed on first use
+    }
+
+
+def _to_iso_date(value: Any) -> Optional[str]:
+    """Convert a datetime or ISO-8601 string to a 'YYYY-MM-DD' string (None if missing).
+    
+    ISO dates sort lexically in chronological order, so they can be compared as strings.
+    """
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    if isinstance(value, str) and value:
+        return value[:10]
+    return None
+
+
+def _has_git(project: Dict[str, Any], keys: Dict[str, Any]) -> bool:
+    """Return whether the project is a git repository, probing the file system at most once."""
+    if 'has_git' in project:
+        return bool(project['has_git'])
+    if keys['has_git'] is None:
+        keys['has_git'] = os.path.isdir(os.path.join(project.get('path', ''), '.git'))
+    return keys['has_git']
+
+
+def _iter_entry_names(root: str):
+    """Yield the names of all files and directories below root (symlinked dirs are not followed)."""
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    yield entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+        except OSError:
+            continue
+
+
+class SearchThread(QThread):
+    """Thread for matching projects against search criteria without blocking the UI."""
+    
+    search_complete = Signal(list)
+    progress = Signal(int)
+    
+    def __init__(self, projects: List[Dict[str, Any]], matcher):
+        super().__init__()
+        self.projects = projects
+        self.matcher = matcher
+        self.results = []
+    
+    def run(self):
+        """Match the projects in order, reporting progress about once per percent."""
+        matcher = self.matcher
+        total = len(self.projects)
+        step = max(1, total // 100)
+        
+        results = []
+        for i, project in enumerate(self.projects, 1):
+            if matcher(project):
+                results.append(project)
+            if i % step == 0:
+                self.progress.emit(int(i * 100 / total))
+        
+        self.results = results
+        self.search_complete.emit(results)
+
 
 class AdvancedSearchDialog(QDialog):
     """Advanced search dialog for projects."""
@@ -29,6 +119,10 @@ class AdvancedSearchDialog(QDialog):
         super().__init__(parent)
         self.scanner = scanner
         self.search_results = []
+        self.search_thread = None
+        self._by_language = {}
+        self._by_category = {}
+        self._search_keys = {}
         self.lang = lang
         self.setWindowTitle(get_text('advanced_search.title', 'Advanced Project Search'))
         self.setModal(True)
@@ -63,7 +157,7 @@ class AdvancedSearchDialog(QDialog):
         
         self.search_button = QPushButton(get_text('advanced_search.buttons.search', 'Search'))
         self.search_button.clicked.connect(self.perform_search)
-        self.search_button.setStyleSheet("background-color: #2196F3; color: white; font-weight: bold; padding: 8px 16px;")
+        self.search_button.setObjectName("searchButton")
         button_layout.addWidget(self.search_button)
         
         self.clear_button = QPushButton(get_text('advanced_search.buttons.clear', 'Clear'))
@@ -82,6 +176,8 @@ class AdvancedSearchDialog(QDialog):
         button_layout.addWidget(dialog_buttons)
         
         layout.addLayout(button_layout)
+        
+        self.setStyleSheet(_SEARCH_DIALOG_QSS)
     
     def create_basic_search_tab(self) -> QWidget:
         """Create the basic search tab."""
@@ -195,6 +291,10 @@ class AdvancedSearchDialog(QDialog):
         self.max_size_spin.setValue(1000000)
         size_layout.addWidget(self.max_size_spin, 1, 1)
         
+        self.include_unknown_size = QCheckBox(get_text('advanced_search.advanced.include_unknown_size', 'Include projects of unknown size'))
+        self.include_unknown_size.setChecked(True)
+        size_layout.addWidget(self.include_unknown_size, 2, 0, 1, 2)
+        
         layout.addWidget(size_group)
         
         # Project properties
@@ -284,18 +384,53 @@ class AdvancedSearchDialog(QDialog):
         return tab
     
     def load_available_data(self):
-        """Load available data for dropdowns."""
+        """Load available data for dropdowns and precompute per-project search keys."""
         projects = self.scanner.get_projects()
+        search_keys = {}
+        by_language = defaultdict(list)
+        by_category = defaultdict(list)
+        for project in projects:
+            keys = search_keys[project.get('path')] = _search_keys(project)
+            by_language[keys['language_lower']].append(project)
+            by_category[keys['category_lower']].append(project)
+        
+        # Search keys live in a side table keyed by project path
+        self._search_keys = search_keys
+        
+        # Buckets let a language/category search skip all other projects
+        self._by_language = dict(by_language)
+        self._by_category = dict(by_category)
+        
+        self.refresh_dropdowns(projects)
+    
+    def refresh_dropdowns(self, projects: Optional[List[Dict[str, Any]]] = None):
+        """Reload the language and category dropdowns, keeping the current selections."""
+        if projects is None:
+            projects = self.scanner.get_projects()
         
         # Load languages
-        languages = sorted(set(p.get('language', 'Unknown') for p in projects))
-        for lang in languages:
-            self.language_combo.addItem(lang, lang)
+        languages = sorted(set(p.get('language') or 'Unknown' for p in projects))
+        self._populate_combo(self.language_combo, languages)
         
         # Load categories
-        categories = sorted(set(p.get('category', 'Uncategorized') for p in projects))
-        for cat in categories:
-            self.category_combo.addItem(cat, cat)
+        categories = sorted(set(p.get('category') or 'Uncategorized' for p in projects))
+        self._populate_combo(self.category_combo, categories)
+    
+    @staticmethod
+    def _populate_combo(combo: QComboBox, values: List[str]):
+        """Replace the items after the leading 'Any' entry in one batch, using each value as its item data."""
+        combo.blockSignals(True)
+        try:
+            selected = combo.currentData()
+            any_text, any_data = combo.itemText(0), combo.itemData(0)
+            combo.clear()
+            combo.addItem(any_text, any_data)
+            combo.addItems(values)
+            for index, value in enumerate(values, 1):
+                combo.setItemData(index, value)
+            combo.setCurrentIndex(max(combo.findData(selected), 0))
+        finally:
+            combo.blockSignals(False)
     
     def set_date_preset(self, preset: str):
         """Set date filter based on preset."""
@@ -330,6 +465,7 @@ class AdvancedSearchDialog(QDialog):
         self.files_match_any.setChecked(True)
         self.min_size_spin.setValue(0)
         self.max_size_spin.setValue(1000000)
+        self.include_unknown_size.setChecked(True)
         self.has_git_repo.setChecked(False)
         self.is_favorite.setChecked(False)
         self.has_notes.setChecked(False)
@@ -342,12 +478,46 @@ class AdvancedSearchDialog(QDialog):
     
     def perform_search(self):
         """Perform the advanced search."""
-        projects = self.scanner.get_projects()
-        self.search_results = []
+        if self.search_thread is not None and self.search_thread.isRunning():
+            return
         
-        for project in projects:
-            if self.matches_search_criteria(project):
-                self.search_results.append(project)
+        criteria = self.build_search_criteria()
+        projects = self.get_candidate_projects(criteria)
+        
+        matcher = self.build_matcher(criteria)
+        
+        # Match on a background thread; the criteria dict is shared read-only
+        self.search_button.setEnabled(False)
+        self.search_thread = SearchThread(projects, matcher)
+        self.search_thread.progress.connect(self.on_search_progress)
+        self.search_thread.search_complete.connect(self.on_search_complete)
+        self.search_thread.start()
+    
+    def get_candidate_projects(self, criteria: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Return the projects worth matching: the smallest selected language/category bucket, or all."""
+        buckets = []
+        if criteria['language'] is not None:
+            buckets.append(self._by_language.get(criteria['language'], []))
+        if criteria['category'] is not None:
+            buckets.append(self._by_category.get(criteria['category'], []))
+        if not buckets:
+            return self.scanner.get_projects()
+        # The matcher still checks the other selection, so the smallest bucket is enough
+        return min(buckets, key=len)
+    
+    def on_search_progress(self, percent: int):
+        """Show search progress on the search button."""
+        if self.search_thread is None or self.sender() is not self.search_thread:
+            return
+        self.search_button.setText(f"{get_text('advanced_search.buttons.search', 'Search')} ({percent}%)")
+    
+    def on_search_complete(self, results: List[Dict[str, Any]]):
+        """Store the search results once the search thread has finished."""
+        if self.search_thread is None or self.sender() is not self.search_thread:
+            return
+        self.search_results = results
+        self.search_button.setText(get_text('advanced_search.buttons.search', 'Search'))
+        self.search_button.setEnabled(True)
         
         # Show results count
         QMessageBox.information(
@@ -355,139 +525,175 @@ class AdvancedSearchDialog(QDialog):
             f"Found {len(self.search_results)} projects matching your criteria."
         )
     
-    def matches_search_criteria(self, project: Dict[str, Any]) -> bool:
-        """Check if a project matches all search criteria."""
-        # Name search
-        if self.name_search.text():
-            if not self.matches_name_criteria(project):
-                return False
+    def build_search_criteria(self) -> Dict[str, Any]:
+        """Read every search widget once and precompute the values used by the matchers."""
+        name_text = self.name_search.text()
+        name_exact = self.name_exact_match.isChecked()
+        name_case_sensitive = self.name_case_sensitive.isChecked()
+        # Case-insensitive matching compares against the precomputed lowercased name
+        if not name_case_sensitive:
+            name_text = name_text.lower()
+        name_re = None
+        if name_text and not name_exact:
+            # Pattern matching with wildcards
+            name_re = re.compile(fnmatch.translate(name_text))
+        
+        # Dropdown values are compared against the lowercased project keys
+        language = self.language_combo.currentData()
+        category = self.category_combo.currentData()
+        
+        return {
+            'name': name_text,
+            'name_exact': name_exact,
+            'name_case_sensitive': name_case_sensitive,
+            'name_re': name_re,
+            'language': language.lower() if language else None,
+            'category': category.lower() if category else None,
+            'search_tags': frozenset(tag.strip().casefold() for tag in self.tags_search.text().split(',') if tag.strip()),
+            'tags_match_all': self.tags_match_all.isChecked(),
+            'file_extensions': tuple({
+                ext if ext.startswith('.') else '.' + ext
+                for ext in (ext.strip() for ext in self.file_types_search.text().split(','))
+                if ext
+            }),
+            'files_match_any': self.files_match_any.isChecked(),
+            'min_size': self.min_size_spin.value(),
+            'max_size': self.max_size_spin.value(),
+            'include_unknown_size': self.include_unknown_size.isChecked(),
+            'has_git': self.has_git_repo.isChecked(),
+            'is_favorite': self.is_favorite.isChecked(),
+            'has_notes': self.has_notes.isChecked(),
+            'modified_from': self.modified_from_date.date().toString(Qt.ISODate),
+            'modified_to': self.modified_to_date.date().toString(Qt.ISODate),
+        }
+    
+    def build_matcher(self, criteria: Dict[str, Any]):
+        """Return a match(project) function that checks only the active criteria.
         
-        # Language search
-        if self.language_combo.currentData():
-            if project.get('language', '').lower() != self.language_combo.currentData().lower():
-                return False
+        Predicates are tested from cheapest to most expensive so that most
+        non-matching projects are rejected before the file system is walked.
+        """
+        # Each predicate takes the project and its search keys
+        predicates = []
         
-        # Category search
-        if self.category_combo.currentData():
-            if project.get('category', '').lower() != self.category_combo.currentData().lower():
-                return False
+        # Project properties
+        if criteria['has_git']:
+            predicates.append(_has_git)
         
-        # Tags search
-        if self.tags_search.text():
-            if not self.matches_tags_criteria(project):
-                return False
+        if criteria['is_favorite']:
+            predicates.append(lambda p, k: p.get('is_favorite', False))
         
-        # File types search
-        if self.file_types_search.text():
-            if not self.matches_file_types_criteria(project):
-                return False
+        if criteria['has_notes']:
+            predicates.append(lambda p, k: bool(p.get('note')))
         
-        # Size filters
-        if not self.matches_size_criteria(project):
-            return False
+        # Size filters (always applied, so the default range still excludes projects above it)
+        min_size, max_size = criteria['min_size'], criteria['max_size']
+        include_unknown_size = criteria['include_unknown_size']
         
-        # Project properties
-        if self.has_git_repo.isChecked():
-            if not project.get('has_git', False):
-                return False
+        def matches_size(p, k):
+            size = p.get('size')
+            if size is None:
+                # Size not computed yet: don't walk the tree here
+                return include_unknown_size
+            return min_size <= size / 1024 <= max_size
         
-        if self.is_favorite.isChecked():
-            if not project.get('is_favorite', False):
-                return False
+        predicates.append(matches_size)
         
-        if self.has_notes.isChecked():
-            if not project.get('note'):
-                return False
+        # Date filters (projects without a modification date always pass)
+        modified_from, modified_to = criteria['modified_from'], criteria['modified_to']
         
-        # Date filters
-        if not self.matches_date_criteria(project):
-            return False
+        def matches_date(p, k):
+            mod_date = k['modified_iso']
+            return mod_date is None or modified_from <= mod_date <= modified_to
         
-        return True
-    
-    def matches_name_criteria(self, project: Dict[str, Any]) -> bool:
-        """Check if project matches name criteria."""
-        search_text = self.name_search.text()
-        project_name = project.get('name', '')
-        
-        if self.name_exact_match.isChecked():
-            if self.name_case_sensitive.isChecked():
-                return project_name == search_text
-            else:
-                return project_name.lower() == search_text.lower()
-        else:
-            # Pattern matching with wildcards
-            pattern = search_text.replace('*', '.*').replace('?', '.')
-            if self.name_case_sensitive.isChecked():
-                return re.match(f'^{pattern}$', project_name) is not None
+        predicates.append(matches_date)
+        
+        # Language and category search
+        language = criteria['language']
+        if language is not None:
+            predicates.append(lambda p, k: k['language_lower'] == language)
+        
+        category = criteria['category']
+        if category is not None:
+            predicates.append(lambda p, k: k['category_lower'] == category)
+        
+        # Tags search: all tags must be present (AND) or any of them (OR)
+        search_tags = criteria['search_tags']
+        if search_tags:
+            if criteria['tags_match_all']:
+                predicates.append(lambda p, k: search_tags.issubset(k['tags_lower']))
             else:
-                return re.match(f'^{pattern}$', project_name, re.IGNORECASE) is not None
-    
-    def matches_tags_criteria(self, project: Dict[str, Any]) -> bool:
-        """Check if project matches tags criteria."""
-        search_tags = [tag.strip() for tag in self.tags_search.text().split(',') if tag.strip()]
-        project_tags = project.get('tags', [])
+                predicates.append(lambda p, k: not search_tags.isdisjoint(k['tags_lower']))
         
-        if not search_tags:
+        # Name search
+        name = criteria['name']
+        if name:
+            if criteria['name_case_sensitive']:
+                project_name = lambda p, k: p.get('name', '')
+            else:
+                project_name = lambda p, k: k['name_lower']
+            if criteria['name_exact']:
+                predicates.append(lambda p, k: project_name(p, k) == name)
+            else:
+                name_match = criteria['name_re'].match
+                predicates.append(lambda p, k: name_match(project_name(p, k)) is not None)
+        
+        # File types search (walks the project tree, so it runs last)
+        if criteria['file_extensions']:
+            predicates.append(lambda p, k: self.matches_file_types_criteria(p, criteria))
+        
+        search_keys = self._search_keys
+        
+        def match(project):
+            # Projects added since the dialog loaded get their keys computed on the fly
+            keys = search_keys.get(project.get('path'))
+            if keys is None:
+                keys = _search_keys(project)
+            for predicate in predicates:
+                if not predicate(project, keys):
+                    return False
             return True
         
-        if self.tags_match_all.isChecked():
-            # All tags must be present (AND)
-            return all(tag.lower() in [pt.lower() for pt in project_tags] for tag in search_tags)
-        else:
-            # Any tag must be present (OR)
-            return any(tag.lower() in [pt.lower() for pt in project_tags] for tag in search_tags)
+        return match
     
-    def matches_file_types_criteria(self, project: Dict[str, Any]) -> bool:
+    def matches_file_types_criteria(self, project: Dict[str, Any], criteria: Dict[str, Any]) -> bool:
         """Check if project matches file types criteria."""
-        search_extensions = [ext.strip() for ext in self.file_types_search.text().split(',') if ext.strip()]
+        extensions = criteria['file_extensions']
         
-        if not search_extensions:
+        if not extensions:
             return True
         
-        project_path = Path(project.get('path', ''))
-        if not project_path.exists():
+        project_path = project.get('path', '')
+        if not os.path.exists(project_path):
             return False
         
-        found_files = []
-        for ext in search_extensions:
-            if not ext.startswith('.'):
-                ext = '.' + ext
-            
-            files = list(project_path.rglob(f'*{ext}'))
-            found_files.extend(files)
-        
-        if self.files_match_any.isChecked():
-            # Any file type must be present
-            return len(found_files) > 0
-        else:
-            # All file types must be present
-            return all(len(list(project_path.rglob(f'*{ext}' if ext.startswith('.') else f'*.{ext}'))) > 0 
-                      for ext in search_extensions)
-    
-    def matches_size_criteria(self, project: Dict[str, Any]) -> bool:
-        """Check if project matches size criteria."""
-        size_kb = project.get('size', 0) / 1024
+        match_any = criteria['files_match_any']
+        missing = set(extensions)
         
-        min_size = self.min_size_spin.value()
-        max_size = self.max_size_spin.value()
+        # Walk the tree once, stopping as soon as the outcome is known
+        for name in _iter_entry_names(project_path):
+            if not name.endswith(extensions):
+                continue
+            if match_any:
+                # Any file type must be present
+                return True
+            # All file types must be present
+            missing = {ext for ext in missing if not name.endswith(ext)}
+            if not missing:
+                return True
         
-        return min_size <= size_kb <= max_size
+        return False
     
-    def matches_date_criteria(self, project: Dict[str, Any]) -> bool:
-        """Check if project matches date criteria."""
-        modified_date = project.get('modified')
-        
-        if modified_date:
-            mod_date = datetime.fromisoformat(modified_date).date()
-            
-            from_date = self.modified_from_date.date().toPyDate()
-            to_date = self.modified_to_date.date().toPyDate()
-            
-            if not (from_date <= mod_date <= to_date):
-                return False
-        
-        return True
+    def done(self, result: int):
+        """Wait for a running search so its results are available after closing."""
+        if self.search_thread is not None:
+            self.search_thread.wait()
+            self.search_results = self.search_thread.results
+            # A completion already queued is ignored instead of reporting over the closed dialog
+            self.search_thread = None
+            self.search_button.setText(get_text('advanced_search.buttons.search', 'Search'))
+            self.search_button.setEnabled(True)
+        super().done(result)
     
     def get_search_results(self) -> List[Dict[str, Any]]:
         """Get the search results."""
@@ -496,7 +702,16 @@ class AdvancedSearchDialog(QDialog):
 
 def show_advanced_search(scanner, parent=None, lang='en') -> Optional[List[Dict[str, Any]]]:
     """Show the advanced search dialog and return results."""
-    dialog = AdvancedSearchDialog(scanner, parent, lang)
+    # Reuse the dialog built for this parent; only the dropdowns need refreshing
+    dialog = getattr(parent, '_advanced_search_dialog', None)
+    if dialog is None or dialog.scanner is not scanner or dialog.lang != lang:
+        dialog = AdvancedSearchDialog(scanner, parent, lang)
+        if parent is not None:
+            parent._advanced_search_dialog = dialog
+    else:
+        dialog.search_results = []
+        dialog.load_available_data()
+    
     if dialog.exec() == QDialog.Accepted:
         return dialog.get_search_results()
     return None
@@ -6,8 +6,9 @@ Provides UI for managing build systems and project dependencies.
 
 import os
 import json
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, TYPE_CHECKING
 from datetime import datetime
 
 from PySide6.QtWidgets import (
@@ -15,17 +16,191 @@ from PySide6.QtWidgets import (
     QLabel, QTextEdit, QTableWidget, QTableWidgetItem, QHeaderView,
     QPushButton, QComboBox, QLineEdit, QSpinBox, QCheckBox,
     QGroupBox, QFormLayout, QMessageBox, QProgressBar, QSplitter,
-    QTreeWidget, QTreeWidgetItem, QFileDialog, QDialogButtonBox
+    QFileDialog, QDialogButtonBox,
+    QStyledItemDelegate, QTreeView
 )
-from PySide6.QtCore import Qt, QThread, Signal, QTimer
-from PySide6.QtGui import QIcon, QFont
+from PySide6.QtCore import Qt, QThread, Signal, QTimer, QAbstractItemModel, QModelIndex, QSignalBlocker
+from PySide6.QtGui import QGuiApplication, QColor, QPalette
 
 from script.build_system import BuildSystemDetector
-from script.dependency_manager import DependencyManager
-from script.backup_system import BackupSystem
-from script.file_watcher import FileSystemWatcher
 from script.lang.lang_mgr import get_text
 
+if TYPE_CHECKING:
+    # Imported by the lazily built tabs themselves
+    from script.dependency_manager import DependencyManager
+    from script.backup_system import BackupSystem
+
+
+# Item roles, resolved once instead of on every data() call
+_DISPLAY_ROLE = Qt.DisplayRole
+_DEPENDENCY_ROLE = Qt.UserRole
+_STATUS_ROLE = Qt.UserRole + 1
+
+# "Build command N" labels, built once per process
+_BUILD_COMMAND_DESCRIPTIONS: List[str] = []
+
+
+def _build_command_description(index: int) -> str:
+    """Get the description shown for the build command in the given row."""
+    while len(_BUILD_COMMAND_DESCRIPTIONS) <= index:
+        _BUILD_COMMAND_DESCRIPTIONS.append(f"Build command {len(_BUILD_COMMAND_DESCRIPTIONS) + 1}")
+    return _BUILD_COMMAND_DESCRIPTIONS[index]
+
+
+@contextmanager
+def _batch_update(widget):
+    """Suspend repaints and sorting on an item view while it is filled in bulk."""
+    sorting = widget.isSortingEnabled()
+    widget.setUpdatesEnabled(False)
+    widget.setSortingEnabled(False)
+    try:
+        yield widget
+    finally:
+        widget.setSortingEnabled(sorting)
+        widget.setUpdatesEnabled(True)
+
+
+def _retire_thread(thread: Optional[QThread], owner: QWidget) -> None:
+    """Keep a superseded worker thread alive until it finishes, then delete it.
+    
+    Dropping the last reference to a running QThread aborts the process. The
+    owner adopts the thread instead; its late results are ignored by the
+    sender() checks of the owner's slots.
+    """
+    if thread is None or not thread.isRunning():
+        return
+    thread.setParent(owner)
+    thread.finished.connect(thread.deleteLater)
+
+
+def _dependency_key(dep: Dict[str, Any]) -> tuple:
+    """Identify a dependency entry across copies of the analysis (e.g. after a JSON round trip)."""
+    return (dep.get('package_manager'), dep.get('name'), dep.get('version_spec'),
+            dep.get('source_file'), dep.get('source_line'))
+
+
+class StatusDelegate(QStyledItemDelegate):
+    """Paints the dependency status column in a color chosen from the stored status."""
+    
+    STATUS_COLORS = {
+        'Outdated': QColor(Qt.red),
+        'Vulnerable': QColor(Qt.darkRed),
+    }
+    
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        color = self.STATUS_COLORS.get(index.data(_STATUS_ROLE))
+        if color is not None:
+            option.palette.setColor(QPalette.Text, color)
+
+
+class DependenciesModel(QAbstractItemModel):
+    """Two-level item model (package manager -> dependency) over the analysis dict.
+    
+    Rows are served straight from the analysis lists, so no per-cell items
+    are allocated. Package manager rows have an internal id of 0; dependency
+    rows store their package manager's row + 1.
+    """
+    
+    COLUMN_COUNT = 4
+    
+    def __init__(self, headers: List[str], parent=None):
+        super().__init__(parent)
+        self._headers = headers
+        self._pm_names: List[str] = []
+        self._pm_deps: List[List[Dict[str, Any]]] = []
+        self._outdated_keys = set()
+        self._vulnerable_names = set()
+    
+    def set_analysis(self, analysis: Dict[str, Any]):
+        """Replace the model contents with a new dependency analysis."""
+        self.beginResetModel()
+        dependencies = analysis.get('dependencies', {})
+        self._pm_names = list(dependencies)
+        self._pm_deps = list(dependencies.values())
+        # Status lookups are built once instead of scanning both lists per row
+        self._outdated_keys = {_dependency_key(dep) for dep in analysis.get('outdated_dependencies', [])}
+        self._vulnerable_names = {vuln['dependency'] for vuln in analysis.get('vulnerabilities', [])}
+        self.endResetModel()
+    
+    def add_package_manager(self, pm_name: str, dependencies: List[Dict[str, Any]]):
+        """Append one package manager and its dependencies, before the full analysis is available."""
+        row = len(self._pm_names)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._pm_names.append(pm_name)
+        self._pm_deps.append(dependencies)
+        self.endInsertRows()
+    
+    def dependency_status(self, dep: Dict[str, Any]) -> str:
+        """Get the status shown for a dependency."""
+        if _dependency_key(dep) in self._outdated_keys:
+            return "Outdated"
+        if dep.get('name') in self._vulnerable_names:
+            return "Vulnerable"
+        return "Up to date"
+    
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        if not parent.isValid():
+            return self.createIndex(row, column, 0)
+        return self.createIndex(row, column, parent.row() + 1)
+    
+    def parent(self, index: Optional[QModelIndex] = None):
+        if index is None:
+            return super().parent()
+        if not index.isValid() or index.internalId() == 0:
+            return QModelIndex()
+        return self.createIndex(index.internalId() - 1, 0, 0)
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if not parent.isValid():
+            return len(self._pm_names)
+        if parent.internalId() == 0 and parent.column() == 0:
+            return len(self._pm_deps[parent.row()])
+        return 0
+    
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return self.COLUMN_COUNT
+    
+    def headerData(self, section: int, orientation, role: int = Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole and 0 <= section < len(self._headers):
+            return self._headers[section]
+        return None
+    
+    def data(self, index: QModelIndex, role: int = _DISPLAY_ROLE):
+        if not index.isValid():
+            return None
+        
+        column = index.column()
+        pm_row = index.internalId() - 1
+        if pm_row < 0:
+            # Package manager row
+            if role == _DISPLAY_ROLE:
+                if column == 0:
+                    return self._pm_names[index.row()].upper()
+                if column == 1:
+                    return f"{len(self._pm_deps[index.row()])} packages"
+                return ""
+            return None
+        
+        dep = self._pm_deps[pm_row][index.row()]
+        if role == _DISPLAY_ROLE:
+            if column == 0:
+                return dep.get('name', 'Unknown')
+            if column == 1:
+                return dep.get('current_version', dep.get('version_spec', ''))
+            if column == 2:
+                return dep.get('type', 'Unknown')
+            return self.dependency_status(dep)
+        if role == _DEPENDENCY_ROLE and column == 0:
+            # Dependency data for the update/remove actions
+            return dep
+        if role == _STATUS_ROLE and column == 3:
+            # Status used by StatusDelegate to pick the text color
+            return self.dependency_status(dep)
+        return None
+
 
 class BuildSystemTab(QWidget):
     """Tab for displaying and managing build system information."""
@@ -36,7 +211,14 @@ class BuildSystemTab(QWidget):
         self.build_system_info = build_system_info
         self.lang = lang
         self.build_detector = BuildSystemDetector()
+        self.detect_thread = None
+        self._notify_detection = False
+        self._clipboard = QGuiApplication.clipboard()
         self.init_ui()
+        
+        # Projects loaded without build system information are detected in the background
+        if not build_system_info:
+            self.start_detection(notify=False)
     
     def init_ui(self):
         layout = QVBoxLayout()
@@ -78,11 +260,7 @@ class BuildSystemTab(QWidget):
         self.commands_table.horizontalHeader().setStretchLastSection(True)
         
         # Populate commands
-        commands = self.build_system_info.get('build_commands', [])
-        self.commands_table.setRowCount(len(commands))
-        for i, command in enumerate(commands):
-            self.commands_table.setItem(i, 0, QTableWidgetItem(command))
-            self.commands_table.setItem(i, 1, QTableWidgetItem(f"Build command {i+1}"))
+        self.populate_commands_table(self.build_system_info.get('build_commands', []))
         
         commands_layout.addWidget(self.commands_table)
         commands_group.setLayout(commands_layout)
@@ -107,29 +285,78 @@ class BuildSystemTab(QWidget):
     
     def refresh_build_system(self):
         """Refresh build system information."""
-        try:
-            new_info = self.build_detector.detect_build_system(self.project_path)
-            self.build_system_info = new_info
-            
-            # Update UI
-            self.type_label.setText(new_info.get('type', 'Unknown'))
-            self.desc_label.setText(new_info.get('description', 'No description'))
-            
-            files = new_info.get('files', [])
-            self.files_text.setPlainText('\n'.join(files) if files else 'No files found')
-            
-            # Update commands table
-            commands = new_info.get('build_commands', [])
-            self.commands_table.setRowCount(len(commands))
-            for i, command in enumerate(commands):
-                self.commands_table.setItem(i, 0, QTableWidgetItem(command))
-                self.commands_table.setItem(i, 1, QTableWidgetItem(f"Build command {i+1}"))
-            
+        self.start_detection(notify=True)
+    
+    def start_detection(self, notify: bool):
+        """Detect the build system in a separate thread."""
+        if self.detect_thread is not None and self.detect_thread.isRunning():
+            self._notify_detection = self._notify_detection or notify
+            return
+        
+        self._notify_detection = notify
+        self.refresh_btn.setEnabled(False)
+        self.detect_thread = BuildSystemDetectThread(self.project_path, self.build_detector)
+        self.detect_thread.detection_complete.connect(self.on_detection_complete)
+        self.detect_thread.detection_error.connect(self.on_detection_error)
+        self.detect_thread.start()
+    
+    def on_detection_complete(self, build_system_info: Dict[str, Any]):
+        """Handle completed build system detection."""
+        if self.sender() is not self.detect_thread:
+            return
+        self.refresh_btn.setEnabled(True)
+        self.show_build_system_info(build_system_info)
+        
+        if self._notify_detection:
             QMessageBox.information(self, get_text('build_system.refresh_success', 'Success', lang=self.lang),
                                   get_text('build_system.refreshed', 'Build system information refreshed', lang=self.lang))
-        except Exception as e:
+    
+    def on_detection_error(self, error: str):
+        """Handle build system detection error."""
+        if self.sender() is not self.detect_thread:
+            return
+        self.refresh_btn.setEnabled(True)
+        
+        if self._notify_detection:
             QMessageBox.warning(self, get_text('build_system.refresh_error', 'Error', lang=self.lang),
-                              f"Failed to refresh build system: {str(e)}")
+                              f"Failed to refresh build system: {error}")
+    
+    def show_build_system_info(self, build_system_info: Dict[str, Any]):
+        """Show the given build system information."""
+        self.build_system_info = build_system_info
+        self.type_label.setText(build_system_info.get('type', 'Unknown'))
+        self.desc_label.setText(build_system_info.get('description', 'No description'))
+        
+        files = build_system_info.get('files', [])
+        self.files_text.setPlainText('\n'.join(files) if files else 'No files found')
+        
+        # Update commands table
+        self.populate_commands_table(build_system_info.get('build_commands', []))
+    
+    def reload(self, project_path: str, build_system_info: Dict[str, Any]):
+        """Show the build system of another project."""
+        self.project_path = project_path
+        
+        # Results of a detection still running for the previous project are ignored
+        _retire_thread(self.detect_thread, self)
+        self.detect_thread = None
+        self.refresh_btn.setEnabled(True)
+        self.show_build_system_info(build_system_info)
+        if not build_system_info:
+            self.start_detection(notify=False)
+    
+    def populate_commands_table(self, commands: List[str]):
+        """Fill the commands table with one row per build command."""
+        with _batch_update(self.commands_table):
+            self.commands_table.setRowCount(len(commands))
+            for i, command in enumerate(commands):
+                # Reuse the items of rows kept from the previous fill; descriptions only depend on the row
+                command_item = self.commands_table.item(i, 0)
+                if command_item is None:
+                    self.commands_table.setItem(i, 0, QTableWidgetItem(command))
+                    self.commands_table.setItem(i, 1, QTableWidgetItem(_build_command_description(i)))
+                else:
+                    command_item.setText(command)
     
     def copy_selected_command(self):
         """Copy selected command to clipboard."""
@@ -138,8 +365,7 @@ class BuildSystemTab(QWidget):
             command_item = self.commands_table.item(current_row, 0)
             if command_item:
                 command = command_item.text()
-                clipboard = self.commands_table.clipboard()
-                clipboard.setText(command)
+                self._clipboard.setText(command)
                 QMessageBox.information(self, get_text('build_system.copied', 'Copied', lang=self.lang),
                                       get_text('build_system.command_copied', 'Command copied to clipboard', lang=self.lang))
 
@@ -147,16 +373,99 @@ class BuildSystemTab(QWidget):
 class DependenciesTab(QWidget):
     """Tab for displaying and managing project dependencies."""
     
+    # Emitted from the file watcher thread when a manifest or lockfile changes
+    manifests_changed = Signal()
+    
+    # Lockfiles that are not listed as package manager files but still change the analysis
+    EXTRA_WATCHED_FILES = {'poetry.lock', 'yarn.lock', 'Pipfile', 'Pipfile.lock'}
+    
     def __init__(self, project_path: str, lang='en'):
         super().__init__()
+        # Loaded with the tab rather than with the dialog module
+        from script.dependency_manager import DependencyManager
+        
         self.project_path = project_path
         self.lang = lang
         self.dependency_manager = DependencyManager()
-        self.current_analysis = {}
+        self.dependency_thread = None
+        self.op_thread = None
+        self.file_watcher = None
+        self._loaded = False
+        self._partial_results = False
+        self._reload_pending = False
         self.init_ui()
         
-        # Load dependencies asynchronously
-        QTimer.singleShot(100, self.load_dependencies)
+        # Reload only when a manifest or lockfile actually changes on disk
+        self._watched_files = self.EXTRA_WATCHED_FILES.union(
+            *(info['files'] for info in self.dependency_manager.package_managers.values()))
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(500)  # Coalesce bursts of events from a single save
+        self._reload_timer.timeout.connect(self.on_manifests_changed)
+        self.manifests_changed.connect(self._reload_timer.start)
+        self.start_watching()
+    
+    def showEvent(self, event):
+        """Load dependencies the first time the tab is shown."""
+        super().showEvent(event)
+        if not self._loaded and not (self.dependency_thread is not None and self.dependency_thread.isRunning()):
+            self.load_dependencies()
+    
+    def _on_file_change(self, path: str, event_type: str, raw_event_type: str):
+        """Forward changes to top-level manifests and lockfiles to the UI thread."""
+        if (os.path.basename(path) in self._watched_files
+                and os.path.dirname(os.path.abspath(path)) == os.path.abspath(self.project_path)):
+            self.manifests_changed.emit()
+    
+    def on_manifests_changed(self):
+        """Drop the memoized analysis and reload dependencies."""
+        # Reload once the running analysis or operation has finished
+        if any(thread is not None and thread.isRunning() for thread in (self.dependency_thread, self.op_thread)):
+            self._reload_pending = True
+            return
+        self.dependency_manager.invalidate_analysis(self.project_path)
+        self.load_dependencies()
+    
+    def start_watching(self):
+        """Watch the project for manifest changes."""
+        if self.file_watcher is not None:
+            return
+        from script.file_watcher import FileSystemWatcher
+        
+        self.file_watcher = FileSystemWatcher()
+        self.file_watcher.add_change_callback(self._on_file_change)
+        # Only top-level manifests matter; skip walking node_modules, .venv, .git, ...
+        if self.file_watcher.watch_project(self.project_path, recursive=False):
+            self.file_watcher.start()
+    
+    def stop_watching(self):
+        """Stop watching the project for manifest changes."""
+        self._reload_timer.stop()
+        if self.file_watcher is not None:
+            self.file_watcher.stop()
+            self.file_watcher = None
+        # Changes are no longer tracked, so check again the next time the tab is shown
+        self._loaded = False
+    
+    def reload(self, project_path: str):
+        """Show the dependencies of another project."""
+        watching = self.file_watcher is not None
+        self.stop_watching()
+        self.project_path = project_path
+        
+        # Results of an analysis still running for the previous project are ignored
+        _retire_thread(self.dependency_thread, self)
+        self.dependency_thread = None
+        self._reload_pending = False
+        self.progress_bar.setVisible(False)
+        self.set_buttons_enabled(True)
+        self.dependencies_model.set_analysis({})
+        self.stats_label.clear()
+        
+        if watching:
+            self.start_watching()
+        if self.isVisible():
+            self.load_dependencies()
     
     def init_ui(self):
         layout = QVBoxLayout()
@@ -167,17 +476,20 @@ class DependenciesTab(QWidget):
         layout.addWidget(self.progress_bar)
         
         # Dependencies tree
-        self.dependencies_tree = QTreeWidget()
-        self.dependencies_tree.setHeaderLabels([
+        self.dependencies_model = DependenciesModel([
             get_text('dependencies.package', 'Package', lang=self.lang),
             get_text('dependencies.version', 'Version:', lang=self.lang),
             get_text('dependencies.type', 'Type', lang=self.lang),
             get_text('dependencies.status', 'Status', lang=self.lang)
-        ])
+        ], self)
+        self.dependencies_tree = QTreeView()
+        self.dependencies_tree.setModel(self.dependencies_model)
         self.dependencies_tree.setColumnWidth(0, 200)
         self.dependencies_tree.setColumnWidth(1, 150)
         self.dependencies_tree.setColumnWidth(2, 100)
         self.dependencies_tree.setColumnWidth(3, 100)
+        self.status_delegate = StatusDelegate(self.dependencies_tree)
+        self.dependencies_tree.setItemDelegateForColumn(3, self.status_delegate)
         
         layout.addWidget(self.dependencies_tree)
         
@@ -216,75 +528,107 @@ class DependenciesTab(QWidget):
         self.progress_bar.setRange(0, 0)  # Indeterminate progress
         
         # Disable buttons during loading
-        self.refresh_btn.setEnabled(False)
-        self.update_btn.setEnabled(False)
-        self.install_btn.setEnabled(False)
-        self.remove_btn.setEnabled(False)
+        self.set_buttons_enabled(False)
         
         # Load in a separate thread to avoid blocking UI
+        self._partial_results = False
         self.dependency_thread = DependencyAnalysisThread(self.project_path, self.dependency_manager)
+        self.dependency_thread.partial_ready.connect(self.on_partial_ready)
         self.dependency_thread.analysis_complete.connect(self.on_analysis_complete)
         self.dependency_thread.analysis_error.connect(self.on_analysis_error)
         self.dependency_thread.start()
     
+    def on_partial_ready(self, pm_name: str, dependencies: List[Dict[str, Any]]):
+        """Show a package manager's dependencies as soon as they are analyzed."""
+        if self.sender() is not self.dependency_thread:
+            return
+        if not self._partial_results:
+            # Drop the previous analysis before the first partial result arrives
+            self._partial_results = True
+            self.dependencies_model.set_analysis({})
+        self.dependencies_model.add_package_manager(pm_name, dependencies)
+    
     def on_analysis_complete(self, analysis: Dict[str, Any]):
         """Handle completed dependency analysis."""
-        self.current_analysis = analysis
+        if self.sender() is not self.dependency_thread:
+            return
+        self._loaded = True
         self.populate_dependencies_tree(analysis)
         self.update_statistics(analysis)
         
         self.progress_bar.setVisible(False)
-        self.refresh_btn.setEnabled(True)
-        self.update_btn.setEnabled(True)
-        self.install_btn.setEnabled(True)
-        self.remove_btn.setEnabled(True)
+        self.set_buttons_enabled(True)
+        if self._reload_pending:
+            self._reload_pending = False
+            self.on_manifests_changed()
     
     def on_analysis_error(self, error: str):
         """Handle dependency analysis error."""
+        if self.sender() is not self.dependency_thread:
+            return
         self.progress_bar.setVisible(False)
-        self.refresh_btn.setEnabled(True)
-        self.update_btn.setEnabled(True)
-        self.install_btn.setEnabled(True)
-        self.remove_btn.setEnabled(True)
+        self.set_buttons_enabled(True)
         
         QMessageBox.warning(self, get_text('dependencies.analysis_error', 'Analysis Error', lang=self.lang),
                           f"Failed to analyze dependencies: {error}")
+        if self._reload_pending:
+            self._reload_pending = False
+            self.on_manifests_changed()
+    
+    def set_buttons_enabled(self, enabled: bool):
+        """Enable or disable the dependency action buttons."""
+        self.refresh_btn.setEnabled(enabled)
+        self.update_btn.setEnabled(enabled)
+        self.install_btn.setEnabled(enabled)
+        self.remove_btn.setEnabled(enabled)
+    
+    def run_operation(self, operation: str, package_manager: str, dependencies: List[str]):
+        """Run a dependency operation in a separate thread."""
+        self.progress_bar.setVisible(True)
+        self.progress_bar.setRange(0, 0)  # Indeterminate progress
+        self.set_buttons_enabled(False)
+        
+        self.op_thread = DependencyOpThread(self.dependency_manager, operation, self.project_path,
+                                            package_manager, dependencies)
+        self.op_thread.finished_ok.connect(self._on_op_done)
+        self.op_thread.start()
+    
+    def _on_op_done(self, success: bool, error: str):
+        """Handle a finished dependency operation."""
+        self.progress_bar.setVisible(False)
+        self.set_buttons_enabled(True)
+        
+        operation = self.op_thread.operation
+        if operation == 'update':
+            if success:
+                QMessageBox.information(self, get_text('dependencies.update_success', 'Success', lang=self.lang),
+                                      get_text('dependencies.updated', 'Dependencies updated successfully', lang=self.lang))
+            else:
+                QMessageBox.warning(self, get_text('dependencies.update_error', 'Error', lang=self.lang),
+                                  get_text('dependencies.update_failed', 'Failed to update dependencies', lang=self.lang))
+        elif operation == 'install':
+            if success:
+                QMessageBox.information(self, get_text('dependencies.install_success', 'Success', lang=self.lang),
+                                      get_text('dependencies.installed', 'Dependency installed successfully', lang=self.lang))
+            else:
+                QMessageBox.warning(self, get_text('dependencies.install_error', 'Error', lang=self.lang),
+                                  get_text('dependencies.install_failed', 'Failed to install dependency', lang=self.lang))
+        elif operation == 'remove':
+            if success:
+                QMessageBox.information(self, get_text('dependencies.remove_success', 'Success', lang=self.lang),
+                                      get_text('dependencies.removed', 'Dependencies removed successfully', lang=self.lang))
+            else:
+                QMessageBox.warning(self, get_text('dependencies.remove_error', 'Error', lang=self.lang),
+                                  get_text('dependencies.remove_failed', 'Failed to remove dependencies', lang=self.lang))
+        
+        if success or self._reload_pending:
+            self._reload_pending = False
+            self.dependency_manager.invalidate_analysis(self.project_path)
+            self.load_dependencies()  # Refresh
     
     def populate_dependencies_tree(self, analysis: Dict[str, Any]):
         """Populate the dependencies tree with analysis results."""
-        self.dependencies_tree.clear()
-        
-        dependencies = analysis.get('dependencies', {})
-        outdated_deps = analysis.get('outdated_dependencies', [])
-        vulnerabilities = analysis.get('vulnerabilities', [])
-        
-        for pm_name, pm_deps in dependencies.items():
-            # Create package manager item
-            pm_item = QTreeWidgetItem(self.dependencies_tree)
-            pm_item.setText(0, pm_name.upper())
-            pm_item.setText(1, f"{len(pm_deps)} packages")
-            pm_item.setExpanded(True)
-            
-            # Add dependencies
-            for dep in pm_deps:
-                dep_item = QTreeWidgetItem(pm_item)
-                dep_item.setText(0, dep.get('name', 'Unknown'))
-                dep_item.setText(1, dep.get('current_version', dep.get('version_spec', '')))
-                dep_item.setText(2, dep.get('type', 'Unknown'))
-                
-                # Determine status
-                status = "Up to date"
-                if dep in outdated_deps:
-                    status = "Outdated"
-                    dep_item.setForeground(3, Qt.red)
-                elif any(vuln['dependency'] == dep['name'] for vuln in vulnerabilities):
-                    status = "Vulnerable"
-                    dep_item.setForeground(3, Qt.darkRed)
-                
-                dep_item.setText(3, status)
-                
-                # Store dependency data for later use
-                dep_item.setData(0, Qt.UserRole, dep)
+        self.dependencies_model.set_analysis(analysis)
     
     def update_statistics(self, analysis: Dict[str, Any]):
         """Update statistics label."""
@@ -298,8 +642,8 @@ class DependenciesTab(QWidget):
     
     def update_selected_dependencies(self):
         """Update selected dependencies."""
-        selected_items = self.dependencies_tree.selectedItems()
-        if not selected_items:
+        selected_rows = self.dependencies_tree.selectionModel().selectedRows()
+        if not selected_rows:
             QMessageBox.warning(self, get_text('dependencies.no_selection', 'No Selection', lang=self.lang),
                               get_text('dependencies.select_deps', 'Please select dependencies to update', lang=self.lang))
             return
@@ -307,8 +651,8 @@ class DependenciesTab(QWidget):
         dependencies = []
         package_manager = None
         
-        for item in selected_items:
-            dep_data = item.data(0, Qt.UserRole)
+        for index in selected_rows:
+            dep_data = index.data(_DEPENDENCY_ROLE)
             if dep_data:
                 dependencies.append(dep_data['name'])
                 package_manager = dep_data.get('package_manager')
@@ -324,16 +668,7 @@ class DependenciesTab(QWidget):
                                    QMessageBox.Yes | QMessageBox.No)
         
         if reply == QMessageBox.Yes:
-            success = self.dependency_manager.update_dependencies(
-                self.project_path, package_manager, dependencies)
-            
-            if success:
-                QMessageBox.information(self, get_text('dependencies.update_success', 'Success', lang=self.lang),
-                                      get_text('dependencies.updated', 'Dependencies updated successfully', lang=self.lang))
-                self.load_dependencies()  # Refresh
-            else:
-                QMessageBox.warning(self, get_text('dependencies.update_error', 'Error', lang=self.lang),
-                                  get_text('dependencies.update_failed', 'Failed to update dependencies', lang=self.lang))
+            self.run_operation('update', package_manager, dependencies)
     
     def install_new_dependency(self):
         """Install a new dependency."""
@@ -376,21 +711,12 @@ class DependenciesTab(QWidget):
             if version:
                 dep_spec = f"{name}{version}"
             
-            success = self.dependency_manager.install_dependencies(
-                self.project_path, pm_name, [dep_spec])
-            
-            if success:
-                QMessageBox.information(self, get_text('dependencies.install_success', 'Success', lang=self.lang),
-                                      get_text('dependencies.installed', 'Dependency installed successfully', lang=self.lang))
-                self.load_dependencies()  # Refresh
-            else:
-                QMessageBox.warning(self, get_text('dependencies.install_error', 'Error', lang=self.lang),
-                                  get_text('dependencies.install_failed', 'Failed to install dependency', lang=self.lang))
+            self.run_operation('install', pm_name, [dep_spec])
     
     def remove_selected_dependencies(self):
         """Remove selected dependencies."""
-        selected_items = self.dependencies_tree.selectedItems()
-        if not selected_items:
+        selected_rows = self.dependencies_tree.selectionModel().selectedRows()
+        if not selected_rows:
             QMessageBox.warning(self, get_text('dependencies.no_selection', 'No Selection', lang=self.lang),
                               get_text('dependencies.select_deps', 'Please select dependencies to remove', lang=self.lang))
             return
@@ -398,8 +724,8 @@ class DependenciesTab(QWidget):
         dependencies = []
         package_manager = None
         
-        for item in selected_items:
-            dep_data = item.data(0, Qt.UserRole)
+        for index in selected_rows:
+            dep_data = index.data(_DEPENDENCY_ROLE)
             if dep_data:
                 dependencies.append(dep_data['name'])
                 package_manager = dep_data.get('package_manager')
@@ -415,55 +741,110 @@ class DependenciesTab(QWidget):
                                    QMessageBox.Yes | QMessageBox.No)
         
         if reply == QMessageBox.Yes:
-            success = self.dependency_manager.remove_dependencies(
-                self.project_path, package_manager, dependencies)
-            
-            if success:
-                QMessageBox.information(self, get_text('dependencies.remove_success', 'Success', lang=self.lang),
-                                      get_text('dependencies.removed', 'Dependencies removed successfully', lang=self.lang))
-                self.load_dependencies()  # Refresh
-            else:
-                QMessageBox.warning(self, get_text('dependencies.remove_error', 'Error', lang=self.lang),
-                                  get_text('dependencies.remove_failed', 'Failed to remove dependencies', lang=self.lang))
+            self.run_operation('remove', package_manager, dependencies)
 
 
 class BackupTab(QWidget):
     """Tab for managing project backups."""
     
+    # Emitted from the file watcher thread when the backup directory changes
+    backups_changed = Signal()
+    
     def __init__(self, project_path: str, lang='en'):
         super().__init__()
+        # Loaded with the tab rather than with the dialog module
+        from script.backup_system import BackupSystem
+        
         self.project_path = project_path
         self.lang = lang
         self.backup_system = BackupSystem()
+        self.backup_list_thread = None
+        self.op_thread = None
+        self.file_watcher = None
+        self._loaded = False
         self.init_ui()
         
-        # Load backup list
+        # Reload the backup list only when the backup directory changes on disk
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(500)  # Coalesce bursts of events from a single backup
+        self._reload_timer.timeout.connect(self.on_backups_changed)
+        self.backups_changed.connect(self._reload_timer.start)
+        self.start_watching()
+    
+    def showEvent(self, event):
+        """Load the backup list the first time the tab is shown."""
+        super().showEvent(event)
+        if not self._loaded:
+            self.load_backup_list()
+    
+    def on_backups_changed(self):
+        """Reload backup metadata from disk and refresh the list."""
+        # A running operation updates the metadata itself and refreshes the list when done
+        if self.op_thread is not None and self.op_thread.isRunning():
+            return
+        self.backup_system.reload_metadata()
         self.load_backup_list()
     
+    def start_watching(self):
+        """Watch the backup directory for changes."""
+        if self.file_watcher is not None:
+            return
+        from script.file_watcher import FileSystemWatcher
+        
+        self.file_watcher = FileSystemWatcher()
+        self.file_watcher.add_change_callback(lambda path, event_type, raw_event_type: self.backups_changed.emit())
+        if self.file_watcher.watch_project(str(self.backup_system.backup_dir), recursive=False):
+            self.file_watcher.start()
+    
+    def stop_watching(self):
+        """Stop watching the backup directory."""
+        self._reload_timer.stop()
+        if self.file_watcher is not None:
+            self.file_watcher.stop()
+            self.file_watcher = None
+        # Changes are no longer tracked, so reload the list the next time the tab is shown
+        self._loaded = False
+    
+    def reload(self, project_path: str):
+        """Switch to another project; backups are shared, so the list is kept."""
+        self.project_path = project_path
+    
     def init_ui(self):
         layout = QVBoxLayout()
         
-        # Backup configuration group
+        # Progress bar for loading
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setVisible(False)
+        layout.addWidget(self.progress_bar)
+        
+        # Backup configuration group (read the configuration once)
+        config = self.backup_system.get_config()
         config_group = QGroupBox(get_text('backup.configuration', 'Backup Configuration', lang=self.lang))
         config_layout = QFormLayout()
         
+        # Initial values are set with signals blocked
         self.auto_backup_cb = QCheckBox()
-        self.auto_backup_cb.setChecked(self.backup_system.config.get('auto_backup', True))
+        with QSignalBlocker(self.auto_backup_cb):
+            self.auto_backup_cb.setChecked(config.get('auto_backup', True))
         config_layout.addRow(get_text('backup.auto_backup', 'Automatic Backup:', lang=self.lang), self.auto_backup_cb)
         
         self.interval_spin = QSpinBox()
         self.interval_spin.setRange(1, 168)  # 1 hour to 1 week
-        self.interval_spin.setValue(self.backup_system.config.get('backup_interval_hours', 24))
+        with QSignalBlocker(self.interval_spin):
+            self.interval_spin.setValue(config.get('backup_interval_hours', 24))
         self.interval_spin.setSuffix(get_text('backup.hours', ' hours', lang=self.lang))
         config_layout.addRow(get_text('backup.interval', 'Backup Interval:', lang=self.lang), self.interval_spin)
         
         self.max_backups_spin = QSpinBox()
         self.max_backups_spin.setRange(1, 100)
-        self.max_backups_spin.setValue(self.backup_system.config.get('max_backups', 10))
+        with QSignalBlocker(self.max_backups_spin):
+            self.max_backups_spin.setValue(config.get('max_backups', 10))
         config_layout.addRow(get_text('backup.max_backups', 'Maximum Backups:', lang=self.lang), self.max_backups_spin)
         
         self.compress_cb = QCheckBox()
-        self.compress_cb.setChecked(self.backup_system.config.get('compress_backups', True))
+        with QSignalBlocker(self.compress_cb):
+            self.compress_cb.setChecked(config.get('compress_backups', True))
         config_layout.addRow(get_text('backup.compress', 'Compress Backups:', lang=self.lang), self.compress_cb)
         
         config_group.setLayout(config_layout)
@@ -514,34 +895,91 @@ class BackupTab(QWidget):
     
     def load_backup_list(self):
         """Load the list of existing backups."""
-        backups = self.backup_system.list_backups()
+        if self.backup_list_thread is not None and self.backup_list_thread.isRunning():
+            return
         
-        self.backup_table.setRowCount(len(backups))
-        for i, backup in enumerate(backups):
-            self.backup_table.setItem(i, 0, QTableWidgetItem(backup.get('name', '')))
-            self.backup_table.setItem(i, 1, QTableWidgetItem(backup.get('created', '')))
-            
-            size_bytes = backup.get('size', 0)
-            size_mb = size_bytes / (1024 * 1024)
-            self.backup_table.setItem(i, 2, QTableWidgetItem(f"{size_mb:.2f} MB"))
-            
-            compressed = backup.get('compressed', False)
-            self.backup_table.setItem(i, 3, QTableWidgetItem("Yes" if compressed else "No"))
+        self.progress_bar.setVisible(True)
+        self.progress_bar.setRange(0, 0)  # Indeterminate progress
+        
+        # Load in a separate thread to avoid blocking UI
+        self.backup_list_thread = BackupListThread(self.backup_system)
+        self.backup_list_thread.backups_ready.connect(self.on_backups_ready)
+        self.backup_list_thread.start()
     
-    def create_backup(self):
-        """Create a new backup."""
-        try:
-            backup_file = self.backup_system.create_backup()
-            if backup_file:
+    def on_backups_ready(self, backups: List[Dict[str, Any]]):
+        """Populate the backup table with the loaded backups."""
+        self._loaded = True
+        self.progress_bar.setVisible(False)
+        
+        table = self.backup_table
+        with _batch_update(table):
+            table.setRowCount(len(backups))
+            set_item = table.setItem
+            item = QTableWidgetItem
+            for i, backup in enumerate(backups):
+                set_item(i, 0, item(backup.get('name', '')))
+                set_item(i, 1, item(backup.get('created', '')))
+                
+                size_bytes = backup.get('size', 0)
+                size_mb = size_bytes / (1024 * 1024)
+                set_item(i, 2, item(f"{size_mb:.2f} MB"))
+                
+                compressed = backup.get('compressed', False)
+                set_item(i, 3, item("Yes" if compressed else "No"))
+    
+    def set_buttons_enabled(self, enabled: bool):
+        """Enable or disable the backup action buttons."""
+        self.create_btn.setEnabled(enabled)
+        self.restore_btn.setEnabled(enabled)
+        self.delete_btn.setEnabled(enabled)
+    
+    def run_operation(self, operation: str, *args):
+        """Run a backup operation in a separate thread."""
+        self.progress_bar.setVisible(True)
+        self.progress_bar.setRange(0, 0)  # Indeterminate progress
+        self.set_buttons_enabled(False)
+        
+        self.op_thread = BackupOpThread(self.backup_system, operation, *args)
+        self.op_thread.finished_ok.connect(self._on_op_done)
+        self.op_thread.start()
+    
+    def _on_op_done(self, success: bool, error: str):
+        """Handle a finished backup operation."""
+        self.progress_bar.setVisible(False)
+        self.set_buttons_enabled(True)
+        
+        operation = self.op_thread.operation
+        if operation == 'create':
+            if success:
                 QMessageBox.information(self, get_text('backup.create_success', 'Success', lang=self.lang),
                                       get_text('backup.created', 'Backup created successfully', lang=self.lang))
-                self.load_backup_list()  # Refresh
+            elif error:
+                QMessageBox.warning(self, get_text('backup.create_error', 'Error', lang=self.lang),
+                                  f"Failed to create backup: {error}")
             else:
                 QMessageBox.warning(self, get_text('backup.create_error', 'Error', lang=self.lang),
                                   get_text('backup.create_failed', 'Failed to create backup', lang=self.lang))
-        except Exception as e:
-            QMessageBox.warning(self, get_text('backup.create_error', 'Error', lang=self.lang),
-                              f"Failed to create backup: {str(e)}")
+        elif operation == 'restore':
+            if success:
+                QMessageBox.information(self, get_text('backup.restore_success', 'Success', lang=self.lang),
+                                      get_text('backup.restored', 'Backup restored successfully', lang=self.lang))
+            else:
+                QMessageBox.warning(self, get_text('backup.restore_error', 'Error', lang=self.lang),
+                                  get_text('backup.restore_failed', 'Failed to restore backup', lang=self.lang))
+        elif operation == 'delete':
+            if success:
+                QMessageBox.information(self, get_text('backup.delete_success', 'Success', lang=self.lang),
+                                      get_text('backup.deleted', 'Backup deleted successfully', lang=self.lang))
+            else:
+                QMessageBox.warning(self, get_text('backup.delete_error', 'Error', lang=self.lang),
+                                  get_text('backup.delete_failed', 'Failed to delete backup', lang=self.lang))
+        
+        if success and operation != 'restore':
+            self.load_backup_list()  # Refresh
+    
+    def create_backup(self):
+        """Create a new backup."""
+        self.run_operation('create')
     
     def restore_selected_backup(self):
         """Restore the selected backup."""
@@ -562,13 +1000,7 @@ class BackupTab(QWidget):
             # Get restore path
             restore_path = QFileDialog.getExistingDirectory(self, get_text('backup.select_restore_path', 'Select Restore Path', lang=self.lang))
             if restore_path:
-                success = self.backup_system.restore_backup(backup_name, restore_path)
-                if success:
-                    QMessageBox.information(self, get_text('backup.restore_success', 'Success', lang=self.lang),
-                                          get_text('backup.restored', 'Backup restored successfully', lang=self.lang))
-                else:
-                    QMessageBox.warning(self, get_text('backup.restore_error', 'Error', lang=self.lang),
-                                      get_text('backup.restore_failed', 'Failed to restore backup', lang=self.lang))
+                self.run_operation('restore', backup_name, restore_path)
     
     def delete_selected_backup(self):
         """Delete the selected backup."""
@@ -586,14 +1018,7 @@ class BackupTab(QWidget):
                                    QMessageBox.Yes | QMessageBox.No)
         
         if reply == QMessageBox.Yes:
-            success = self.backup_system.delete_backup(backup_name)
-            if success:
-                QMessageBox.information(self, get_text('backup.delete_success', 'Success', lang=self.lang),
-                                      get_text('backup.deleted', 'Backup deleted successfully', lang=self.lang))
-                self.load_backup_list()  # Refresh
-            else:
-                QMessageBox.warning(self, get_text('backup.delete_error', 'Error', lang=self.lang),
-                                  get_text('backup.delete_failed', 'Failed to delete backup', lang=self.lang))
+            self.run_operation('delete', backup_name)
     
     def save_config(self):
         """Save backup configuration."""
@@ -613,13 +1038,33 @@ class BackupTab(QWidget):
                               get_text('backup.config_failed', 'Failed to update backup configuration', lang=self.lang))
 
 
+class BuildSystemDetectThread(QThread):
+    """Thread for detecting a project's build system without blocking the UI."""
+    
+    detection_complete = Signal(dict)
+    detection_error = Signal(str)
+    
+    def __init__(self, project_path: str, build_detector: BuildSystemDetector):
+        super().__init__()
+        self.project_path = project_path
+        self.build_detector = build_detector
+    
+    def run(self):
+        """Run the build system detection."""
+        try:
+            self.detection_complete.emit(self.build_detector.detect_build_system(self.project_path))
+        except Exception as e:
+            self.detection_error.emit(str(e))
+
+
 class DependencyAnalysisThread(QThread):
     """Thread for analyzing dependencies without blocking the UI."""
     
+    partial_ready = Signal(str, list)
     analysis_complete = Signal(dict)
     analysis_error = Signal(str)
     
-    def __init__(self, project_path: str, dependency_manager: DependencyManager):
+    def __init__(self, project_path: str, dependency_manager: 'DependencyManager'):
         super().__init__()
         self.project_path = project_path
         self.dependency_manager = dependency_manager
@@ -627,53 +1072,132 @@ class DependencyAnalysisThread(QThread):
     def run(self):
         """Run the dependency analysis."""
         try:
-            analysis = self.dependency_manager.analyze_project_dependencies(self.project_path)
+            # Reuse the last analysis while no manifest or lockfile has changed
+            fingerprint = self.dependency_manager.get_manifest_fingerprint(self.project_path)
+            analysis = self.dependency_manager.get_cached_analysis(self.project_path, fingerprint)
+            if analysis is None:
+                # Falls back to the on-disk cache, which is also keyed by the fingerprint
+                analysis = self.dependency_manager.analyze_project_dependencies(
+                    self.project_path, fingerprint, self.partial_ready.emit)
+                self.dependency_manager.cache_analysis(self.project_path, fingerprint, analysis)
             self.analysis_complete.emit(analysis)
         except Exception as e:
             self.analysis_error.emit(str(e))
 
 
+class BackupListThread(QThread):
+    """Thread for listing backups without blocking the UI."""
+    
+    backups_ready = Signal(list)
+    
+    def __init__(self, backup_system: 'BackupSystem'):
+        super().__init__()
+        self.backup_system = backup_system
+    
+    def run(self):
+        """Load the backup list."""
+        try:
+            self.backups_ready.emit(self.backup_system.list_backups())
+        except Exception as e:
+            print(f"Error loading backup list: {e}")
+            self.backups_ready.emit([])
+
+
+class DependencyOpThread(QThread):
+    """Thread for updating, installing or removing dependencies without blocking the UI."""
+    
+    finished_ok = Signal(bool, str)
+    
+    def __init__(self, dependency_manager: 'DependencyManager', operation: str, project_path: str,
+                 package_manager: str, dependencies: List[str]):
+        super().__init__()
+        self.dependency_manager = dependency_manager
+        self.operation = operation
+        self.project_path = project_path
+        self.package_manager = package_manager
+        self.dependencies = dependencies
+    
+    def run(self):
+        """Run the dependency operation."""
+        try:
+            method = getattr(self.dependency_manager, f"{self.operation}_dependencies")
+            success = method(self.project_path, self.package_manager, self.dependencies)
+            self.finished_ok.emit(bool(success), "")
+        except Exception as e:
+            self.finished_ok.emit(False, str(e))
+
+
+class BackupOpThread(QThread):
+    """Thread for creating, restoring or deleting backups without blocking the UI."""
+    
+    finished_ok = Signal(bool, str)
+    
+    def __init__(self, backup_system: 'BackupSystem', operation: str, *args):
+        super().__init__()
+        self.backup_system = backup_system
+        self.operation = operation
+        self.args = args
+    
+    def run(self):
+        """Run the backup operation."""
+        try:
+            method = getattr(self.backup_system, f"{self.operation}_backup")
+            result = method(*self.args)
+            self.finished_ok.emit(bool(result), "")
+        except Exception as e:
+            self.finished_ok.emit(False, str(e))
+
+
 class BuildSystemDialog(QDialog):
     """Main dialog for build system and dependency management."""
     
-    def __init__(self, project_path: str, project_info: Dict[str, Any], parent=None, lang='en'):
+    # Built once and shared by every instance
+    _QSS = ("QLabel#projectInfo { font-weight: bold; font-size: 12px; } "
+            "QLabel#projectPath { color: gray; }")
+    
+    def __init__(self, project_path: str, project_info: Dict[str, Any], parent=None, lang='en', modal=False):
         super().__init__(parent)
         self.project_path = project_path
         self.project_info = project_info
         self.lang = lang
+        self.modal = modal
         self.init_ui()
     
     def init_ui(self):
         self.setWindowTitle(get_text('build_system_dialog.title', 'Build System & Dependencies', lang=self.lang))
-        self.setModal(True)
+        if self.modal:
+            # Block only the parent window, not the whole application
+            self.setWindowModality(Qt.WindowModal)
         self.resize(800, 600)
         
         layout = QVBoxLayout()
         
         # Project info
-        info_label = QLabel(f"Project: {self.project_info.get('name', 'Unknown')}")
-        info_label.setStyleSheet("font-weight: bold; font-size: 12px;")
-        layout.addWidget(info_label)
+        self.info_label = QLabel(self._project_info_text())
+        self.info_label.setObjectName("projectInfo")
+        layout.addWidget(self.info_label)
         
-        path_label = QLabel(f"Path: {self.project_path}")
-        path_label.setStyleSheet("color: gray;")
-        layout.addWidget(path_label)
+        self.path_label = QLabel(self._project_path_text())
+        self.path_label.setObjectName("projectPath")
+        layout.addWidget(self.path_label)
         
         # Tab widget
         self.tab_widget = QTabWidget()
         
-        # Build system tab
-        build_system_info = self.project_info.get('build_system', {})
-        self.build_system_tab = BuildSystemTab(self.project_path, build_system_info)
-        self.tab_widget.addTab(self.build_system_tab, get_text('build_system_dialog.build_tab', 'Build System', lang=self.lang))
-        
-        # Dependencies tab
-        self.dependencies_tab = DependenciesTab(self.project_path)
-        self.tab_widget.addTab(self.dependencies_tab, get_text('build_system_dialog.deps_tab', 'Dependencies', lang=self.lang))
-        
-        # Backup tab
-        self.backup_tab = BackupTab(self.project_path, self.lang)
-        self.tab_widget.addTab(self.backup_tab, get_text('build_system_dialog.backup_tab', 'Backup', lang=self.lang))
+        # Tabs start as placeholders; the build system tab is built once the dialog
+        # has been painted, the others the first time they are selected
+        self.build_system_tab = None
+        self.dependencies_tab = None
+        self.backup_tab = None
+        self._tab_factories = {
+            0: ('build_system_tab', lambda: BuildSystemTab(self.project_path, self.project_info.get('build_system', {}))),
+            1: ('dependencies_tab', lambda: DependenciesTab(self.project_path)),
+            2: ('backup_tab', lambda: BackupTab(self.project_path, self.lang)),
+        }
+        self.tab_widget.addTab(QWidget(), get_text('build_system_dialog.build_tab', 'Build System', lang=self.lang))
+        self.tab_widget.addTab(QWidget(), get_text('build_system_dialog.deps_tab', 'Dependencies', lang=self.lang))
+        self.tab_widget.addTab(QWidget(), get_text('build_system_dialog.backup_tab', 'Backup', lang=self.lang))
+        self.tab_widget.currentChanged.connect(self._on_tab_changed)
         
         layout.addWidget(self.tab_widget)
         
@@ -683,3 +1207,111 @@ class BuildSystemDialog(QDialog):
         layout.addWidget(close_btn)
         
         self.setLayout(layout)
+        self.setStyleSheet(self._QSS)
+        
+        QTimer.singleShot(0, self, self._build_default_tab)
+    
+    def _project_info_text(self) -> str:
+        """Get the text of the project name label."""
+        return get_text('build_system_dialog.project_info', 'Project: {name}', lang=self.lang,
+                        name=self.project_info.get('name', 'Unknown'))
+    
+    def _project_path_text(self) -> str:
+        """Get the text of the project path label."""
+        return get_text('build_system_dialog.project_path', 'Path: {path}', lang=self.lang,
+                        path=self.project_path)
+    
+    @classmethod
+    def get_or_create(cls, parent, project_path: str, project_info: Dict[str, Any], lang='en') -> 'BuildSystemDialog':
+        """Get the dialog kept on the parent, switched to the given project.
+        
+        Args:
+            parent: Widget that owns the dialog (None to always create a new one)
+            project_path: Path to the project directory
+            project_info: Project information dictionary
+            lang: Language code
+            
+        Returns:
+            The reused or newly created dialog
+        """
+        dialog = getattr(parent, '_build_dialog', None)
+        if dialog is None or dialog.lang != lang:
+            if dialog is not None:
+                dialog._discard(parent)
+            dialog = cls(project_path, project_info, parent, lang)
+            if parent is not None:
+                parent._build_dialog = dialog
+        elif dialog.project_path != project_path or dialog.project_info != project_info:
+            dialog.update_project(project_path, project_info)
+        return dialog
+    
+    def _discard(self, heir: QWidget):
+        """Close and delete the dialog; worker threads still running are handed to heir."""
+        threads = (
+            (self.build_system_tab, ('detect_thread',)),
+            (self.dependencies_tab, ('dependency_thread', 'op_thread')),
+            (self.backup_tab, ('backup_list_thread', 'op_thread')),
+        )
+        for tab, attrs in threads:
+            if tab is not None:
+                for attr in attrs:
+                    _retire_thread(getattr(tab, attr), heir)
+        self.reject()  # Stops the tabs' file watchers
+        self.deleteLater()
+    
+    def update_project(self, project_path: str, project_info: Dict[str, Any]):
+        """Point the dialog and its tabs at another project."""
+        self.project_path = project_path
+        self.project_info = project_info
+        self.info_label.setText(self._project_info_text())
+        self.path_label.setText(self._project_path_text())
+        
+        # Tabs that are not built yet read the new project when they are
+        if self.build_system_tab is not None:
+            self.build_system_tab.reload(project_path, project_info.get('build_system', {}))
+        if self.dependencies_tab is not None:
+            self.dependencies_tab.reload(project_path)
+        if self.backup_tab is not None:
+            self.backup_tab.reload(project_path)
+    
+    def showEvent(self, event):
+        """Resume watching in tabs that were stopped when the dialog was last closed."""
+        super().showEvent(event)
+        for tab in (self.dependencies_tab, self.backup_tab):
+            if tab is not None:
+                tab.start_watching()
+    
+    def _build_default_tab(self):
+        """Build the build system tab after the dialog shell has been shown."""
+        self._on_tab_changed(0)
+    
+    def _on_tab_changed(self, index: int):
+        """Replace a placeholder with its real tab the first time it is selected."""
+        entry = self._tab_factories.pop(index, None)
+        if entry is None:
+            return
+        
+        attr, factory = entry
+        tab = factory()
+        setattr(self, attr, tab)
+        
+        title = self.tab_widget.tabText(index)
+        placeholder = self.tab_widget.widget(index)
+        current = self.tab_widget.currentIndex()
+        # The dialog is already on screen; repaint once after the swap
+        self.tab_widget.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(self.tab_widget):
+                self.tab_widget.removeTab(index)
+                self.tab_widget.insertTab(index, tab, title)
+                self.tab_widget.setCurrentIndex(current)
+        finally:
+            self.tab_widget.setUpdatesEnabled(True)
+        placeholder.deleteLater()
+    
+    def done(self, result: int):
+        """Stop the tabs' file watchers before closing; running operations finish on their own."""
+        for tab in (self.dependencies_tab, self.backup_tab):
+            if tab is not None:
+                tab.stop_watching()
+        super().done(result)
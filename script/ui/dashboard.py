@@ -4,9 +4,14 @@ This module provides a comprehensive dashboard for viewing project statistics
 including charts and graphs for various project metrics.
 """
 
+import csv
+import heapq
+import html
 import json
-from datetime import datetime, timedelta
-from typing import Dict, List, Any, Tuple
+from collections import Counter
+from itertools import chain
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 
 from PySide6.QtWidgets import (
@@ -14,21 +19,27 @@ from PySide6.QtWidgets import (
     QPushButton, QTabWidget, QScrollArea, QGroupBox,
     QFrame, QSplitter, QFileDialog, QMessageBox, QWidget
 )
-from PySide6.QtCore import Qt, QSize
+from PySide6.QtCore import Qt, QSize, QThread, Signal
 from PySide6.QtGui import QFont, QPixmap, QPainter
 
+import numpy as np
 import matplotlib
-matplotlib.use('Qt5Agg')  # Use Qt5 backend for matplotlib
+matplotlib.use('QtAgg')  # Native Qt 6 backend, matching PySide6
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 from matplotlib.pyplot import cm
 import matplotlib.pyplot as plt
 
 from ..project_scanner import ProjectScanner
-from ..tag_manager import TagManager
+from ..tag_manager import TagManager, json_serializer
 from ..lang.lang_mgr import get_text
 
 
+# Upper bounds (exclusive) of the first three size distribution buckets
+_SIZE_EDGES = np.array([1024 * 1024, 10 * 1024 * 1024, 100 * 1024 * 1024], dtype=np.int64)
+_SIZE_LABELS = ('< 1MB', '1-10MB', '10-100MB', '> 100MB')
+
+
 class DashboardDialog(QDialog):
     """Dialog for displaying project statistics dashboard."""
     
@@ -36,6 +47,12 @@ class DashboardDialog(QDialog):
         super().__init__(parent)
         self.scanner = scanner
         self.lang = lang
+        # Statistics of the last load, reused by the exports while the scanner is unchanged
+        self._stats_cache = None
+        self._stats_rev = None
+        # Bar/line artists of each chart, updated in place while the labels stay the same
+        self._chart_artists = {}
+        self.stats_thread = None
         self.setWindowTitle(get_text('dashboard.title', 'Project Statistics Dashboard', lang=self.lang))
         self.setMinimumSize(1400, 900)
         self.setup_ui()
@@ -77,6 +94,18 @@ class DashboardDialog(QDialog):
         self.create_activity_tab()
         self.create_size_tab()
         
+        # Charts are drawn only for the visible tab; the others when they are first shown
+        self._tab_updaters = [
+            self.update_overview,
+            self.update_language_stats,
+            self.update_category_stats,
+            self.update_tag_stats,
+            self.update_activity_stats,
+            self.update_size_stats,
+        ]
+        self._dirty_tabs = set()
+        self.tab_widget.currentChanged.connect(self._render_current)
+        
         # Status bar
         self.status_label = QLabel(get_text('dashboard.ready', 'Ready', lang=self.lang))
         layout.addWidget(self.status_label)
@@ -209,19 +238,14 @@ class DashboardDialog(QDialog):
         tab = QWidget()
         layout = QVBoxLayout(tab)
         
-        # Activity charts
-        splitter = QSplitter(Qt.Horizontal)
-        
-        # Recent activity chart
-        self.activity_chart = self.create_line_chart(get_text('dashboard.project_activity', 'Project Activity (Last 30 Days)', lang=self.lang))
-        splitter.addWidget(self.activity_chart)
-        
-        # Top recent projects
-        self.recent_projects_chart = self.create_bar_chart(get_text('dashboard.most_accessed_projects', 'Most Accessed Projects', lang=self.lang))
-        splitter.addWidget(self.recent_projects_chart)
-        
-        splitter.setSizes([700, 700])
-        layout.addWidget(splitter)
+        # Activity charts share one figure: timeline on the left, top recent projects on the right
+        fig = Figure(figsize=(14, 5), dpi=100, facecolor='white', layout='constrained')
+        self.activity_ax = fig.add_subplot(1, 2, 1)
+        self.activity_ax.set_title(get_text('dashboard.project_activity', 'Project Activity (Last 30 Days)', lang=self.lang))
+        self.recent_projects_ax = fig.add_subplot(1, 2, 2)
+        self.recent_projects_ax.set_title(get_text('dashboard.most_accessed_projects', 'Most Accessed Projects', lang=self.lang))
+        self.activity_canvas = FigureCanvas(fig)
+        layout.addWidget(self.activity_canvas)
         
         self.tab_widget.addTab(tab, get_text('dashboard.activity_tab', 'Activity', lang=self.lang))
     
@@ -281,7 +305,7 @@ class DashboardDialog(QDialog):
     
     def create_pie_chart(self, title: str) -> FigureCanvas:
         """Create a pie chart canvas."""
-        fig = Figure(figsize=(6, 4), dpi=100)
+        fig = Figure(figsize=(6, 4), dpi=100, facecolor='white', layout='constrained')
         ax = fig.add_subplot(111)
         ax.set_title(title)
         canvas = FigureCanvas(fig)
@@ -289,15 +313,7 @@ class DashboardDialog(QDialog):
     
     def create_bar_chart(self, title: str) -> FigureCanvas:
         """Create a bar chart canvas."""
-        fig = Figure(figsize=(8, 5), dpi=100)
-        ax = fig.add_subplot(111)
-        ax.set_title(title)
-        canvas = FigureCanvas(fig)
-        return canvas
-    
-    def create_line_chart(self, title: str) -> FigureCanvas:
-        """Create a line chart canvas."""
-        fig = Figure(figsize=(8, 5), dpi=100)
+        fig = Figure(figsize=(8, 5), dpi=100, facecolor='white', layout='constrained')
         ax = fig.add_subplot(111)
         ax.set_title(title)
         canvas = FigureCanvas(fig)
@@ -323,38 +339,59 @@ class DashboardDialog(QDialog):
     
     def load_statistics(self):
         """Load and display all statistics."""
+        if self.stats_thread is not None and self.stats_thread.isRunning():
+            return
+        
+        self.status_label.setText(get_text('dashboard.loading_statistics', 'Loading statistics...', lang=self.lang))
+        self.refresh_button.setEnabled(False)
+        
+        # Calculate statistics in a separate thread; an explicit load always recomputes,
+        # since project tags, categories and favorites are edited in place
+        self.stats_thread = StatsThread(self, list(self.scanner.get_projects()), self.scanner.revision)
+        self.stats_thread.stats_ready.connect(self._apply_stats)
+        self.stats_thread.stats_error.connect(self.on_stats_error)
+        self.stats_thread.start()
+    
+    def _apply_stats(self, stats: Dict[str, Any]):
+        """Show statistics calculated by the stats thread."""
+        self._stats_cache = stats
+        self._stats_rev = self.stats_thread.revision
+        self.refresh_button.setEnabled(True)
+        
         try:
-            self.status_label.setText(get_text('dashboard.loading_statistics', 'Loading statistics...', lang=self.lang))
+            # Redraw the visible tab now and the others when they are selected
+            self._dirty_tabs = set(range(len(self._tab_updaters)))
+            self._render_current()
             
-            # Get projects data
-            projects = self.scanner.get_projects()
-            
-            # Calculate statistics
-            stats = self.calculate_statistics(projects)
-            
-            # Update overview
-            self.update_overview(stats)
-            
-            # Update language statistics
-            self.update_language_stats(stats)
-            
-            # Update category statistics
-            self.update_category_stats(stats)
-            
-            # Update tag statistics
-            self.update_tag_stats(stats)
-            
-            # Update activity statistics
-            self.update_activity_stats(stats)
-            
-            # Update size statistics
-            self.update_size_stats(stats)
-            
-            self.status_label.setText(get_text('dashboard.statistics_loaded', 'Statistics loaded - {count} projects analyzed', lang=self.lang).format(count=len(projects)))
+            self.status_label.setText(get_text('dashboard.statistics_loaded', 'Statistics loaded - {count} projects analyzed', lang=self.lang).format(count=stats['total_projects']))
             
         except Exception as e:
-            QMessageBox.warning(self, get_text('dashboard.error', 'Error', lang=self.lang), get_text('dashboard.load_error', 'Could not load statistics: {error}', lang=self.lang).format(error=str(e)))
-            self.status_label.setText(get_text('dashboard.error_loading_statistics', 'Error loading statistics', lang=self.lang))
+            self.on_stats_error(str(e))
+    
+    def on_stats_error(self, error: str):
+        """Handle a failure while loading statistics."""
+        self.refresh_button.setEnabled(True)
+        QMessageBox.warning(self, get_text('dashboard.error', 'Error', lang=self.lang), get_text('dashboard.load_error', 'Could not load statistics: {error}', lang=self.lang).format(error=error))
+        self.status_label.setText(get_text('dashboard.error_loading_statistics', 'Error loading statistics', lang=self.lang))
+    
+    def _render_current(self, index: int = None):
+        """Update the current tab if its statistics changed since it was last drawn."""
+        if self._stats_cache is None:
+            # Still loading; the tab is drawn when the statistics arrive
+            return
+        if index is None:
+            index = self.tab_widget.currentIndex()
+        if index in self._dirty_tabs:
+            self._dirty_tabs.discard(index)
+            self._tab_updaters[index](self._stats_cache)
+    
+    def _get_stats(self) -> Dict[str, Any]:
+        """Get the current statistics, recomputing them only after the scanner changed."""
+        revision = self.scanner.revision
+        if self._stats_cache is None or revision != self._stats_rev:
+            self._stats_cache = self.calculate_statistics(self.scanner.get_projects())
+            self._stats_rev = revision
+        return self._stats_cache
     
     def calculate_statistics(self, projects: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Calculate comprehensive statistics from projects data."""
@@ -372,55 +409,32 @@ class DashboardDialog(QDialog):
             'largest_projects': []
         }
         
-        # Process each project
-        for project in projects:
-            # Language statistics
-            language = project.get('language', 'Unknown')
-            stats['languages'][language] = stats['languages'].get(language, 0) + 1
-            
-            # Category statistics
-            category = project.get('category', 'Uncategorized')
-            stats['categories'][category] = stats['categories'].get(category, 0) + 1
-            
-            # Tag statistics
-            tags = project.get('tags', [])
-            for tag in tags:
-                stats['tags'][tag] = stats['tags'].get(tag, 0) + 1
-            
-            # Favorites and notes
-            if project.get('is_favorite', False):
-                stats['favorites'] += 1
-            
-            if project.get('note'):
-                stats['with_notes'] += 1
-            
-            # Size statistics
-            size = project.get('size', 0)
-            stats['total_size'] += size
-            
-            # Size distribution
-            if size < 1024 * 1024:  # < 1MB
-                stats['size_distribution']['< 1MB'] += 1
-            elif size < 10 * 1024 * 1024:  # 1-10MB
-                stats['size_distribution']['1-10MB'] += 1
-            elif size < 100 * 1024 * 1024:  # 10-100MB
-                stats['size_distribution']['10-100MB'] += 1
-            else:  # > 100MB
-                stats['size_distribution']['> 100MB'] += 1
-            
-            # Add to largest projects
-            stats['largest_projects'].append({
-                'name': project['name'],
-                'path': project['path'],
-                'size': size
-            })
-        
-        # Sort largest projects
-        stats['largest_projects'] = sorted(
-            stats['largest_projects'], 
-            key=lambda x: x['size'], 
-            reverse=True
-        )[:10]  # Top 10
+        # Count languages and categories
+        stats['languages'] = dict(Counter(p.get('language', 'Unknown') for p in projects))
+        stats['categories'] = dict(Counter(p.get('category', 'Uncategorized') for p in projects))
+        
+        # Tag statistics: count the flattened tag lists in a single pass
+        stats['tags'] = dict(Counter(chain.from_iterable(p.get('tags', ()) for p in projects)))
+        
+        # Numeric columns are extracted once and aggregated with NumPy
+        count = len(projects)
+        sizes = np.fromiter((p.get('size', 0) for p in projects), dtype=np.int64, count=count)
+        stats['favorites'] = sum(1 for p in projects if p.get('is_favorite', False))
+        stats['with_notes'] = sum(1 for p in projects if p.get('note'))
+        stats['total_size'] = int(sizes.sum())
+        
+        # Size distribution
+        buckets = np.bincount(np.digitize(sizes, _SIZE_EDGES), minlength=len(_SIZE_LABELS))
+        stats['size_distribution'] = dict(zip(_SIZE_LABELS, buckets.tolist()))
+        
+        # Largest projects: partition out the top 10, then order only those
+        top = np.argpartition(sizes, -10)[-10:] if count > 10 else np.arange(count)
+        top = sorted(top.tolist(), key=lambda i: (-sizes[i], i))
+        stats['largest_projects'] = [{
+            'name': projects[i]['name'],
+            'path': projects[i]['path'],
+            'size': int(sizes[i])
+        } for i in top]
         
         # Get recent projects from tag manager
         recent_projects = self.scanner.tag_manager.get_recent_projects()
@@ -433,22 +447,21 @@ class DashboardDialog(QDialog):
     
     def generate_activity_timeline(self, recent_projects: List[Dict[str, Any]]) -> Dict[str, int]:
         """Generate activity timeline for the last 30 days."""
-        timeline = {}
-        now = datetime.now()
+        # No recent projects: the line chart shows its no-activity message for an empty timeline
+        if not recent_projects:
+            return {}
         
-        # Initialize last 30 days
-        for i in range(30):
-            date = (now - timedelta(days=i)).strftime('%Y-%m-%d')
-            timeline[date] = 0
+        today = date.today()
         
-        # Count projects accessed on each day
+        # Count projects accessed on each day, indexed by days before today
+        counts = [0] * 30
         for project in recent_projects:
-            accessed_at = datetime.fromisoformat(project['accessed_at'])
-            date_str = accessed_at.strftime('%Y-%m-%d')
-            if date_str in timeline:
-                timeline[date_str] += 1
+            # The date part of an ISO timestamp is its first 10 characters
+            offset = (today - date.fromisoformat(project['accessed_at'][:10])).days
+            if 0 <= offset < 30:
+                counts[offset] += 1
         
-        return timeline
+        return {(today - timedelta(days=i)).isoformat(): counts[i] for i in range(30)}
     
     def update_overview(self, stats: Dict[str, Any]):
         """Update the overview tab with statistics."""
@@ -491,15 +504,14 @@ class DashboardDialog(QDialog):
         if not data:
             ax.text(0.5, 0.5, get_text('dashboard.no_data_available', 'No data available', lang=self.lang), ha='center', va='center', transform=ax.transAxes)
         else:
-            # Sort data by value
-            sorted_data = dict(sorted(data.items(), key=lambda x: x[1], reverse=True))
-            
             # Take top 10 items, group rest as "Other"
-            if len(sorted_data) > 10:
-                top_items = dict(list(sorted_data.items())[:9])
-                other_count = sum(list(sorted_data.values())[9:])
-                top_items[get_text('dashboard.other', 'Other', lang=self.lang)] = other_count
-                sorted_data = top_items
+            if len(data) > 10:
+                sorted_data = dict(heapq.nlargest(9, data.items(), key=lambda x: x[1]))
+                other_count = sum(data.values()) - sum(sorted_data.values())
+                sorted_data[get_text('dashboard.other', 'Other', lang=self.lang)] = other_count
+            else:
+                # Sort data by value
+                sorted_data = dict(sorted(data.items(), key=lambda x: x[1], reverse=True))
             
             labels = list(sorted_data.keys())
             values = list(sorted_data.values())
@@ -508,7 +520,7 @@ class DashboardDialog(QDialog):
             wedges, texts, autotexts = ax.pie(values, labels=labels, autopct='%1.1f%%', startangle=90)
             ax.axis('equal')
         
-        canvas.draw()
+        canvas.draw_idle()
     
     def update_language_stats(self, stats: Dict[str, Any]):
         """Update language statistics tab."""
@@ -529,7 +541,7 @@ class DashboardDialog(QDialog):
     def update_tag_stats(self, stats: Dict[str, Any]):
         """Update tag statistics tab."""
         # Get top 20 tags
-        top_tags = dict(sorted(stats['tags'].items(), key=lambda x: x[1], reverse=True)[:20])
+        top_tags = dict(heapq.nlargest(20, stats['tags'].items(), key=lambda x: x[1]))
         
         # Update bar chart
         self.update_bar_chart(self.tags_chart, top_tags)
@@ -540,11 +552,11 @@ class DashboardDialog(QDialog):
     def update_activity_stats(self, stats: Dict[str, Any]):
         """Update activity statistics tab."""
         # Update activity timeline chart
-        self.update_line_chart(self.activity_chart, stats['activity_timeline'])
+        self.update_line_chart(self.activity_canvas, stats['activity_timeline'], self.activity_ax)
         
         # Update recent projects chart
         recent_data = {p['name']: 1 for p in stats['recent_projects'][:10]}
-        self.update_bar_chart(self.recent_projects_chart, recent_data)
+        self.update_bar_chart(self.activity_canvas, recent_data, self.recent_projects_ax)
     
     def update_size_stats(self, stats: Dict[str, Any]):
         """Update size statistics tab."""
@@ -554,17 +566,31 @@ class DashboardDialog(QDialog):
         # Update largest projects table (placeholder for now)
         # TODO: Implement largest projects table
     
-    def update_bar_chart(self, canvas: FigureCanvas, data: Dict[str, int]):
-        """Update a bar chart with data."""
-        ax = canvas.figure.axes[0]
+    def update_bar_chart(self, canvas: FigureCanvas, data: Dict[str, int], ax=None):
+        """Update a bar chart with data, on the canvas' first axes unless ax is given."""
+        if ax is None:
+            ax = canvas.figure.axes[0]
+        labels = list(data.keys())
+        values = list(data.values())
+        
+        artists = self._chart_artists.get(ax)
+        if data and artists is not None and artists['labels'] == labels:
+            # Same bars as last time: only move the heights and value labels
+            for bar, value_label, value in zip(artists['bars'], artists['value_labels'], values):
+                bar.set_height(value)
+                value_label.set_y(value)
+                value_label.set_text(f'{int(value)}')
+            ax.relim()
+            ax.autoscale_view()
+            canvas.draw_idle()
+            return
+        
         ax.clear()
+        self._chart_artists.pop(ax, None)
         
         if not data:
             ax.text(0.5, 0.5, get_text('dashboard.no_data_available', 'No data available', lang=self.lang), ha='center', va='center', transform=ax.transAxes)
         else:
-            labels = list(data.keys())
-            values = list(data.values())
-            
             # Create bar chart
             bars = ax.bar(labels, values)
             ax.set_ylabel(get_text('dashboard.count', 'Count', lang=self.lang))
@@ -573,38 +599,58 @@ class DashboardDialog(QDialog):
             plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
             
             # Add value labels on bars
+            value_labels = []
             for bar in bars:
                 height = bar.get_height()
-                ax.text(bar.get_x() + bar.get_width()/2., height,
-                       f'{int(height)}', ha='center', va='bottom')
+                value_labels.append(ax.text(bar.get_x() + bar.get_width()/2., height,
+                                            f'{int(height)}', ha='center', va='bottom'))
+            
+            self._chart_artists[ax] = {'labels': labels, 'bars': bars, 'value_labels': value_labels}
         
-        canvas.figure.tight_layout()
-        canvas.draw()
+        canvas.draw_idle()
     
-    def update_line_chart(self, canvas: FigureCanvas, data: Dict[str, int]):
-        """Update a line chart with data."""
-        ax = canvas.figure.axes[0]
+    def update_line_chart(self, canvas: FigureCanvas, data: Dict[str, int], ax=None):
+        """Update a line chart with data, on the canvas' first axes unless ax is given."""
+        if ax is None:
+            ax = canvas.figure.axes[0]
+        has_data = bool(data) and any(v != 0 for v in data.values())
+        
+        # Sort by date
+        sorted_data = dict(sorted(data.items()))
+        dates = list(sorted_data.keys())
+        values = list(sorted_data.values())
+        
+        artists = self._chart_artists.get(ax)
+        if has_data and artists is not None and artists['labels'] == dates:
+            # Same days as last time: only the counts change
+            artists['line'].set_ydata(values)
+            ax.relim()
+            ax.autoscale_view()
+            canvas.draw_idle()
+            return
+        
         ax.clear()
+        self._chart_artists.pop(ax, None)
         
-        if not data or all(v == 0 for v in data.values()):
+        if not has_data:
             ax.text(0.5, 0.5, get_text('dashboard.no_activity_data_available', 'No activity data available', lang=self.lang), ha='center', va='center', transform=ax.transAxes)
         else:
-            # Sort by date
-            sorted_data = dict(sorted(data.items()))
-            
-            dates = list(sorted_data.keys())
-            values = list(sorted_data.values())
-            
             # Create line chart
-            ax.plot(dates, values, marker='o', linewidth=2, markersize=4)
+            line, = ax.plot(dates, values, marker='o', linewidth=2, markersize=4)
+            self._chart_artists[ax] = {'labels': dates, 'line': line}
             ax.set_ylabel(get_text('dashboard.projects_accessed', 'Projects Accessed', lang=self.lang))
             ax.set_xlabel(get_text('dashboard.date', 'Date', lang=self.lang))
             
             # Rotate x-axis labels for better readability
             plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
         
-        canvas.figure.tight_layout()
-        canvas.draw()
+        canvas.draw_idle()
+    
+    def done(self, result: int):
+        """Wait for a running statistics calculation before closing."""
+        if self.stats_thread is not None:
+            self.stats_thread.wait()
+        super().done(result)
     
     def export_report(self):
         """Export statistics report to file."""
@@ -632,14 +678,15 @@ class DashboardDialog(QDialog):
                 return
             
             try:
-                # Export based on file extension
+                # Export the statistics the dashboard is showing, based on file extension
+                stats = self._get_stats()
                 if file_path.endswith('.csv'):
-                    self.export_csv_report(file_path)
+                    self.export_csv_report(file_path, stats)
                 elif file_path.endswith('.json'):
-                    self.export_json_report(file_path)
+                    self.export_json_report(file_path, stats)
                 else:
                     # Default to CSV
-                    self.export_csv_report(file_path)
+                    self.export_csv_report(file_path, stats)
                 
                 QMessageBox.information(self, get_text('dashboard.export_complete', 'Export Complete', lang=self.lang), get_text('dashboard.export_success', 'Report exported successfully!', lang=self.lang))
                 
@@ -649,14 +696,13 @@ class DashboardDialog(QDialog):
         except Exception as e:
             QMessageBox.warning(self, get_text('dashboard.error', 'Error', lang=self.lang), get_text('dashboard.export_error_message', 'Could not export report: {error}', lang=self.lang).format(error=str(e)))
     
-    def export_html_report(self, file_path: str):
-        """Export statistics report as HTML."""
-        # Get current statistics
-        projects = self.scanner.get_projects()
-        stats = self.calculate_statistics(projects)
+    def export_html_report(self, file_path: str, stats: Optional[Dict[str, Any]] = None):
+        """Export statistics report as HTML, using the current statistics unless stats is given."""
+        if stats is None:
+            stats = self._get_stats()
         
-        # Generate HTML report
-        html_content = f"""
+        # Generate HTML report as a list of fragments joined on write
+        parts = [f"""
         <!DOCTYPE html>
         <html>
         <head>
@@ -678,48 +724,95 @@ class DashboardDialog(QDialog):
             <h2>{get_text('dashboard.languages', 'Languages', lang=self.lang)}</h2>
             <table>
                 <tr><th>{get_text('dashboard.language', 'Language', lang=self.lang)}</th><th>{get_text('dashboard.count', 'Count', lang=self.lang)}</th></tr>
-        """
+        """]
         
-        for lang, count in sorted(stats['languages'].items(), key=lambda x: x[1], reverse=True):
-            html_content += f"<tr><td>{lang}</td><td>{count}</td></tr>"
+        parts.extend(f"<tr><td>{html.escape(str(lang))}</td><td>{count}</td></tr>"
+                     for lang, count in sorted(stats['languages'].items(), key=lambda x: x[1], reverse=True))
         
-        html_content += """
+        parts.append(f"""
             </table>
             
             <h2>{get_text('dashboard.categories', 'Categories', lang=self.lang)}</h2>
             <table>
                 <tr><th>{get_text('dashboard.category', 'Category', lang=self.lang)}</th><th>{get_text('dashboard.count', 'Count', lang=self.lang)}</th></tr>
-        """
+        """)
         
-        for cat, count in sorted(stats['categories'].items(), key=lambda x: x[1], reverse=True):
-            html_content += f"<tr><td>{cat}</td><td>{count}</td></tr>"
+        parts.extend(f"<tr><td>{html.escape(str(cat))}</td><td>{count}</td></tr>"
+                     for cat, count in sorted(stats['categories'].items(), key=lambda x: x[1], reverse=True))
         
-        html_content += """
+        parts.append("""
             </table>
         </body>
         </html>
-        """
+        """)
         
         # Write to file
         with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+            f.writelines(parts)
     
-    def export_json_report(self, file_path: str):
-        """Export statistics report as JSON."""
-        # Get current statistics
-        projects = self.scanner.get_projects()
-        stats = self.calculate_statistics(projects)
+    def export_csv_report(self, file_path: str, stats: Optional[Dict[str, Any]] = None):
+        """Export statistics report as CSV, using the current statistics unless stats is given."""
+        if stats is None:
+            stats = self._get_stats()
+        
+        with open(file_path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            
+            # Summary
+            writer.writerow([get_text('dashboard.total_projects', 'Total Projects', lang=self.lang), stats['total_projects']])
+            writer.writerow([get_text('dashboard.favorites', 'Favorites', lang=self.lang), stats['favorites']])
+            writer.writerow([get_text('dashboard.total_size', 'Total Size', lang=self.lang), stats['total_size']])
+            
+            # One table per grouping, sorted by count
+            for title, column, counts in (
+                (get_text('dashboard.languages', 'Languages', lang=self.lang),
+                 get_text('dashboard.language', 'Language', lang=self.lang), stats['languages']),
+                (get_text('dashboard.categories', 'Categories', lang=self.lang),
+                 get_text('dashboard.category', 'Category', lang=self.lang), stats['categories']),
+                (get_text('dashboard.tags_tab', 'Tags', lang=self.lang),
+                 get_text('dashboard.tag', 'Tag', lang=self.lang), stats['tags']),
+            ):
+                writer.writerow([])
+                writer.writerow([title])
+                writer.writerow([column, get_text('dashboard.count', 'Count', lang=self.lang)])
+                for name, count in sorted(counts.items(), key=lambda x: x[1], reverse=True):
+                    writer.writerow([name, count])
+    
+    def export_json_report(self, file_path: str, stats: Optional[Dict[str, Any]] = None):
+        """Export statistics report as JSON, using the current statistics unless stats is given."""
+        if stats is None:
+            stats = self._get_stats()
         
         # Add metadata
         report = {
             'generated_at': datetime.now().isoformat(),
-            'total_projects': len(projects),
+            'total_projects': stats['total_projects'],
             'statistics': stats
         }
         
         # Write to file
         with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+            json.dump(report, f, indent=2, ensure_ascii=False, default=json_serializer)
+
+
+class StatsThread(QThread):
+    """Thread for calculating dashboard statistics without blocking the UI."""
+    
+    stats_ready = Signal(object)  # A plain dict; Signal(dict) would reorder it as a QVariantMap
+    stats_error = Signal(str)
+    
+    def __init__(self, dashboard: DashboardDialog, projects: List[Dict[str, Any]], revision: int):
+        super().__init__()
+        self.dashboard = dashboard
+        self.projects = projects
+        self.revision = revision
+    
+    def run(self):
+        """Calculate the statistics."""
+        try:
+            self.stats_ready.emit(self.dashboard.calculate_statistics(self.projects))
+        except Exception as e:
+            self.stats_error.emit(str(e))
 
 
 def show_dashboard(scanner: ProjectScanner, parent=None, lang='en'):
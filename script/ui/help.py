@@ -1,16 +1,26 @@
-from PySide6.QtCore import Qt, QUrl, QSize, Signal
+from PySide6.QtCore import Qt, QUrl, QSize, Signal, QSortFilterProxyModel, QTimer, QSignalBlocker
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
                              QTextBrowser, QDialogButtonBox, QTabWidget, QLineEdit,
                              QListWidget, QListWidgetItem, QSplitter, QFrame,
-                             QScrollArea, QGroupBox, QTreeWidget, QTreeWidgetItem,
+                             QScrollArea, QGroupBox, QTreeView, QAbstractItemView,
                              QProgressBar, QMessageBox, QWidget)
-from PySide6.QtGui import QDesktopServices, QFont, QIcon, QKeySequence
+from PySide6.QtGui import QDesktopServices, QFont, QIcon, QKeySequence, QStandardItemModel, QStandardItem
 import webbrowser
 import os
 import re
 from pathlib import Path
 from ..lang.lang_mgr import get_text
 
+# Documentation tree categories: (title, ((topic title, file in docs/), ...))
+_DOCS_CATEGORIES = (
+    ("Project Documentation", (("Project Structure", "STRUCT.md"), ("Application List", "app_list.md"))),
+    ("Structure & Architecture", (("Detailed Structure", "STRUCT.md"),)),
+    ("Planning & Roadmap", (("Development Roadmap", "ROADMAP.md"),)),
+)
+
+# Item data role holding the entries of a category whose children are not created yet
+_PENDING_ENTRIES_ROLE = Qt.UserRole + 1
+
 
 def show_help(parent=None, lang='en'):
     """Show the help dialog.
@@ -73,7 +83,11 @@ class HelpDialog(QDialog):
         self.search_box = QLineEdit()
         self.search_box.setPlaceholderText(get_text('help.search_placeholder', 'Type to search help topics...'))
         self.search_box.setMinimumWidth(300)
-        self.search_box.textChanged.connect(self.filter_content)
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(120)  # Filter once typing pauses, not on every keystroke
+        self._search_timer.timeout.connect(lambda: self.filter_content(self.search_box.text()))
+        self.search_box.textChanged.connect(self._search_timer.start)
         header_layout.addWidget(search_label)
         header_layout.addWidget(self.search_box)
         
@@ -139,9 +153,21 @@ class HelpDialog(QDialog):
         docs_group = QGroupBox(get_text('help.nav.documentation', 'Documentation'))
         docs_layout = QVBoxLayout()
         
-        self.docs_tree = QTreeWidget()
-        self.docs_tree.setHeaderLabel(get_text('help.nav.topics', 'Topics'))
-        self.docs_tree.itemClicked.connect(self.on_docs_item_clicked)
+        # Topics live in a model; the search box filters them through a proxy
+        self.docs_model = QStandardItemModel(self)
+        self.docs_model.setHorizontalHeaderLabels([get_text('help.nav.topics', 'Topics')])
+        self.docs_proxy = QSortFilterProxyModel(self)
+        self.docs_proxy.setSourceModel(self.docs_model)
+        self.docs_proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        self.docs_proxy.setRecursiveFilteringEnabled(True)
+        self.docs_proxy.setAutoAcceptChildRows(True)
+        
+        self.docs_tree = QTreeView()
+        self.docs_tree.setModel(self.docs_proxy)
+        self.docs_tree.setUniformRowHeights(True)
+        self.docs_tree.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.docs_tree.clicked.connect(self.on_docs_item_clicked)
+        self.docs_tree.expanded.connect(self.on_docs_tree_expanded)
         docs_layout.addWidget(self.docs_tree)
         
         docs_group.setLayout(docs_layout)
@@ -183,21 +209,21 @@ class HelpDialog(QDialog):
         self.help_browser.anchorClicked.connect(self.on_anchor_clicked)
         self.tabs.addTab(self.help_browser, get_text('help.tabs.help', 'Help'))
         
-        # Examples tab
-        self.examples_browser = QTextBrowser()
-        self.examples_browser.setOpenExternalLinks(True)
-        self.tabs.addTab(self.examples_browser, get_text('help.tabs.examples', 'Examples'))
-        
-        # API Reference tab
-        self.api_browser = QTextBrowser()
-        self.api_browser.setOpenExternalLinks(True)
-        self.tabs.addTab(self.api_browser, get_text('help.tabs.api', 'API Reference'))
-        
-        # FAQ tab
-        self.faq_browser = QTextBrowser()
-        self.faq_browser.setOpenExternalLinks(True)
-        self.tabs.addTab(self.faq_browser, get_text('help.tabs.faq', 'FAQ'))
+        # Examples, API Reference and FAQ tabs start as placeholders; their browsers
+        # are created the first time the tab is selected
+        self.examples_browser = None
+        self.api_browser = None
+        self.faq_browser = None
+        self._tab_factories = {
+            1: ('examples_browser', _EXAMPLES_HTML),
+            2: ('api_browser', None),
+            3: ('faq_browser', _FAQ_HTML),
+        }
+        self.tabs.addTab(QWidget(), get_text('help.tabs.examples', 'Examples'))
+        self.tabs.addTab(QWidget(), get_text('help.tabs.api', 'API Reference'))
+        self.tabs.addTab(QWidget(), get_text('help.tabs.faq', 'FAQ'))
         
+        self.tabs.currentChanged.connect(self._build_tab)
         self.tabs.currentChanged.connect(self.on_tab_changed)
         content_layout.addWidget(self.tabs)
         
@@ -223,104 +249,11 @@ class HelpDialog(QDialog):
     
     def load_main_help(self):
         """Load the main help content."""
-        help_content = self._get_main_help_content()
-        self.help_browser.setHtml(help_content)
+        self.help_browser.setHtml(_MAIN_HELP_HTML)
         
     def _get_main_help_content(self):
-        """Generate the main help content HTML."""
-        return f"""
-        <html>
-        <head>
-            <style>
-                body {{ font-family: Arial, sans-serif; margin: 20px; }}
-                h1 {{ color: #44607b; border-bottom: 2px solid #3498db; }}
-                h2 {{ color: #44607b; margin-top: 30px; }}
-                h3 {{ color: #44607b; }}
-                code {{ background-color: #1f1f1f; padding: 2px 4px; border-radius: 3px; }}
-                .note {{ background-color: #1f1f1f; padding: 10px; border-left: 4px solid #3498db; margin: 10px 0; }}
-                .warning {{ background-color: #1f1f1f; padding: 10px; border-left: 4px solid #ffc107; margin: 10px 0; }}
-                .tip {{ background-color: #1f1f1f; padding: 10px; border-left: 4px solid #28a745; margin: 10px 0; }}
-                ul {{ margin: 10px 0; }}
-                li {{ margin: 5px 0; }}
-                table {{ border-collapse: collapse; width: 100%; margin: 10px 0; }}
-                th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
-                th {{ background-color: #44607b; color: white; }}
-            </style>
-        </head>
-        <body>
-            <h1>PRJ-1 Project Browser - Help Center</h1>
-            
-            <div class="note">
-                <strong>Welcome to PRJ-1 Project Browser!</strong> This comprehensive project management tool helps you discover, organize, and manage your development projects with ease.
-            </div>
-            
-            <h2>Quick Start Guide</h2>
-            <ol>
-                <li><strong>Scan Projects:</strong> Use the Project Browser to scan your directories for projects</li>
-                <li><strong>Browse Projects:</strong> View all your projects in an organized table with detailed information</li>
-                <li><strong>Search & Filter:</strong> Find projects quickly using search and language filters</li>
-                <li><strong>Open Projects:</strong> Launch projects in your preferred editor or IDE</li>
-            </ol>
-            
-            <h2>Interface Overview</h2>
-            <h3>Main Window</h3>
-            <ul>
-                <li><strong>Menu Bar:</strong> Access all application features and settings</li>
-                <li><strong>Project Browser:</strong> Browse and manage your projects</li>
-                <li><strong>Status Bar:</strong> View application status and quick information</li>
-            </ul>
-            
-            <h3>Project Browser Dialog</h3>
-            <ul>
-                <li><strong>Directory Selection:</strong> Choose which directory to scan for projects</li>
-                <li><strong>Project Table:</strong> View all discovered projects with detailed information</li>
-                <li><strong>Search & Filter:</strong> Find projects by name or programming language</li>
-                <li><strong>Version Display:</strong> See version information extracted from version.py files</li>
-                <li><strong>Open Actions:</strong> Launch projects in your preferred editor</li>
-            </ul>
-            
-            <h3>Menu Features</h3>
-            <ul>
-                <li><strong>File Menu:</strong> Project browser, settings, and exit</li>
-                <li><strong>Help Menu:</strong> Access help, about, and sponsor information</li>
-                <li><strong>Language Support:</strong> Switch between different interface languages</li>
-            </ul>
-            
-            <h2>Keyboard Shortcuts</h2>
-            <table>
-                <tr><th><strong>Shortcut</strong></th><th><strong>Action</strong></th></tr>
-                <tr><td><code>Ctrl+B</code></td><td>Open Project Browser</td></tr>
-                <tr><td><code>Ctrl+F</code></td><td>Focus Search Box</td></tr>
-                <tr><td><code>F1</code></td><td>Show Help</td></tr>
-                <tr><td><code>Ctrl+Q</code></td><td>Quit Application</td></tr>
-                <tr><td><code>Ctrl+W</code></td><td>Close Current Dialog</td></tr>
-            </table>
-            
-            <div class="tip">
-                <strong>Pro Tip:</strong> Use the search box above to quickly find help topics. You can also browse the documentation tree on the left for detailed guides and project documentation.
-            </div>
-            
-            <h2>Documentation Sections</h2>
-            <ul>
-                <li><strong>Project Structure:</strong> Detailed explanation of the project architecture</li>
-                <li><strong>Roadmap:</strong> Planned features and future development</li>
-                <li><strong>Application List:</strong> List of supported applications and their status</li>
-            </ul>
-            
-            <h2>Getting Additional Help</h2>
-            <ul>
-                <li><strong>GitHub Repository:</strong> Source code and documentation</li>
-                <li><strong>Issue Tracker:</strong> Report bugs or request features</li>
-                <li><strong>Discord Community:</strong> Get help from other users and developers</li>
-                <li><strong>Documentation:</strong> Browse the comprehensive documentation in the docs/ folder</li>
-            </ul>
-            
-            <div class="warning">
-                <strong>Important:</strong> Make sure your projects contain a <code>version.py</code> file for proper version detection. The scanner will recursively search all subdirectories for version information.
-            </div>
-        </body>
-        </html>
-        """
+        """Get the main help content HTML."""
+        return _MAIN_HELP_HTML
     
     def populate_docs_tree(self):
         """Populate the documentation tree with available documentation files."""
@@ -328,293 +261,59 @@ class HelpDialog(QDialog):
             return
         
         # Clear existing items
-        self.docs_tree.clear()
-        
-        # Add main categories
-        project_docs_item = QTreeWidgetItem(self.docs_tree, ["Project Documentation"])
-        structure_item = QTreeWidgetItem(self.docs_tree, ["Structure & Architecture"])
-        planning_item = QTreeWidgetItem(self.docs_tree, ["Planning & Roadmap"])
-        
-        # Populate project documentation
-        if (self.docs_path / "STRUCT.md").exists():
-            struct_item = QTreeWidgetItem(project_docs_item, ["Project Structure"])
-            struct_item.setData(0, Qt.UserRole, "STRUCT.md")
-        
-        if (self.docs_path / "app_list.md").exists():
-            app_list_item = QTreeWidgetItem(project_docs_item, ["Application List"])
-            app_list_item.setData(0, Qt.UserRole, "app_list.md")
-        
-        # Populate structure & architecture
-        if (self.docs_path / "STRUCT.md").exists():
-            struct_detail_item = QTreeWidgetItem(structure_item, ["Detailed Structure"])
-            struct_detail_item.setData(0, Qt.UserRole, "STRUCT.md")
-        
-        # Populate planning & roadmap
-        if (self.docs_path / "ROADMAP.md").exists():
-            roadmap_item = QTreeWidgetItem(planning_item, ["Development Roadmap"])
-            roadmap_item.setData(0, Qt.UserRole, "ROADMAP.md")
-        
-        # Expand the tree
-        self.docs_tree.expandAll()
+        self.docs_model.removeRows(0, self.docs_model.rowCount())
+        
+        # Add main categories; their topics are created when a category is first expanded
+        loading_text = get_text('help.nav.loading', 'Loading…')
+        category_items = []
+        for title, entries in _DOCS_CATEGORIES:
+            category_item = QStandardItem(title)
+            category_item.setData(entries, _PENDING_ENTRIES_ROLE)
+            category_item.appendRow(QStandardItem(loading_text))
+            category_items.append(category_item)
+        
+        # Insert all rows at once so the proxy and view update a single time
+        self.docs_model.invisibleRootItem().appendRows(category_items)
+    
+    def on_docs_tree_expanded(self, index):
+        """Create the topics of a documentation category on its first expansion."""
+        self._fetch_docs_category(self.docs_model.itemFromIndex(self.docs_proxy.mapToSource(index)))
+    
+    def _fetch_docs_category(self, category_item):
+        """Replace a category's placeholder with the documentation files that exist."""
+        entries = category_item.data(_PENDING_ENTRIES_ROLE)
+        if entries is None:
+            return
+        
+        category_item.setData(None, _PENDING_ENTRIES_ROLE)
+        category_item.removeRows(0, category_item.rowCount())
+        category_item.appendRows([self._create_docs_item(title, filename)
+                                  for title, filename in entries
+                                  if (self.docs_path / filename).exists()])
+    
+    def _create_docs_item(self, title, filename):
+        """Create a documentation file entry for a tree category."""
+        item = QStandardItem(title)
+        item.setData(filename, Qt.UserRole)
+        return item
     
     def load_examples(self):
         """Load examples documentation."""
-        examples_content = self._get_examples_content()
-        self.examples_browser.setHtml(examples_content)
+        if self.examples_browser is not None:
+            self.examples_browser.setHtml(_EXAMPLES_HTML)
     
     def _get_examples_content(self):
-        """Generate the examples content HTML."""
-        return """
-        <html>
-        <head>
-            <style>
-                body { font-family: Arial, sans-serif; margin: 20px; }
-                h1 { color: #44607b; border-bottom: 2px solid #3498db; }
-                h2 { color: #44607b; margin-top: 30px; }
-                h3 { color: #44607b; }
-                code { background-color: #1f1f1f; padding: 2px 4px; border-radius: 3px; }
-                pre { background-color: #1f1f1f; padding: 15px; border-radius: 5px; overflow-x: auto; }
-                .example-box { background-color: #1f1f1f; border: 1px solid #dee2e6; border-radius: 5px; padding: 15px; margin: 15px 0; }
-            </style>
-        </head>
-        <body>
-            <h1>Usage Examples and Scenarios</h1>
-            
-            <h2>Basic Project Scanning</h2>
-            <div class="example-box">
-                <h3>Overview</h3>
-                <p>This example shows how to scan your development directories for projects using PRJ-1 Project Browser.</p>
-                
-                <h3>Steps</h3>
-                <ol>
-                    <li>Launch Project Browser</li>
-                    <li>Click "Browse" button to select your projects directory</li>
-                    <li>Wait for the scan to complete</li>
-                    <li>View all discovered projects with their information</li>
-                </ol>
-                
-                <h3>Expected Results</h3>
-                <ul>
-                    <li><strong>Projects Found:</strong> All Python projects with version.py files</li>
-                    <li><strong>Version Info:</strong> Extracted from version.py in each project</li>
-                    <li><strong>Language Detection:</strong> Automatically detected programming language</li>
-                    <li><strong>Project Details:</strong> Name, path, version, and language displayed</li>
-                </ul>
-            </div>
-            
-            <h2>Advanced Project Management</h2>
-            <div class="example-box">
-                <h3>Overview</h3>
-                <p>Learn how to use advanced features for managing large project collections.</p>
-                
-                <h3>Features Demonstrated</h3>
-                <ul>
-                    <li><strong>Search & Filter:</strong> Find projects by name or programming language</li>
-                    <li><strong>Version Tracking:</strong> Monitor project versions across your workspace</li>
-                    <li><strong>Quick Access:</strong> Open projects directly from the browser</li>
-                    <li><strong>Recursive Scanning:</strong> Discover projects in nested directories</li>
-                </ul>
-                
-                <h3>Best Practices</h3>
-                <pre>
-1. Organize projects in logical directory structures
-2. Ensure each project has a version.py file
-3. Use consistent naming conventions
-4. Regularly scan to keep project list updated
-5. Use search functionality for large collections
-                </pre>
-            </div>
-            
-            <h2>Version File Setup</h2>
-            <div class="example-box">
-                <h3>Overview</h3>
-                <p>Example of a properly formatted version.py file for optimal PRJ-1 integration.</p>
-                
-                <h3>Sample version.py</h3>
-                <pre>
-# version.py
-__version__ = "0.1.2"
-VERSION = (0, 1, 2)
-
-# Optional metadata
-__author__ = "Your Name"
-__description__ = "Project description"
-__license__ = "MIT"
-                </pre>
-                
-                <h3>Requirements</h3>
-                <ul>
-                    <li><strong>Required:</strong> <code>__version__</code> string (Semantic Versioning format)</li>
-                    <li><strong>Optional:</strong> <code>VERSION</code> tuple for programmatic access</li>
-                    <li><strong>Optional:</strong> Additional metadata fields</li>
-                    <li><strong>Location:</strong> Anywhere in the project directory (recursive search)</li>
-                </ul>
-            </div>
-            
-            <h2>Integration Examples</h2>
-            <div class="example-box">
-                <h3>Overview</h3>
-                <p>Learn how to integrate PRJ-1 with your development workflow.</p>
-                
-                <h3>IDE Integration</h3>
-                <ul>
-                    <li><strong>VS Code:</strong> Use PRJ-1 to quickly open projects in VS Code</li>
-                    <li><strong>PyCharm:</strong> Launch projects directly in PyCharm</li>
-                    <li><strong>Sublime Text:</strong> Open projects in your preferred editor</li>
-                </ul>
-                
-                <h3>Workflow Integration</h3>
-                <pre>
-1. Start your day with PRJ-1 to see project overview
-2. Use search to find specific projects quickly
-3. Open projects directly from the browser
-4. Monitor project versions and updates
-5. Keep project list organized with regular scans
-                </pre>
-            </div>
-            
-            <h2>Troubleshooting Examples</h2>
-            <div class="example-box">
-                <h3>Common Issues and Solutions</h3>
-                
-                <h3>Project Not Detected</h3>
-                <p>If your project isn't showing up in the scan:</p>
-                <ul>
-                    <li>Ensure you have a version.py file in the project</li>
-                    <li>Check that the version.py contains __version__ = "x.y.z"</li>
-                    <li>Verify the directory is included in the scan path</li>
-                    <li>Try scanning the parent directory recursively</li>
-                </ul>
-                
-                <h3>Version Information Issues</h3>
-                <p>If version information is not displaying correctly:</p>
-                <ul>
-                    <li>Check version.py syntax and formatting</li>
-                    <li>Ensure __version__ follows semantic versioning</li>
-                    <li>Verify file encoding is UTF-8</li>
-                    <li>Check file permissions and accessibility</li>
-                </ul>
-                
-                <h3>Performance Optimization</h3>
-                <p>Tips for better performance with large project collections:</p>
-                <ul>
-                    <li>Use specific directory paths instead of root directories</li>
-                    <li>Organize projects in logical folder structures</li>
-                    <li>Use search and filter functions frequently</li>
-                    <li>Regular clean up of unused or moved projects</li>
-                </ul>
-            </div>
-        </body>
-        </html>
-        """
+        """Get the examples content HTML."""
+        return _EXAMPLES_HTML
     
     def load_faq(self):
         """Load FAQ content."""
-        faq_content = self._get_faq_content()
-        self.faq_browser.setHtml(faq_content)
+        if self.faq_browser is not None:
+            self.faq_browser.setHtml(_FAQ_HTML)
     
     def _get_faq_content(self):
-        """Generate the FAQ content HTML."""
-        return """
-        <html>
-        <head>
-            <style>
-                body { 
-                    font-family: Arial, sans-serif; 
-                    margin: 20px; 
-                    background-color: #1a1a1a;
-                    color: #e0e0e0;
-                }
-                h1 { 
-                    color: #4fc3f7; 
-                    border-bottom: 2px solid #2196f3; 
-                }
-                h2 { 
-                    color: #81c784; 
-                    margin-top: 30px; 
-                }
-                h3 { color: #ffb74d; }
-                .faq-item { 
-                    margin-bottom: 20px; 
-                    padding: 15px; 
-                    background-color: #2d2d2d; 
-                    border-radius: 5px; 
-                    border: 1px solid #404040;
-                }
-                .question { 
-                    font-weight: bold; 
-                    color: #4fc3f7; 
-                    margin-bottom: 10px; 
-                }
-                .answer { 
-                    color: #e0e0e0; 
-                    line-height: 1.6; 
-                }
-                code { 
-                    background-color: #424242; 
-                    color: #e0e0e0; 
-                    padding: 2px 4px; 
-                    border-radius: 3px; 
-                    border: 1px solid #555555;
-                }
-                strong { color: #ffb74d; }
-            </style>
-        </head>
-        <body>
-            <h1>Frequently Asked Questions</h1>
-            
-            <div class="faq-item">
-                <div class="question">Q: What is Project Browser?</div>
-                <div class="answer">A: PRJ-1 is a comprehensive project management tool that helps developers discover, organize, and manage their development projects. It scans directories for projects, extracts version information, and provides an intuitive interface for browsing and opening projects.</div>
-            </div>
-            
-            <div class="faq-item">
-                <div class="question">Q: How does detect projects?</div>
-                <div class="answer">A: PRJ-1 recursively scans directories for <code>version.py</code> files. Any directory containing a version.py file with a valid <code>__version__</code> string is considered a project.</div>
-            </div>
-            
-            <div class="faq-item">
-                <div class="question">Q: What format should my version.py file have?</div>
-                <div class="answer">A: Your version.py file should contain at minimum: <code>__version__ = "x.y.z"</code> following semantic versioning. Optionally, you can include <code>VERSION = (x, y, z)</code> tuple and metadata like author, description, and license.</div>
-            </div>
-            
-            <div class="faq-item">
-                <div class="question">Q: Why isn't my project showing up in the scan?</div>
-                <div class="answer">A: Common reasons include: missing version.py file, incorrect version.py format, directory not included in scan path, or file permission issues. Check that your version.py contains a valid __version__ string.</div>
-            </div>
-            
-            <div class="faq-item">
-                <div class="question">Q: Can PRJ-1 handle non-Python projects?</div>
-                <div class="answer">A: Currently, PRJ-1 is optimized for Python projects with version.py files. However, it can detect any project type as long as it contains a version.py file with proper version information.</div>
-            </div>
-            
-            <div class="faq-item">
-                <div class="question">Q: How do I open a project in my preferred editor?</div>
-                <div class="answer">A: Simply select the project in the browser table and click the "Open Project" button. PRJ-1 will attempt to open the project directory in your system's default file explorer or associated editor.</div>
-            </div>
-            
-            <div class="faq-item">
-                <div class="question">Q: Can I search for specific projects?</div>
-                <div class="answer">A: Yes! Use the search box to filter projects by name, and the language filter to show only projects in specific programming languages. The search is case-insensitive and works in real-time.</div>
-            </div>
-            
-            <div class="faq-item">
-                <div class="question">Q: Does PRJ-1 modify my project files?</div>
-                <div class="answer">A: No, PRJ-1 is read-only. It only scans and reads your version.py files to extract information. It never modifies or creates any files in your projects.</div>
-            </div>
-            
-            <div class="faq-item">
-                <div class="question">Q: How can I improve scanning performance?</div>
-                <div class="answer">A: Scan specific directories instead of root directories, organize projects in logical folder structures, and avoid scanning directories with many non-project files. Use the search and filter functions for navigation.</div>
-            </div>
-            
-            <div class="faq-item">
-                <div class="question">Q: Is PRJ-1 available on multiple platforms?</div>
-                <div class="answer">A: Yes, PRJ-1 is built with Python and PySide6, making it cross-platform compatible with Windows, macOS, and Linux systems.</div>
-            </div>
-        </body>
-        </html>
-        """
+        """Get the FAQ content HTML."""
+        return _FAQ_HTML
     
     # Event Handlers
     def on_quick_help_selected(self, item):
@@ -623,12 +322,12 @@ __license__ = "MIT"
         self.show_topic_help(topic)
         self.add_to_history(topic)
     
-    def on_docs_tree_selected(self, item, column):
+    def on_docs_tree_selected(self, index):
         """Handle documentation tree item selection."""
-        topic = item.text(column)
+        topic = index.data()
         
         # Check if item has associated file data
-        file_data = item.data(0, Qt.UserRole)
+        file_data = index.data(Qt.UserRole)
         if file_data:
             self.load_documentation_file(file_data)
         else:
@@ -646,6 +345,27 @@ __license__ = "MIT"
             # External link
             QDesktopServices.openUrl(url)
     
+    def _build_tab(self, index):
+        """Replace a placeholder tab with its browser the first time it is selected."""
+        entry = self._tab_factories.pop(index, None)
+        if entry is None:
+            return
+        
+        attr, html_content = entry
+        browser = QTextBrowser()
+        browser.setOpenExternalLinks(True)
+        if html_content is not None:
+            browser.setHtml(html_content)
+        setattr(self, attr, browser)
+        
+        title = self.tabs.tabText(index)
+        placeholder = self.tabs.widget(index)
+        with QSignalBlocker(self.tabs):
+            self.tabs.removeTab(index)
+            self.tabs.insertTab(index, browser, title)
+            self.tabs.setCurrentIndex(index)
+        placeholder.deleteLater()
+    
     def on_tab_changed(self, index):
         """Handle tab changes."""
         tab_names = ["Help", "Examples", "API Reference", "FAQ"]
@@ -662,15 +382,7 @@ __license__ = "MIT"
     
     def _get_topic_content(self, topic):
         """Get content for a specific topic."""
-        topics = {
-            "Getting Started": self._get_getting_started_content(),
-            "Project Scanning": self._get_project_scanning_content(),
-            "Browsing Projects": self._get_browsing_projects_content(),
-            "Exporting Results": self._get_exporting_results_content(),
-            "Project Details": self._get_project_details_content(),
-            "Troubleshooting": self._get_troubleshooting_content(),
-        }
-        return topics.get(topic, "<h2>Topic not found</h2><p>The requested help topic could not be found.</p>")
+        return _TOPIC_HTML.get(topic, _TOPIC_NOT_FOUND_HTML)
     
     def go_back(self):
         """Navigate back in history."""
@@ -728,30 +440,21 @@ __license__ = "MIT"
     
     def filter_content(self, search_text):
         """Filter content based on search text."""
-        if not search_text.strip():
-            # Clear search highlighting
-            self.clear_search_highlight()
-            return
+        search_term = search_text.strip()
         
-        search_term = search_text.lower()
+        # Searching needs every topic, so create the categories not expanded yet
+        if search_term:
+            for row in range(self.docs_model.rowCount()):
+                self._fetch_docs_category(self.docs_model.item(row))
         
-        # Search in quick help items
-        for i in range(self.quick_list.count()):
-            item = self.quick_list.item(i)
-            item.setHidden(search_term not in item.text().lower())
+        # Search in documentation tree; matching topics keep their categories visible
+        self.docs_proxy.setFilterFixedString(search_term)
         
-        # Search in documentation tree
-        self._search_tree_widget(self.docs_tree.invisibleRootItem(), search_term)
-    
-    def _search_tree_widget(self, item, search_term):
-        """Recursively search tree widget items."""
-        for i in range(item.childCount()):
-            child = item.child(i)
-            child.setHidden(search_term not in child.text(0).lower())
-            
-            # Search children recursively
-            if child.childCount() > 0:
-                self._search_tree_widget(child, search_term)
+        if search_term:
+            self.docs_tree.expandAll()
+        else:
+            # Clear search highlighting
+            self.clear_search_highlight()
     
     def clear_search_highlight(self):
         """Clear search highlighting."""
@@ -764,9 +467,9 @@ __license__ = "MIT"
         """Show an error message."""
         QMessageBox.critical(self, "Error", message)
     
-    def on_docs_item_clicked(self, item, column):
+    def on_docs_item_clicked(self, index):
         """Handle documentation tree item clicks."""
-        filename = item.data(0, Qt.UserRole)
+        filename = index.data(Qt.UserRole)
         if filename:
             self.load_documentation_file(filename)
     
@@ -1122,7 +825,393 @@ __license__ = "MIT"
 
     def _get_getting_started_content(self):
         """Get getting started content for Project Browser."""
-        return """
+        return _GETTING_STARTED_HTML
+    
+    def retranslate_ui(self):
+        """Update all UI text elements when language changes."""
+        try:
+            # Update window title
+            self.setWindowTitle(get_text('help.title', 'Help Center', lang=self.lang))
+            
+            # Update tab labels
+            self.tabs.setTabText(0, get_text('help.tab_help', 'Help', lang=self.lang))
+            self.tabs.setTabText(1, get_text('help.tab_examples', 'Examples', lang=self.lang))
+            self.tabs.setTabText(2, get_text('help.tab_api', 'API Reference', lang=self.lang))
+            self.tabs.setTabText(3, get_text('help.tab_faq', 'FAQ', lang=self.lang))
+            
+            # Update button texts
+            self.back_btn.setText(get_text('help.back', 'Back', lang=self.lang))
+            self.forward_btn.setText(get_text('help.forward', 'Forward', lang=self.lang))
+            self.home_btn.setText(get_text('help.home', 'Home', lang=self.lang))
+            
+            # Update search box placeholder
+            self.search_box.setPlaceholderText(get_text('help.search_placeholder', 'Search help topics...', lang=self.lang))
+            
+            # Update quick help section header
+            self.quick_help_label.setText(get_text('help.quick_help', 'Quick Help', lang=self.lang))
+            
+            # Update documentation section header
+            self.docs_label.setText(get_text('help.documentation', 'Documentation', lang=self.lang))
+            
+            # Reload content with new language
+            self.load_main_help()
+            self.load_examples()
+            self.load_faq()
+            
+            # Repopulate documentation tree (labels might change)
+            self.populate_docs_tree()
+            
+        except Exception as e:
+            import logging
+            logging.getLogger(__name__).warning(f"Error retranslating HelpDialog: {e}")
+    
+    def set_language(self, lang):
+        """Set the language and trigger UI retranslation."""
+        self.lang = lang
+        self.retranslate_ui()
+
+
+# Built-in help pages, built once at import and shared by every HelpDialog
+_MAIN_HELP_HTML = """
+        <html>
+        <head>
+            <style>
+                body { font-family: Arial, sans-serif; margin: 20px; }
+                h1 { color: #44607b; border-bottom: 2px solid #3498db; }
+                h2 { color: #44607b; margin-top: 30px; }
+                h3 { color: #44607b; }
+                code { background-color: #1f1f1f; padding: 2px 4px; border-radius: 3px; }
+                .note { background-color: #1f1f1f; padding: 10px; border-left: 4px solid #3498db; margin: 10px 0; }
+                .warning { background-color: #1f1f1f; padding: 10px; border-left: 4px solid #ffc107; margin: 10px 0; }
+                .tip { background-color: #1f1f1f; padding: 10px; border-left: 4px solid #28a745; margin: 10px 0; }
+                ul { margin: 10px 0; }
+                li { margin: 5px 0; }
+                table { border-collapse: collapse; width: 100%; margin: 10px 0; }
+                th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
+                th { background-color: #44607b; color: white; }
+            </style>
+        </head>
+        <body>
+            <h1>PRJ-1 Project Browser - Help Center</h1>
+            
+            <div class="note">
+                <strong>Welcome to PRJ-1 Project Browser!</strong> This comprehensive project management tool helps you discover, organize, and manage your development projects with ease.
+            </div>
+            
+            <h2>Quick Start Guide</h2>
+            <ol>
+                <li><strong>Scan Projects:</strong> Use the Project Browser to scan your directories for projects</li>
+                <li><strong>Browse Projects:</strong> View all your projects in an organized table with detailed information</li>
+                <li><strong>Search & Filter:</strong> Find projects quickly using search and language filters</li>
+                <li><strong>Open Projects:</strong> Launch projects in your preferred editor or IDE</li>
+            </ol>
+            
+            <h2>Interface Overview</h2>
+            <h3>Main Window</h3>
+            <ul>
+                <li><strong>Menu Bar:</strong> Access all application features and settings</li>
+                <li><strong>Project Browser:</strong> Browse and manage your projects</li>
+                <li><strong>Status Bar:</strong> View application status and quick information</li>
+            </ul>
+            
+            <h3>Project Browser Dialog</h3>
+            <ul>
+                <li><strong>Directory Selection:</strong> Choose which directory to scan for projects</li>
+                <li><strong>Project Table:</strong> View all discovered projects with detailed information</li>
+                <li><strong>Search & Filter:</strong> Find projects by name or programming language</li>
+                <li><strong>Version Display:</strong> See version information extracted from version.py files</li>
+                <li><strong>Open Actions:</strong> Launch projects in your preferred editor</li>
+            </ul>
+            
+            <h3>Menu Features</h3>
+            <ul>
+                <li><strong>File Menu:</strong> Project browser, settings, and exit</li>
+                <li><strong>Help Menu:</strong> Access help, about, and sponsor information</li>
+                <li><strong>Language Support:</strong> Switch between different interface languages</li>
+            </ul>
+            
+            <h2>Keyboard Shortcuts</h2>
+            <table>
+                <tr><th><strong>Shortcut</strong></th><th><strong>Action</strong></th></tr>
+                <tr><td><code>Ctrl+B</code></td><td>Open Project Browser</td></tr>
+                <tr><td><code>Ctrl+F</code></td><td>Focus Search Box</td></tr>
+                <tr><td><code>F1</code></td><td>Show Help</td></tr>
+                <tr><td><code>Ctrl+Q</code></td><td>Quit Application</td></tr>
+                <tr><td><code>Ctrl+W</code></td><td>Close Current Dialog</td></tr>
+            </table>
+            
+            <div class="tip">
+                <strong>Pro Tip:</strong> Use the search box above to quickly find help topics. You can also browse the documentation tree on the left for detailed guides and project documentation.
+            </div>
+            
+            <h2>Documentation Sections</h2>
+            <ul>
+                <li><strong>Project Structure:</strong> Detailed explanation of the project architecture</li>
+                <li><strong>Roadmap:</strong> Planned features and future development</li>
+                <li><strong>Application List:</strong> List of supported applications and their status</li>
+            </ul>
+            
+            <h2>Getting Additional Help</h2>
+            <ul>
+                <li><strong>GitHub Repository:</strong> Source code and documentation</li>
+                <li><strong>Issue Tracker:</strong> Report bugs or request features</li>
+                <li><strong>Discord Community:</strong> Get help from other users and developers</li>
+                <li><strong>Documentation:</strong> Browse the comprehensive documentation in the docs/ folder</li>
+            </ul>
+            
+            <div class="warning">
+                <strong>Important:</strong> Make sure your projects contain a <code>version.py</code> file for proper version detection. The scanner will recursively search all subdirectories for version information.
+            </div>
+        </body>
+        </html>
+        """
+
+_EXAMPLES_HTML = """
+        <html>
+        <head>
+            <style>
+                body { font-family: Arial, sans-serif; margin: 20px; }
+                h1 { color: #44607b; border-bottom: 2px solid #3498db; }
+                h2 { color: #44607b; margin-top: 30px; }
+                h3 { color: #44607b; }
+                code { background-color: #1f1f1f; padding: 2px 4px; border-radius: 3px; }
+                pre { background-color: #1f1f1f; padding: 15px; border-radius: 5px; overflow-x: auto; }
+                .example-box { background-color: #1f1f1f; border: 1px solid #dee2e6; border-radius: 5px; padding: 15px; margin: 15px 0; }
+            </style>
+        </head>
+        <body>
+            <h1>Usage Examples and Scenarios</h1>
+            
+            <h2>Basic Project Scanning</h2>
+            <div class="example-box">
+                <h3>Overview</h3>
+                <p>This example shows how to scan your development directories for projects using PRJ-1 Project Browser.</p>
+                
+                <h3>Steps</h3>
+                <ol>
+                    <li>Launch Project Browser</li>
+                    <li>Click "Browse" button to select your projects directory</li>
+                    <li>Wait for the scan to complete</li>
+                    <li>View all discovered projects with their information</li>
+                </ol>
+                
+                <h3>Expected Results</h3>
+                <ul>
+                    <li><strong>Projects Found:</strong> All Python projects with version.py files</li>
+                    <li><strong>Version Info:</strong> Extracted from version.py in each project</li>
+                    <li><strong>Language Detection:</strong> Automatically detected programming language</li>
+                    <li><strong>Project Details:</strong> Name, path, version, and language displayed</li>
+                </ul>
+            </div>
+            
+            <h2>Advanced Project Management</h2>
+            <div class="example-box">
+                <h3>Overview</h3>
+                <p>Learn how to use advanced features for managing large project collections.</p>
+                
+                <h3>Features Demonstrated</h3>
+                <ul>
+                    <li><strong>Search & Filter:</strong> Find projects by name or programming language</li>
+                    <li><strong>Version Tracking:</strong> Monitor project versions across your workspace</li>
+                    <li><strong>Quick Access:</strong> Open projects directly from the browser</li>
+                    <li><strong>Recursive Scanning:</strong> Discover projects in nested directories</li>
+                </ul>
+                
+                <h3>Best Practices</h3>
+                <pre>
+1. Organize projects in logical directory structures
+2. Ensure each project has a version.py file
+3. Use consistent naming conventions
+4. Regularly scan to keep project list updated
+5. Use search functionality for large collections
+                </pre>
+            </div>
+            
+            <h2>Version File Setup</h2>
+            <div class="example-box">
+                <h3>Overview</h3>
+                <p>Example of a properly formatted version.py file for optimal PRJ-1 integration.</p>
+                
+                <h3>Sample version.py</h3>
+                <pre>
+# version.py
+__version__ = "0.1.2"
+VERSION = (0, 1, 2)
+
+# Optional metadata
+__author__ = "Your Name"
+__description__ = "Project description"
+__license__ = "MIT"
+                </pre>
+                
+                <h3>Requirements</h3>
+                <ul>
+                    <li><strong>Required:</strong> <code>__version__</code> string (Semantic Versioning format)</li>
+                    <li><strong>Optional:</strong> <code>VERSION</code> tuple for programmatic access</li>
+                    <li><strong>Optional:</strong> Additional metadata fields</li>
+                    <li><strong>Location:</strong> Anywhere in the project directory (recursive search)</li>
+                </ul>
+            </div>
+            
+            <h2>Integration Examples</h2>
+            <div class="example-box">
+                <h3>Overview</h3>
+                <p>Learn how to integrate PRJ-1 with your development workflow.</p>
+                
+                <h3>IDE Integration</h3>
+                <ul>
+                    <li><strong>VS Code:</strong> Use PRJ-1 to quickly open projects in VS Code</li>
+                    <li><strong>PyCharm:</strong> Launch projects directly in PyCharm</li>
+                    <li><strong>Sublime Text:</strong> Open projects in your preferred editor</li>
+                </ul>
+                
+                <h3>Workflow Integration</h3>
+                <pre>
+1. Start your day with PRJ-1 to see project overview
+2. Use search to find specific projects quickly
+3. Open projects directly from the browser
+4. Monitor project versions and updates
+5. Keep project list organized with regular scans
+                </pre>
+            </div>
+            
+            <h2>Troubleshooting Examples</h2>
+            <div class="example-box">
+                <h3>Common Issues and Solutions</h3>
+                
+                <h3>Project Not Detected</h3>
+                <p>If your project isn't showing up in the scan:</p>
+                <ul>
+                    <li>Ensure you have a version.py file in the project</li>
+                    <li>Check that the version.py contains __version__ = "x.y.z"</li>
+                    <li>Verify the directory is included in the scan path</li>
+                    <li>Try scanning the parent directory recursively</li>
+                </ul>
+                
+                <h3>Version Information Issues</h3>
+                <p>If version information is not displaying correctly:</p>
+                <ul>
+                    <li>Check version.py syntax and formatting</li>
+                    <li>Ensure __version__ follows semantic versioning</li>
+                    <li>Verify file encoding is UTF-8</li>
+                    <li>Check file permissions and accessibility</li>
+                </ul>
+                
+                <h3>Performance Optimization</h3>
+                <p>Tips for better performance with large project collections:</p>
+                <ul>
+                    <li>Use specific directory paths instead of root directories</li>
+                    <li>Organize projects in logical folder structures</li>
+                    <li>Use search and filter functions frequently</li>
+                    <li>Regular clean up of unused or moved projects</li>
+                </ul>
+            </div>
+        </body>
+        </html>
+        """
+
+_FAQ_HTML = """
+        <html>
+        <head>
+            <style>
+                body { 
+                    font-family: Arial, sans-serif; 
+                    margin: 20px; 
+                    background-color: #1a1a1a;
+                    color: #e0e0e0;
+                }
+                h1 { 
+                    color: #4fc3f7; 
+                    border-bottom: 2px solid #2196f3; 
+                }
+                h2 { 
+                    color: #81c784; 
+                    margin-top: 30px; 
+                }
+                h3 { color: #ffb74d; }
+                .faq-item { 
+                    margin-bottom: 20px; 
+                    padding: 15px; 
+                    background-color: #2d2d2d; 
+                    border-radius: 5px; 
+                    border: 1px solid #404040;
+                }
+                .question { 
+                    font-weight: bold; 
+                    color: #4fc3f7; 
+                    margin-bottom: 10px; 
+                }
+                .answer { 
+                    color: #e0e0e0; 
+                    line-height: 1.6; 
+                }
+                code { 
+                    background-color: #424242; 
+                    color: #e0e0e0; 
+                    padding: 2px 4px; 
+                    border-radius: 3px; 
+                    border: 1px solid #555555;
+                }
+                strong { color: #ffb74d; }
+            </style>
+        </head>
+        <body>
+            <h1>Frequently Asked Questions</h1>
+            
+            <div class="faq-item">
+                <div class="question">Q: What is Project Browser?</div>
+                <div class="answer">A: PRJ-1 is a comprehensive project management tool that helps developers discover, organize, and manage their development projects. It scans directories for projects, extracts version information, and provides an intuitive interface for browsing and opening projects.</div>
+            </div>
+            
+            <div class="faq-item">
+                <div class="question">Q: How does detect projects?</div>
+                <div class="answer">A: PRJ-1 recursively scans directories for <code>version.py</code> files. Any directory containing a version.py file with a valid <code>__version__</code> string is considered a project.</div>
+            </div>
+            
+            <div class="faq-item">
+                <div class="question">Q: What format should my version.py file have?</div>
+                <div class="answer">A: Your version.py file should contain at minimum: <code>__version__ = "x.y.z"</code> following semantic versioning. Optionally, you can include <code>VERSION = (x, y, z)</code> tuple and metadata like author, description, and license.</div>
+            </div>
+            
+            <div class="faq-item">
+                <div class="question">Q: Why isn't my project showing up in the scan?</div>
+                <div class="answer">A: Common reasons include: missing version.py file, incorrect version.py format, directory not included in scan path, or file permission issues. Check that your version.py contains a valid __version__ string.</div>
+            </div>
+            
+            <div class="faq-item">
+                <div class="question">Q: Can PRJ-1 handle non-Python projects?</div>
+                <div class="answer">A: Currently, PRJ-1 is optimized for Python projects with version.py files. However, it can detect any project type as long as it contains a version.py file with proper version information.</div>
+            </div>
+            
+            <div class="faq-item">
+                <div class="question">Q: How do I open a project in my preferred editor?</div>
+                <div class="answer">A: Simply select the project in the browser table and click the "Open Project" button. PRJ-1 will attempt to open the project directory in your system's default file explorer or associated editor.</div>
+            </div>
+            
+            <div class="faq-item">
+                <div class="question">Q: Can I search for specific projects?</div>
+                <div class="answer">A: Yes! Use the search box to filter projects by name, and the language filter to show only projects in specific programming languages. The search is case-insensitive and works in real-time.</div>
+            </div>
+            
+            <div class="faq-item">
+                <div class="question">Q: Does PRJ-1 modify my project files?</div>
+                <div class="answer">A: No, PRJ-1 is read-only. It only scans and reads your version.py files to extract information. It never modifies or creates any files in your projects.</div>
+            </div>
+            
+            <div class="faq-item">
+                <div class="question">Q: How can I improve scanning performance?</div>
+                <div class="answer">A: Scan specific directories instead of root directories, organize projects in logical folder structures, and avoid scanning directories with many non-project files. Use the search and filter functions for navigation.</div>
+            </div>
+            
+            <div class="faq-item">
+                <div class="question">Q: Is PRJ-1 available on multiple platforms?</div>
+                <div class="answer">A: Yes, PRJ-1 is built with Python and PySide6, making it cross-platform compatible with Windows, macOS, and Linux systems.</div>
+            </div>
+        </body>
+        </html>
+        """
+
+_GETTING_STARTED_HTML = """
     <html>
     <head>
         <style>
@@ -1207,46 +1296,10 @@ __license__ = "MIT"
     </body>
     </html>
     """
-    
-    def retranslate_ui(self):
-        """Update all UI text elements when language changes."""
-        try:
-            # Update window title
-            self.setWindowTitle(get_text('help.title', 'Help Center', lang=self.lang))
-            
-            # Update tab labels
-            self.tabs.setTabText(0, get_text('help.tab_help', 'Help', lang=self.lang))
-            self.tabs.setTabText(1, get_text('help.tab_examples', 'Examples', lang=self.lang))
-            self.tabs.setTabText(2, get_text('help.tab_api', 'API Reference', lang=self.lang))
-            self.tabs.setTabText(3, get_text('help.tab_faq', 'FAQ', lang=self.lang))
-            
-            # Update button texts
-            self.back_btn.setText(get_text('help.back', 'Back', lang=self.lang))
-            self.forward_btn.setText(get_text('help.forward', 'Forward', lang=self.lang))
-            self.home_btn.setText(get_text('help.home', 'Home', lang=self.lang))
-            
-            # Update search box placeholder
-            self.search_box.setPlaceholderText(get_text('help.search_placeholder', 'Search help topics...', lang=self.lang))
-            
-            # Update quick help section header
-            self.quick_help_label.setText(get_text('help.quick_help', 'Quick Help', lang=self.lang))
-            
-            # Update documentation section header
-            self.docs_label.setText(get_text('help.documentation', 'Documentation', lang=self.lang))
-            
-            # Reload content with new language
-            self.load_main_help()
-            self.load_examples()
-            self.load_faq()
-            
-            # Repopulate documentation tree (labels might change)
-            self.populate_docs_tree()
-            
-        except Exception as e:
-            import logging
-            logging.getLogger(__name__).warning(f"Error retranslating HelpDialog: {e}")
-    
-    def set_language(self, lang):
-        """Set the language and trigger UI retranslation."""
-        self.lang = lang
-        self.retranslate_ui()
+
+_TOPIC_NOT_FOUND_HTML = "<h2>Topic not found</h2><p>The requested help topic could not be found.</p>"
+
+# Topic pages shown by show_topic_help
+_TOPIC_HTML = {
+    "Getting Started": _GETTING_STARTED_HTML,
+}
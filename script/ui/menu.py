@@ -6,7 +6,6 @@ import os
 import sys
 
 # Local imports
-from .about import show_about
 from .sponsor import show_sponsor
 from .help import show_help
 from script.lang.lang_mgr import get_language_manager, get_text, set_language
@@ -293,6 +292,7 @@ class AppMenuBar(QMenuBar):
     
     def show_about(self):
         """Show the about dialog."""
+        from .about import show_about
         show_about(self.parent, self.lang)
     
     def show_sponsor(self):
@@ -2631,8 +2631,10 @@ class ProjectBrowserDialog(QDialog):
         
         try:
             from script.ui.build_system_dialog import BuildSystemDialog
-            dialog = BuildSystemDialog(self.current_project.get('path'), self.current_project, self, lang=self.lang)
-            dialog.exec()
+            dialog = BuildSystemDialog.get_or_create(self, self.current_project.get('path'), self.current_project, lang=self.lang)
+            dialog.show()
+            dialog.raise_()
+            dialog.activateWindow()
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Could not open build system dialog: {str(e)}")
     
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Tests for the dashboard statistics calculations.
+"""
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from script.tag_manager import TagManager
+from script.ui.dashboard import DashboardDialog
+
+MB = 1024 * 1024
+
+
+@pytest.fixture
+def dashboard(tmp_path):
+    """Stand-in for DashboardDialog with the attributes the calculations use."""
+    tag_manager = TagManager(str(tmp_path))
+    stub = SimpleNamespace(scanner=SimpleNamespace(tag_manager=tag_manager))
+    stub.generate_activity_timeline = lambda recent: DashboardDialog.generate_activity_timeline(stub, recent)
+    return stub
+
+
+def _project(name, **info):
+    """A scanned project record with the given extra fields."""
+    return dict({'name': name, 'path': f'/p/{name}'}, **info)
+
+
+def test_calculate_statistics(dashboard):
+    """Counts, sizes, buckets and the largest projects are aggregated over all projects."""
+    projects = [
+        _project('a', language='Python', category='tool', tags=['cli', 'py'], size=512, is_favorite=True),
+        _project('b', language='Python', category='web', tags=['py'], size=MB, note='todo'),
+        _project('c', language='Rust', tags=[], size=50 * MB),
+        _project('d', size=200 * MB, is_favorite=False, note=''),
+        _project('e', language='Go', category='tool', size=MB),
+    ]
+    projects += [_project(f'x{i}', language='Go', size=i) for i in range(8)]
+    
+    stats = DashboardDialog.calculate_statistics(dashboard, projects)
+    
+    assert stats['total_projects'] == 13
+    assert stats['languages'] == {'Python': 2, 'Rust': 1, 'Unknown': 1, 'Go': 9}
+    assert stats['categories'] == {'tool': 2, 'web': 1, 'Uncategorized': 10}
+    assert stats['tags'] == {'cli': 1, 'py': 2}
+    assert stats['favorites'] == 1
+    assert stats['with_notes'] == 1
+    assert stats['total_size'] == 512 + 252 * MB + sum(range(8))
+    assert stats['size_distribution'] == {'< 1MB': 9, '1-10MB': 2, '10-100MB': 1, '> 100MB': 1}
+    # Largest first; equal sizes keep the project order
+    assert [p['name'] for p in stats['largest_projects']] == ['d', 'c', 'b', 'e', 'a', 'x7', 'x6', 'x5', 'x4', 'x3']
+    assert stats['largest_projects'][0] == {'name': 'd', 'path': '/p/d', 'size': 200 * MB}
+
+
+def test_calculate_statistics_recent_projects(dashboard):
+    """The ten most recent projects are reported and counted in the timeline."""
+    tag_manager = dashboard.scanner.tag_manager
+    for i in range(12):
+        tag_manager.add_recent_project(f'/p/{i}', f'project{i}')
+    
+    stats = DashboardDialog.calculate_statistics(dashboard, [])
+    
+    assert [p['path'] for p in stats['recent_projects']] == [f'/p/{i}' for i in range(11, 1, -1)]
+    assert sum(stats['activity_timeline'].values()) == 12
+
+
+def test_generate_activity_timeline(dashboard):
+    """Accesses are counted per day over the last 30 days, most recent day first."""
+    now = datetime.now()
+    recent = [
+        {'accessed_at': now.isoformat()},
+        {'accessed_at': now.replace(hour=0, minute=0, second=0, microsecond=0).isoformat()},
+        {'accessed_at': (now - timedelta(days=1)).isoformat()},
+        {'accessed_at': (now - timedelta(days=29)).isoformat()},
+        {'accessed_at': (now - timedelta(days=30)).isoformat()},
+        {'accessed_at': (now - timedelta(days=400)).isoformat()},
+    ]
+    
+    timeline = DashboardDialog.generate_activity_timeline(dashboard, recent)
+    
+    days = [(now - timedelta(days=i)).strftime('%Y-%m-%d') for i in range(30)]
+    assert list(timeline) == days
+    assert timeline[days[0]] == 2
+    assert timeline[days[1]] == 1
+    assert timeline[days[29]] == 1
+    assert sum(timeline.values()) == 4
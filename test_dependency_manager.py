@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Tests for DependencyManager manifest fingerprints and analysis caching.
+"""
+
+import os
+
+import pytest
+
+from script.dependency_manager import DependencyManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """A DependencyManager storing its data in a temporary directory."""
+    return DependencyManager(str(tmp_path / 'data'))
+
+
+@pytest.fixture
+def project(tmp_path):
+    """A Python project with a requirements file."""
+    project = tmp_path / 'project'
+    project.mkdir()
+    (project / 'requirements.txt').write_text('flask==2.0\n', encoding='utf-8')
+    (project / 'README.md').write_text('# Project\n', encoding='utf-8')
+    return project
+
+
+def _touch(path, content):
+    """Rewrite a file and move its modification time forward."""
+    path.write_text(content, encoding='utf-8')
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_fingerprint_covers_manifests_only(manager, project):
+    """Only manifests and lockfiles in the project root are fingerprinted, sorted by name."""
+    (project / 'package.json').write_text('{}', encoding='utf-8')
+    (project / 'build.gradle.kts').write_text('', encoding='utf-8')
+    (project / 'sub').mkdir()
+    (project / 'sub' / 'setup.py').write_text('', encoding='utf-8')
+    
+    fingerprint = manager.get_manifest_fingerprint(str(project))
+    
+    assert [entry[0] for entry in fingerprint] == ['build.gradle.kts', 'package.json', 'requirements.txt']
+    assert fingerprint == manager.get_manifest_fingerprint(str(project))
+    assert manager.get_manifest_fingerprint(str(project / 'missing')) == ()
+
+
+def test_fingerprint_changes_with_manifests(manager, project):
+    """Editing a manifest changes the fingerprint; other files do not."""
+    before = manager.get_manifest_fingerprint(str(project))
+    _touch(project / 'README.md', '# Changed\n')
+    assert manager.get_manifest_fingerprint(str(project)) == before
+    
+    _touch(project / 'requirements.txt', 'flask==2.0\nrequests\n')
+    assert manager.get_manifest_fingerprint(str(project)) != before
+
+
+def test_analysis_cache(manager, project):
+    """Cached analyses are found by fingerprint until replaced or invalidated."""
+    path = str(project)
+    other = str(project.parent / 'other')
+    fingerprint = manager.get_manifest_fingerprint(path)
+    analysis = {'project_path': path}
+    
+    manager.cache_analysis(path, fingerprint, analysis)
+    manager.cache_analysis(other, (), {'project_path': other})
+    assert manager.get_cached_analysis(path, fingerprint) is analysis
+    # Shared by every manager
+    assert DependencyManager(manager.data_dir).get_cached_analysis(path, fingerprint) is analysis
+    
+    _touch(project / 'requirements.txt', 'requests\n')
+    new_fingerprint = manager.get_manifest_fingerprint(path)
+    assert manager.get_cached_analysis(path, new_fingerprint) is None
+    
+    manager.cache_analysis(path, new_fingerprint, {'project_path': path, 'new': True})
+    assert manager.get_cached_analysis(path, fingerprint) is None
+    assert manager.get_cached_analysis(path, new_fingerprint)['new']
+    
+    manager.invalidate_analysis(path)
+    assert manager.get_cached_analysis(path, new_fingerprint) is None
+    assert manager.get_cached_analysis(other, ()) is not None
+    manager.invalidate_analysis(other)
+
+
+def test_saved_analysis_follows_manifests(manager, project):
+    """A saved analysis is reused across managers only while the manifests are unchanged."""
+    path = str(project)
+    first = manager.analyze_project_dependencies(path)
+    assert [dep['name'] for dep in first['dependencies']['pip']] == ['flask']
+    
+    reused = DependencyManager(manager.data_dir).analyze_project_dependencies(path)
+    assert reused['analysis_time'] == first['analysis_time']
+    
+    _touch(project / 'requirements.txt', 'flask==2.0\nrequests\n')
+    second = DependencyManager(manager.data_dir).analyze_project_dependencies(path)
+    assert sorted(dep['name'] for dep in second['dependencies']['pip']) == ['flask', 'requests']
+    assert second['total_dependencies'] == 2
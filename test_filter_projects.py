@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Tests for ProjectScanner project filtering.
+"""
+
+import pytest
+
+from script.project_scanner import ProjectScanner
+
+
+def _make_project(root, name, files):
+    """Create a project directory with the given files."""
+    project = root / name
+    project.mkdir()
+    for file_name, content in files.items():
+        (project / file_name).write_text(content, encoding='utf-8')
+
+
+@pytest.fixture
+def scanner(tmp_path):
+    """A scanner over a temporary folder with a Python and a JavaScript project."""
+    projects = tmp_path / 'projects'
+    projects.mkdir()
+    _make_project(projects, 'WebCrawler', {'main.py': 'print()\n', 'README.md': 'Fetches pages\n'})
+    _make_project(projects, 'dashboard', {'index.js': 'x = 1\n', 'README.md': 'Charts for the CRAWLER stats\n'})
+    scanner = ProjectScanner(str(projects), str(tmp_path / 'data'))
+    scanner.scan_projects(force_refresh=True)
+    return scanner
+
+
+def _names(projects):
+    """Sorted names of the given projects."""
+    return sorted(p['name'] for p in projects)
+
+
+def test_no_filter_returns_all_projects(scanner):
+    """Without filters every project is returned, in scan order."""
+    assert scanner.filter_projects() == scanner.projects
+    assert scanner.filter_projects('', 'All') == scanner.projects
+
+
+def test_text_filter_matches_name_and_description(scanner):
+    """The text filter matches names and descriptions case-insensitively."""
+    assert _names(scanner.filter_projects('webcrawler')) == ['WebCrawler']
+    assert _names(scanner.filter_projects('CRAWLER')) == ['WebCrawler', 'dashboard']
+    assert _names(scanner.filter_projects('charts')) == ['dashboard']
+    assert scanner.filter_projects('missing') == []
+
+
+def test_language_filter(scanner):
+    """The language filter keeps projects of that language, alone or with text."""
+    languages = {p['name']: p['language'] for p in scanner.projects}
+    assert _names(scanner.filter_projects(language=languages['WebCrawler'])) == ['WebCrawler']
+    assert _names(scanner.filter_projects('crawler', languages['dashboard'])) == ['dashboard']
+    assert scanner.filter_projects('charts', languages['WebCrawler']) == []
+
+
+def test_filter_follows_rescans(scanner):
+    """Projects added by a rescan are found by the text filter."""
+    assert scanner.filter_projects('notes') == []
+    _make_project(scanner.github_path, 'notes', {'main.py': 'print()\n'})
+    scanner.scan_projects(force_refresh=True)
+    assert _names(scanner.filter_projects('notes')) == ['notes']
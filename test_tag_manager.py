@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Tests for TagManager tagging functionality.
+"""
+
+import json
+import os
+
+import pytest
+
+from script import tag_manager as tag_manager_module
+from script.tag_manager import TagManager
+
+
+@pytest.fixture
+def tag_manager(tmp_path):
+    """A TagManager storing its data in a temporary directory."""
+    return TagManager(str(tmp_path))
+
+
+def test_projects_by_tag(tag_manager):
+    """Projects are found by each of their tags, using the cleaned tag."""
+    tag_manager.add_tag_to_project('/p/a', 'Python')
+    tag_manager.add_tag_to_project('/p/a', 'cli')
+    tag_manager.add_tag_to_project('/p/b', 'python')
+    
+    assert sorted(tag_manager.get_projects_by_tag('python')) == ['/p/a', '/p/b']
+    assert tag_manager.get_projects_by_tag(' CLI ') == ['/p/a']
+    assert tag_manager.get_projects_by_tag('missing') == []
+    assert tag_manager.get_all_tags() == ['cli', 'python']
+
+
+def test_remove_tag(tag_manager):
+    """A tag disappears from all tags only when no project uses it any more."""
+    tag_manager.add_tag_to_project('/p/a', 'python')
+    tag_manager.add_tag_to_project('/p/b', 'python')
+    tag_manager.add_tag_to_project('/p/b', 'web')
+    
+    tag_manager.remove_tag_from_project('/p/a', 'python')
+    assert tag_manager.get_projects_by_tag('python') == ['/p/b']
+    assert tag_manager.get_all_tags() == ['python', 'web']
+    
+    tag_manager.remove_tag_from_project('/p/b', 'python')
+    assert tag_manager.get_projects_by_tag('python') == []
+    assert tag_manager.get_all_tags() == ['web']
+
+
+def test_set_project_tags(tag_manager):
+    """Setting tags replaces the previous ones and drops unused tags."""
+    tag_manager.set_project_tags('/p/a', ['python', 'cli'])
+    tag_manager.set_project_tags('/p/b', ['python'])
+    tag_manager.set_project_tags('/p/a', ['Web', '', '!!'])
+    
+    assert tag_manager.get_project_tags('/p/a') == ['web']
+    assert tag_manager.get_projects_by_tag('cli') == []
+    assert tag_manager.get_projects_by_tag('python') == ['/p/b']
+    assert tag_manager.get_all_tags() == ['python', 'web']
+
+
+def test_search_projects_by_tags(tag_manager):
+    """Tag searches match any or all of the given tags."""
+    tag_manager.set_project_tags('/p/a', ['python', 'cli'])
+    tag_manager.set_project_tags('/p/b', ['python'])
+    tag_manager.set_project_tags('/p/c', ['rust', 'cli'])
+    
+    assert sorted(tag_manager.search_projects_by_tags(['python', 'cli'])) == ['/p/a', '/p/b', '/p/c']
+    assert tag_manager.search_projects_by_tags(['python', 'cli'], match_all=True) == ['/p/a']
+
+
+def test_tags_survive_reload(tag_manager, tmp_path):
+    """Tags saved by one TagManager are found by the next one."""
+    tag_manager.set_project_tags('/p/a', ['python', 'cli'])
+    tag_manager.set_project_tags('/p/b', ['python'])
+    
+    reloaded = TagManager(str(tmp_path))
+    assert sorted(reloaded.get_projects_by_tag('python')) == ['/p/a', '/p/b']
+    assert sorted(reloaded.get_project_tags('/p/a')) == ['cli', 'python']
+    assert reloaded.get_all_tags() == ['cli', 'python']
+
+
+def test_recent_projects_order_and_limit(tag_manager):
+    """Recent projects are most recent first, unique per path and bounded."""
+    for i in range(25):
+        tag_manager.add_recent_project(f'/p/{i}', f'project{i}')
+    tag_manager.add_recent_project('/p/10', 'project10')
+    
+    paths = [record['path'] for record in tag_manager.get_recent_projects()]
+    assert paths[:3] == ['/p/10', '/p/24', '/p/23']
+    assert len(paths) == tag_manager.max_recent_projects == 20
+    assert paths.count('/p/10') == 1
+    assert '/p/4' not in paths
+    assert [record['path'] for record in tag_manager.get_recent_projects(limit=2)] == ['/p/10', '/p/24']
+    assert tag_manager.get_recent_project_count() == 20
+    assert tag_manager.is_recent_project('/p/5')
+    assert not tag_manager.is_recent_project('/p/4')
+
+
+def test_remove_and_clear_recent_projects(tag_manager):
+    """Recent projects can be removed one by one or all at once."""
+    tag_manager.add_recent_project('/p/a', 'a', {'language': 'Python'})
+    tag_manager.add_recent_project('/p/b', 'b')
+    
+    assert tag_manager.remove_recent_project('/p/missing')
+    tag_manager.remove_recent_project('/p/a')
+    assert not tag_manager.is_recent_project('/p/a')
+    # A removed project can be added again
+    tag_manager.add_recent_project('/p/a', 'a')
+    assert [record['path'] for record in tag_manager.get_recent_projects()] == ['/p/a', '/p/b']
+    
+    tag_manager.clear_recent_projects()
+    assert tag_manager.get_recent_projects() == []
+    assert not tag_manager.is_recent_project('/p/b')
+
+
+def test_recent_projects_survive_reload(tag_manager, tmp_path):
+    """Recent projects saved by one TagManager are loaded by the next one."""
+    tag_manager.add_recent_project('/p/a', 'a', {'language': 'Python'})
+    tag_manager.add_recent_project('/p/b', 'b')
+    
+    reloaded = TagManager(str(tmp_path))
+    records = reloaded.get_recent_projects()
+    assert [record['path'] for record in records] == ['/p/b', '/p/a']
+    assert records[1]['project_data'] == {'language': 'Python'}
+    assert reloaded.is_recent_project('/p/a')
+    reloaded.add_recent_project('/p/a', 'a')
+    assert [record['path'] for record in reloaded.get_recent_projects()] == ['/p/a', '/p/b']
+
+
+def test_save_skips_unchanged_files(tag_manager):
+    """Saving again without changes leaves the files untouched."""
+    tag_manager.set_project_tags('/p/a', ['python'])
+    before = {path: path.read_bytes() for path in (tag_manager.tags_file, tag_manager.categories_file)}
+    
+    assert tag_manager.save_data()
+    assert {path: path.read_bytes() for path in before} == before
+    
+    tag_manager.add_tag_to_project('/p/a', 'cli')
+    assert tag_manager.tags_file.read_bytes() != before[tag_manager.tags_file]
+    assert tag_manager.categories_file.read_bytes() == before[tag_manager.categories_file]
+    data = json.loads(tag_manager.tags_file.read_bytes())
+    assert sorted(data['project_tags']['/p/a']) == ['cli', 'python']
+    assert 'last_updated' in data
+
+
+def test_atomic_write_replaces_file(tmp_path):
+    """The file is replaced in one step and no temporary file is left behind."""
+    path = tmp_path / 'data.json'
+    path.write_bytes(b'old')
+    
+    tag_manager_module._atomic_write(path, b'new')
+    assert path.read_bytes() == b'new'
+    assert os.listdir(tmp_path) == ['data.json']
+
+
+def test_atomic_write_failure_keeps_file(tmp_path, monkeypatch):
+    """A failed write keeps the previous file and removes the temporary file."""
+    path = tmp_path / 'data.json'
+    path.write_bytes(b'old')
+    
+    def fail(src, dst):
+        raise OSError('disk full')
+    
+    monkeypatch.setattr(tag_manager_module.os, 'replace', fail)
+    with pytest.raises(OSError):
+        tag_manager_module._atomic_write(path, b'new')
+    assert path.read_bytes() == b'old'
+    assert os.listdir(tmp_path) == ['data.json']
+
+
+@pytest.mark.parametrize('project_info, expected', [
+    ({'name': 'flask-api', 'description': 'A REST api server', 'language': 'Python'}, 'web'),
+    ({'name': 'space shooter', 'description': 'A 2d game built with pygame', 'language': 'Python'}, 'game'),
+    ({'name': 'dashboard', 'description': 'react frontend with charts', 'language': 'JavaScript'}, 'web'),
+    ({'name': 'notes', 'description': '', 'language': 'Rust'}, None),
+    ({'name': '', 'description': '', 'language': ''}, None),
+    # Ties go to the category defined first
+    ({'name': 'game web', 'description': '', 'language': ''}, 'web'),
+])
+def test_suggest_category(tag_manager, project_info, expected):
+    """The category with the most keyword matches is suggested."""
+    assert tag_manager.suggest_category_for_project(project_info) == expected
+
+
+def test_suggest_custom_category(tag_manager):
+    """Custom categories take part in suggestions until they are removed."""
+    project_info = {'name': 'notes', 'description': '', 'language': 'rust'}
+    tag_manager.add_custom_category('homelab', 'Homelab', 'Self hosted services', ['homelab', 'rust'])
+    assert tag_manager.suggest_category_for_project(project_info) == 'homelab'
+    
+    tag_manager.remove_custom_category('homelab')
+    assert tag_manager.suggest_category_for_project(project_info) is None